@@ -60,8 +60,10 @@ $$ LANGUAGE plpgsql;
 """
 
 class HEATGraph():
-    def __init__(self, db_name = 'heat', host = 'localhost', port = 5432, user = 'postgres', password = 'postgres') -> None:
+    def __init__(self, db_name = 'heat', host = 'localhost', port = 5432, user = 'postgres', password = 'postgres', plan_capture = None) -> None:
         self.db_name = db_name
+        # 可选的查询计划捕获器(如util.plan_capture.PlanCapture), 处于其phase()之内时execute_sql执行查询前调用其capture(cursor, query)
+        self.plan_capture = plan_capture
         self.__host = host
         self.__port = port
         self.__user = user
@@ -500,6 +502,8 @@ class HEATGraph():
 
         try:
             cursor = self.__conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+            if self.plan_capture is not None and self.plan_capture.active:
+                self.plan_capture.capture(cursor, query)
             cursor.execute(query)
             result = (cursor.description, cursor.fetchall())
         except Exception as e:
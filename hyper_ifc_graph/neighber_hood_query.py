@@ -1,3 +1,5 @@
+import os
+import sys
 import heat_graph as hg
 import json
 import psycopg2 as ps
@@ -113,9 +115,9 @@ def load_fsnb_data(graph, dataset_path):
             edge_num += 1
             user_degree_centrality[follow['follower_id']] = user_degree_centrality.get(follow['follower_id'], 0) + 1
 
-def test_heat(dataset_path, test_name):
-    # 连接数据库
-    graph = hg.HEATGraph(db_name="heat_test", port=5433, user='zzm', password='66668888')
+def test_heat(dataset_path, test_name, plan_capture=None):
+    # 连接数据库, plan_capture(util.plan_capture.PlanCapture)不为None时在计时的查询之后再执行一次并捕获查询计划
+    graph = hg.HEATGraph(db_name="heat_test", port=5433, user='zzm', password='66668888', plan_capture=plan_capture)
 
     # 清理上一次的测试数据
     # delete from public.heat_meta;
@@ -158,6 +160,12 @@ def test_heat(dataset_path, test_name):
         timer.start()
         result2 = graph.execute_cypher(f"""MATCH (p: Comment)-[c: related_to]->(u:User {{"id": "{user_uuid}"}})""", True)
         print(f"heat adj match {percentage}% related_to: {timer.end('ms')} ms, result: {len(result2[1])}")
+        
+        if plan_capture is not None:
+            with plan_capture.phase("HEAT", f"match_{percentage}"):
+                for adj in (False, True):
+                    graph.execute_cypher(f"""MATCH (p: Post)-[c: created_by]->(u:User {{"id": "{user_uuid}"}})""", adj)
+                    graph.execute_cypher(f"""MATCH (p: Comment)-[c: related_to]->(u:User {{"id": "{user_uuid}"}})""", adj)
 
 def age_load_data(conn, graph_name):
     cursor = conn.cursor()
@@ -281,4 +289,12 @@ if __name__ == "__main__":
     sf = 1
     dataset_path = f'datasets/fsnb{sf}'
     test_age(dataset_path, f'age_fsnb{sf}')
-    test_heat(dataset_path, f'heat_fsnb{sf}')
\ No newline at end of file
+    # --capture-plans: 捕获HEAT查询的执行计划, 写入results/plans_<时间>.json
+    plan_capture = None
+    if "--capture-plans" in sys.argv:
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from util.plan_capture import PlanCapture
+        plan_capture = PlanCapture()
+    test_heat(dataset_path, f'heat_fsnb{sf}', plan_capture)
+    if plan_capture is not None:
+        print(f"Query plans written to {plan_capture.dump('results')}")
\ No newline at end of file
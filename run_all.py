@@ -1,72 +1,222 @@
 import os
+import importlib
 import configparser
+from concurrent.futures import ProcessPoolExecutor
 
-from task3_cost_estimation.rawfile_task3_impl import RawfileTask3Impl
-from task3_cost_estimation.postgresql_task3_impl import PGTask3Impl
-from task1_geom_edit.rawfile_task1_impl import RawfileTask1Impl
-from task3_cost_estimation.neo4j_task3_impl import Neo4jTask3Impl
+from util.benchmark import BenchmarkRecorder
+from util.profiler import PhaseProfiler
+from util.plan_capture import PlanCapture, set_plan_capture
+from util.model_cache import get_model_cache
 
 # 读取配置文件
 config = configparser.ConfigParser()
 config.read("config.ini")
+# model_cache_size大于0时各后端共享已解析的IFC模型, 同一个模型在一次测试中只解析一次
+get_model_cache().max_bytes = config.getint('COMMON', 'model_cache_size', fallback=0) * 1024 * 1024
+
+# Task3的模型, 第一个模型用于与RAWFILE基准结果比较, 后端的run_workloads评估全部模型
+task3_workloads = [os.path.join(os.getcwd(), x.strip())
+                   for x in config.get('COMMON', 'task3_workloads', fallback="datasets/task3/workload1.ifc").split(",")]
+
+# 各任务的后端实现, 格式为"模块:类名". 后端模块只在被选中时才导入,
+# 只测试RAWFILE或POSTGRESQL时不会导入neo4j/py2neo等驱动.
+# 带连接参数的后端以config.ini中与其同名的节中的全部选项构造.
+TASK_REGISTRY = {
+    "task1": {
+        "RAWFILE": "task1_geom_edit.rawfile_task1_impl:RawfileTask1Impl",
+    },
+    "task3": {
+        "RAWFILE": "task3_cost_estimation.rawfile_task3_impl:RawfileTask3Impl",
+        "POSTGRESQL": "task3_cost_estimation.postgresql_task3_impl:PGTask3Impl",
+        "NEO4J": "task3_cost_estimation.neo4j_task3_impl:Neo4jTask3Impl",
+    },
+}
 
 class TaskFactory:
-    def get_task1(self, test_class):
-        if test_class == "RAWFILE":
-            return RawfileTask1Impl()
-        else:
+    def _create(self, task, test_class):
+        if test_class not in TASK_REGISTRY[task]:
             raise Exception("No such test class: " + test_class)
+        module_name, class_name = TASK_REGISTRY[task][test_class].split(":")
+        task_class = getattr(importlib.import_module(module_name), class_name)
+        if not config.has_section(test_class):
+            return task_class()
+        # 连接参数(user/password/host/port)及后端自己的选项
+        args = dict(config.items(test_class))
+        return task_class(args)
+
+    def get_task1(self, test_class):
+        return self._create("task1", test_class)
         
     def get_task3(self, test_class):
-        if test_class == "RAWFILE":
-            return RawfileTask3Impl()
-        elif test_class == "POSTGRESQL":
-            user = config.get('POSTGRESQL', 'user')
-            password = config.get('POSTGRESQL', 'password')
-            host = config.get('POSTGRESQL', 'host')
-            port = config.get('POSTGRESQL', 'port')
-            args = {"user": user, "password": password, "host": host, "port": port}
-            return PGTask3Impl(args)
-        elif test_class == "NEO4J":
-            user = config.get('NEO4J', 'user')
-            password = config.get('NEO4J', 'password')
-            host = config.get('NEO4J', 'host')
-            port = config.get('NEO4J', 'port')
-            args = {"user": user, "password": password, "host": host, "port": port}
-            return Neo4jTask3Impl(args)
-        else:
-            raise Exception("No such test class: " + test_class)
+        return self._create("task3", test_class)
+
+def create_profiler(result_dir, started_at):
+    '''
+    根据[BENCHMARK]中的profile开关创建剖析器, 剖析结果写入result_dir下的profile_<时间>目录.
+    '''
+    if config.get('BENCHMARK', 'profile', fallback="False") != "True":
+        return None
+    profile_dir = os.path.join(result_dir, "profile_" + started_at.replace('-', '').replace(':', '').replace('T', '_'))
+    return PhaseProfiler(profile_dir, config.getint('BENCHMARK', 'profile_top_n', fallback=20))
+
+def create_plan_capture():
+    '''
+    根据[BENCHMARK]中的capture_plans开关创建并启用进程内的查询计划捕获器, 未开启时返回None.
+    '''
+    if config.get('BENCHMARK', 'capture_plans', fallback="False") != "True":
+        return None
+    plan_capture = PlanCapture()
+    set_plan_capture(plan_capture)
+    return plan_capture
+
+def get_timings(task, attribute="timings"):
+    '''
+    后端通过timings属性提供数据导入中各步骤的耗时(或通过run_timings属性提供查询的耗时)时, 返回读取该属性的回调函数, 否则返回None.
+    '''
+    if not hasattr(task, attribute):
+        return None
+    return lambda: dict(getattr(task, attribute))
+
+def run_query_variants(recorder, test_class, task, warmup=0, iterations=1):
+    '''
+    后端提供多种查询写法(get_query_variants)时, 依次测试默认写法以外的写法, 耗时记录为task3.run.<写法>, 返回{写法: CostEstimator}.
+    '''
+    results = {}
+    if not hasattr(task, "get_query_variants"):
+        return results
+    variants = task.get_query_variants()
+    for variant in variants[1:]:
+        print(f"Task3 {test_class} running query variant {variant}...")
+        task.set_query_variant(variant)
+        results[variant] = recorder.measure(test_class, f"task3.run.{variant}", task.run, warmup=warmup, iterations=iterations,
+                                            breakdown=get_timings(task, "run_timings"), capture_plans=True)
+    task.set_query_variant(variants[0])
+    return results
+
+def run_workloads(recorder, test_class, task, workloads, warmup=0, iterations=1):
+    '''
+    后端可以评估全部模型(run_workloads)且配置了多个模型时, 记录评估全部模型的耗时为task3.run_workloads, 返回每个模型的CostEstimator.
+    '''
+    if not hasattr(task, "run_workloads") or len(workloads) < 2:
+        return []
+    print(f"Task3 {test_class} running {len(workloads)} workloads...")
+    return recorder.measure(test_class, "task3.run_workloads", task.run_workloads, warmup=warmup, iterations=iterations)
+
+def run_task3_backend(test_class, workloads, warmup=0, iterations=1, prepare_warmup=0, prepare_iterations=1, cleanup=False,
+                      profiler=None, capture_plans=False):
+    '''
+    在当前进程中完成一个后端的Task3数据导入与查询, 返回(CostEstimator, BenchmarkRecorder, {查询写法: CostEstimator}).
+    作为进程池任务执行时, 只有造价结果和耗时样本会被传回主进程. capture_plans为True时在当前进程中捕获查询计划.
+    '''
+    recorder = BenchmarkRecorder(profiler, create_plan_capture() if capture_plans else None)
+    task3 = TaskFactory().get_task3(test_class)
+    print("Task3 " + test_class + " preparing data...")
+    recorder.measure(test_class, "task3.prepare_data", task3.prepare_data, workloads,
+                     warmup=prepare_warmup, iterations=prepare_iterations, reset=task3.cleanup,
+                     breakdown=get_timings(task3))
+    print("Task3 " + test_class + " running...")
+    result = recorder.measure(test_class, "task3.run", task3.run, warmup=warmup, iterations=iterations,
+                              breakdown=get_timings(task3, "run_timings"), capture_plans=True)
+    variant_results = run_query_variants(recorder, test_class, task3, warmup, iterations)
+    run_workloads(recorder, test_class, task3, workloads, warmup, iterations)
+    if cleanup:
+        recorder.measure(test_class, "task3.cleanup", task3.cleanup)
+    recorder.dump_profiles()
+    set_plan_capture(None)
+    return result, recorder, variant_results
+
+def run_ground_truth(workloads):
+    '''
+    用RAWFILE计算第一个模型的基准造价结果. 只导入第一个模型并执行一次run, 不计时, 也不评估其他查询写法和全部模型.
+    '''
+    task3 = TaskFactory().get_task3("RAWFILE")
+    print("Task3 ground true preparing data...")
+    task3.prepare_data(workloads[:1])
+    print("Task3 ground true running...")
+    result = task3.run()
+    task3.cleanup()
+    return result
 
 if "__main__" == __name__:
     task_facotry = TaskFactory()
-    pwd = os.getcwd()
     test_class = config.get('COMMON', 'test')
     
+    # 重复测试参数: 每个阶段先预热warmup次, 再正式执行iterations次
+    warmup = config.getint('BENCHMARK', 'warmup', fallback=0)
+    iterations = config.getint('BENCHMARK', 'iterations', fallback=1)
+    prepare_warmup = config.getint('BENCHMARK', 'prepare_warmup', fallback=0)
+    prepare_iterations = config.getint('BENCHMARK', 'prepare_iterations', fallback=1)
+    result_dir = config.get('BENCHMARK', 'result_dir', fallback="results")
+    recorder = BenchmarkRecorder()
+    recorder.profiler = create_profiler(result_dir, recorder.started_at)
+    capture_plans = config.get('BENCHMARK', 'capture_plans', fallback="False") == "True"
+    
     if config.get('COMMON', 'run_task1') == "True":
         # Task1 Startup
         task1_test = task_facotry.get_task1(test_class)
-        task1_test.prepare_data(None)
-        task1_test.run()
-        task1_test.cleanup()
+        recorder.measure(test_class, "task1.prepare_data", task1_test.prepare_data, None,
+                         warmup=prepare_warmup, iterations=prepare_iterations, reset=task1_test.cleanup)
+        recorder.measure(test_class, "task1.run", task1_test.run, warmup=warmup, iterations=iterations)
+        recorder.measure(test_class, "task1.cleanup", task1_test.cleanup)
     
-    if config.get('COMMON', 'run_task3') == "True":
+    task3_test = None
+    task3_variant_results = {}
+    
+    # 模型文件未修改时直接读取缓存的RAWFILE基准结果, 跳过基准结果的数据导入与造价计算
+    task3_expected = None
+    ground_truth_computed = False
+    ground_truth_cache = None
+    if config.get('COMMON', 'run_task3') == "True" and config.get('COMMON', 'ground_truth_cache', fallback="False") == "True":
+        from task3_cost_estimation.ground_truth_cache import GroundTruthCache
+        ground_truth_cache = GroundTruthCache(os.path.join(result_dir, "ground_truth"))
+        task3_expected = ground_truth_cache.get(task3_workloads[0])
+        if task3_expected is not None:
+            print("Task3 ground true loaded from cache.")
+    
+    if config.get('COMMON', 'run_task3') == "True" and config.get('COMMON', 'parallel_ground_truth', fallback="False") == "True":
+        # Task3 Startup: 被测后端与RAWFILE基准结果互不依赖, 在两个进程中同时导入和查询, 最后只比较造价结果
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            test_future = pool.submit(run_task3_backend, test_class, task3_workloads, warmup, iterations,
+                                      prepare_warmup, prepare_iterations, True, create_profiler(result_dir, recorder.started_at),
+                                      capture_plans)
+            if task3_expected is None:
+                ground_true_future = pool.submit(run_ground_truth, task3_workloads)
+            task3_result, task3_recorder, task3_variant_results = test_future.result()
+            if task3_expected is None:
+                task3_expected = ground_true_future.result()
+                ground_truth_computed = True
+        recorder.merge(task3_recorder)
+    elif config.get('COMMON', 'run_task3') == "True":
         # Task3 Startup
-        task3_workloads = ["datasets/task3/workload1.ifc"]
-        # task3_workloads = ["datasets/sample.ifc"]
-        for i in range(len(task3_workloads)):
-            task3_workloads[i] = os.path.join(pwd, task3_workloads[i])
+        recorder.plan_capture = create_plan_capture()
         task3_test = task_facotry.get_task3(test_class)
         print("Task3 test class: " + test_class + " preparing data...")
-        task3_test.prepare_data(task3_workloads)
-        print("Task3 ground true preparing data...")
-        task3_ground_true = task_facotry.get_task3("RAWFILE")
-        task3_ground_true.prepare_data(task3_workloads)
+        recorder.measure(test_class, "task3.prepare_data", task3_test.prepare_data, task3_workloads,
+                         warmup=prepare_warmup, iterations=prepare_iterations, reset=task3_test.cleanup,
+                         breakdown=get_timings(task3_test))
+        if task3_expected is None:
+            print("Task3 ground true preparing data...")
+            task3_ground_true = task_facotry.get_task3("RAWFILE")
+            task3_ground_true.prepare_data(task3_workloads[:1])
         
         # Task3 Job1
         print("Task3 test class: " + test_class + " running...")
-        task3_result = task3_test.run()
-        print("Task3 ground true running...")
-        task3_expected = task3_ground_true.run()
+        task3_result = recorder.measure(test_class, "task3.run", task3_test.run, warmup=warmup, iterations=iterations,
+                                        breakdown=get_timings(task3_test, "run_timings"), capture_plans=True)
+        task3_variant_results = run_query_variants(recorder, test_class, task3_test, warmup, iterations)
+        run_workloads(recorder, test_class, task3_test, task3_workloads, warmup, iterations)
+        if task3_expected is None:
+            print("Task3 ground true running...")
+            task3_expected = task3_ground_true.run()
+            ground_truth_computed = True
+        
+        # Task3 Cleanup: 被测后端的数据在Task5之后清理
+        if ground_truth_computed:
+            task3_ground_true.cleanup()
+    
+    if config.get('COMMON', 'run_task3') == "True":
+        if ground_truth_cache is not None and ground_truth_computed:
+            ground_truth_cache.put(task3_workloads[0], task3_expected)
         if task3_result == task3_expected:
             print("Task3 all query passed.")
         else:
@@ -75,7 +225,42 @@ if "__main__" == __name__:
             print(task3_expected)
             print("Actual:")
             print(task3_result)
-        
-        # Task3 Cleanup
-        # task3_test.cleanup()
-        task3_ground_true.cleanup()
\ No newline at end of file
+        for variant, variant_result in task3_variant_results.items():
+            if variant_result == task3_expected:
+                print(f"Task3 query variant {variant} passed.")
+            else:
+                print(f"Task3 query variant {variant} failed.")
+                print(variant_result)
+    
+    # 查询计划只在Task3中捕获, EXPLAIN ANALYZE会重复执行查询, 不能计入Task5的吞吐量
+    set_plan_capture(None)
+    if config.get('COMMON', 'run_task5', fallback="False") == "True":
+        # Task5 Startup: 并发执行Task3 workload1中的查询, 测试不同负载下的吞吐量与延迟
+        task5_backend = task3_test
+        if task5_backend is None:
+            task5_backend = task_facotry.get_task3(test_class)
+            task5_backend.prepare_data(task3_workloads)
+        from task5_performance.load_generator import LoadGenerator, dump_curve
+        concurrency_levels = [int(x) for x in config.get('TASK5', 'concurrency_levels', fallback="1").split(",")]
+        duration = config.getfloat('TASK5', 'duration', fallback=10)
+        rate = config.getfloat('TASK5', 'rate', fallback=0)
+        executor = config.get('TASK5', 'executor', fallback="thread")
+        load_generator = LoadGenerator(task5_backend, executor=executor)
+        curve = load_generator.run(concurrency_levels, duration, rate if rate > 0 else None)
+        result_path = dump_curve(result_dir, curve, {"test_class": test_class, "executor": executor})
+        print(f"Task5 throughput/latency curve written to {result_path}")
+        if task3_test is None:
+            task5_backend.cleanup()
+    
+    if task3_test is not None:
+        recorder.measure(test_class, "task3.cleanup", task3_test.cleanup)
+    
+    model_cache = get_model_cache()
+    print(f"Model cache: {model_cache.hits} hits, {model_cache.misses} misses")
+    recorder.print_summary()
+    result_path = recorder.dump(result_dir, {"test_class": test_class, "warmup": warmup, "iterations": iterations,
+                                             "prepare_warmup": prepare_warmup, "prepare_iterations": prepare_iterations,
+                                             "profile": config.get('BENCHMARK', 'profile', fallback="False") == "True",
+                                             "capture_plans": capture_plans,
+                                             "model_cache_size": config.getint('COMMON', 'model_cache_size', fallback=0)})
+    print(f"Benchmark results written to {result_path}")
@@ -1,123 +1,180 @@
 import re
 import os
+import sys
 import ifcopenshell
 
+# IFC属性类型(ifcopenshell中entity.attribute_type的返回值) -> Postgresql中的类型
+ATTR_TYPE_MAP = {
+    "INT": "INTEGER",
+    "DOUBLE": "DOUBLE PRECISION",
+    "BOOL": "BOOLEAN",
+    "LOGICAL": "VARCHAR(10)",
+    "STRING": "VARCHAR(150)",
+    "ENUMERATION": "VARCHAR(150)",
+    "ENTITY INSTANCE": "INTEGER",
+    "AGGREGATE OF ENTITY INSTANCE": "INTEGER[]",
+    "AGGREGATE OF DOUBLE": "DOUBLE PRECISION[]",
+    "AGGREGATE OF INT": "INTEGER[]",
+    "AGGREGATE OF STRING": "text[]",
+}
+
+# IfcPropertySingleValue.NominalValue可以是任意带类型的值(IfcValue), 对应多列: 被包装值的字符串形式(与str(wrappedValue)一致),
+# 带类型的值的IFC类型名(如IfcAreaMeasure), 数值型的值和布尔型的值. 不是数值/布尔值时后两列为NULL, 查询时不需要逐行CAST
+NOMINAL_VALUE_COLUMNS = [
+    ("NominalValue", "TEXT"),
+    ("NominalValueType", "VARCHAR(150)"),
+    ("NominalValueNum", "DOUBLE PRECISION"),
+    ("NominalValueBool", "BOOLEAN"),
+]
+
+
+def get_column_type(entity, i):
+    '''
+    返回实体第i个属性对应的列类型, DERIVED属性没有对应的列, 返回None.
+    '''
+    attr_name = entity.attribute_name(i)
+    attr_type = entity.attribute_type(i)
+
+    if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
+        # Special case: IfcPropertySingleValue中的NominalValue字段可以是任意类型，因此直接看作TEXT, 其余各列见NOMINAL_VALUE_COLUMNS
+        return "TEXT"
+    elif(attr_type in ATTR_TYPE_MAP):
+        return ATTR_TYPE_MAP[attr_type]
+    elif attr_type == "DERIVED":
+        return None
+    else:
+        raise Exception(f"Unknown attribute type: {attr_type}, when creating table for {attr_name} in {entity}. info: {entity.get_info()}")
+
+
+def get_attribute_columns(entity, i):
+    '''
+    返回实体第i个属性对应的列[(列名, 列类型), ...]: 一般属性对应一列, IfcPropertySingleValue.NominalValue对应NOMINAL_VALUE_COLUMNS.
+    '''
+    column_type = get_column_type(entity, i)
+    if column_type is None:
+        return []
+    if entity.is_a("ifcpropertysinglevalue") and entity.attribute_name(i) == "NominalValue":
+        return NOMINAL_VALUE_COLUMNS
+    return [(entity.attribute_name(i), column_type)]
+
+
+def get_create_table_sql(entity, primary_key=True):
+    '''
+    根据实体实例生成创建实体表的SQL语句, 表名为实体类型名, 每个非DERIVED属性对应一列.
+    PGTask3Impl导入数据时创建的表与预先编译的表结构都由这个函数生成, 因此两者完全一致.
+    primary_key为False时id列不带主键约束, 用于先导入数据再建索引.
+    '''
+    id_column = "id INTEGER PRIMARY KEY" if primary_key else "id INTEGER"
+    create_table_sql = f"CREATE TABLE IF NOT EXISTS {entity.is_a()} ({id_column}, "  # 创建表的SQL语句
+
+    for i in range(len(entity)):
+        for column_name, column_type in get_attribute_columns(entity, i):
+            create_table_sql += f"\"{column_name}\" {column_type}," # 列名需要加引号，因为有些列名是SQL关键字(如: Outer)
+    create_table_sql = create_table_sql.rstrip(", ") + ");"  # 去掉最后一个逗号, 没有属性的实体(如IfcLoop)只有id列
+
+    return create_table_sql
+
+
+def get_inherited_create_table_sqls(entity, primary_key=True):
+    '''
+    按IFC的继承关系建表: 返回[(实体类型, 建表SQL), ...], 依次为从根超类型(如IfcRoot)到entity自身的各级表.
+    子表通过INHERITS继承父表的全部列, 只声明自身新增的属性, 因此查询父表(如ifcwall)时会同时扫描所有子类型的表.
+    主键约束不会被继承, 每个表单独声明主键.
+    '''
+    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(entity.is_a(True).split(".")[0])
+    declarations = []
+    declaration = schema.declaration_by_name(entity.is_a())
+    while declaration is not None:
+        declarations.insert(0, declaration)
+        declaration = declaration.supertype()
+
+    # 属性类型需要从实体实例中获取, 因此为每一级超类型创建一个空实例
+    ifc_file = ifcopenshell.file(schema=schema.name())
+    create_table_sqls = []
+    parent = None
+    for declaration in declarations:
+        instance = ifc_file.create_entity(declaration.name())
+        columns = ["id INTEGER PRIMARY KEY" if primary_key else "id INTEGER"] if parent is None else []
+        for i in range(len(parent.all_attributes()) if parent is not None else 0, len(instance)):
+            for column_name, column_type in get_attribute_columns(instance, i):
+                columns.append(f"\"{column_name}\" {column_type}")
+        if parent is None:
+            create_table_sql = f"CREATE TABLE IF NOT EXISTS {declaration.name()} ({', '.join(columns)});"
+        else:
+            if primary_key:
+                columns.append("PRIMARY KEY (id)")
+            create_table_sql = f"CREATE TABLE IF NOT EXISTS {declaration.name()} ({', '.join(columns)}) INHERITS ({parent.name()});"
+        create_table_sqls.append((declaration.name(), create_table_sql))
+        parent = declaration
+    return create_table_sqls
+
+
+def get_create_table_sqls(entity, primary_key=True, inheritance=False):
+    '''
+    返回导入entity之前需要创建的表[(实体类型, 建表SQL), ...]. inheritance为True时按继承关系建表, 见get_inherited_create_table_sqls.
+    '''
+    if inheritance:
+        return get_inherited_create_table_sqls(entity, primary_key)
+    return [(entity.is_a(), get_create_table_sql(entity, primary_key))]
+
+
+def get_compiled_schema_path(schema_version):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), f"create_table_{schema_version}.sql")
+
+
+def get_compiled_table_names(create_table_sql):
+    '''
+    返回编译好的建表语句中所有表的名称.
+    '''
+    return re.findall(r"CREATE TABLE IF NOT EXISTS (\w+) ", create_table_sql)
+
+
+def remove_primary_keys(create_table_sql):
+    '''
+    去掉编译好的建表语句中id列的主键约束.
+    '''
+    return create_table_sql.replace("(id INTEGER PRIMARY KEY", "(id INTEGER")
+
+
 class PostbimCompilor:
     def __init__(self) -> None:
         pass
-    
-    def __get_create_table_sql(self, entity):
-        pattern = re.compile(r'<bound method declaration.name of <entity (.*)>>')
-        match = pattern.search(str(entity.name))
-        entity_name = match.group(1)
-        
+
+    def __get_create_table_sql(self, ifc_file, entity):
+        entity_name = entity.name()
+
         if entity.is_abstract():
             # print(f"Skipped abstract class: {entity_name}")
             return ""
-        elif entity.as_enumeration_type():
-            print(f"Skipped enumeration type: {entity_name}")
-            exit(0)
-            return ""
 
-        create_table_sql = f"CREATE TABLE IF NOT EXISTS {entity_name} (id INTEGER PRIMARY KEY, "  # 创建表的SQL语句
-        
-        attributes = entity.all_attributes()    # TODO: 获取包含父类的所有属性
-        for attr in attributes:
-            print("-----")
-            print(attr)
-            ifc_named_type = attr.type_of_attribute()
-            print(ifc_named_type)
-            continue
-            # 得到的字段类型以如下形式表示:
-            # <attribute (.*): <(type|enumeration|entity|list|select|set|array) (.*)(: <(.*)>)?>>
-            # ...<attribute ObjectType?: <type IfcLabel: <string>>>>
-            # <attribute ImpliedOrder: <logical>>
-            # <attribute OffsetValues: <array [1:2] of <type IfcLengthMeasure: <real>>>>
-            # TODO: 需要更好的办法解析这东西
-            attr_pattern = re.compile(r'<attribute (.*): <(type|enumeration|entity|select|list|set|array) (.*)(: <(.*)>)?>>')
-            match = attr_pattern.search(str(attr))
-            sql_type = ""
-            
-            if not match:
-                # TODO: fix this
-                attr_name = "Unknown"
-                sql_type = "TEXT"
-            else:
-                # 将IFC中的类型转换为Postgresql中的类型
-                attr_name = match.group(1)
-                attr_type = match.group(2)
-                type_name = match.group(3)      # 属性类型在IFC中的名称
-                type_type = match.group(5)      # 属性类型在宿主语言中的类型
-                attr_type_map = {
-                    "integer": "INTEGER",
-                    "real": "DOUBLE PRECISION",
-                    "boolean": "BOOLEAN",
-                    "logical": "VARCHAR(10)",
-                    "string": "TEXT",
-                }
-                if entity_name == "ifcpropertysinglevalue" and attr_name == "NominalValue": # Special case:  IfcPropertySingleValue中的NominalValue字段可以是任意类型，因此直接看作TEXT
-                    sql_type = "TEXT"
-                elif attr_type == "enumeration":
-                    sql_type = attr_name   # TODO: 为枚举类型生成创建枚举类型的SQL语句
-                    # print(f"Enumeration type: {attr_name}")
-                    sql_type = "TEXT"
-                elif attr_type == "entity":     # 直接引用(实例ID)将存储为整数
-                    sql_type = "INTEGER"
-                    # TODO: sql_type += " REFERENCES " + type_name + "(id)"
-                elif attr_type == "list":     # 选择类型
-                    # TODO: 创建合适的列表类型，注意可能是一个二维列表, 或者是一个引用类型的列表
-                    sql_type = "TEXT"
-                elif attr_type == "set":     # 选择类型
-                    # TODO: 创建合适的列表类型，注意可能是一个二维列表, 或者是一个引用类型的列表
-                    sql_type = "TEXT"
-                    pass
-                elif attr_type == "select":     # 选择类型
-                    # TODO: 在postgresql中如何模拟SELECT类型
-                    sql_type = "TEXT"
-                    pass
-                elif attr_type == "type" and (type_type in attr_type_map):
-                    sql_type = attr_type_map[type_type]
-                else:
-                    # print(f"Unknown attribute type: \033[33m{attr_type}\033[0m of type_type: \033[33m{type_type}\033[0m, when creating table for \033[33m{attr_name}\033[0m in \033[33m{entity_name}\033[0m.")
-                    sql_type = "TEXT"
-                
-                # 如果字段名不是以问号结尾, 则说明该字段是必填字段
-                if not attr_name.endswith("?"):
-                    # 如果是, 则在字段类型后面加上NOT NULL
-                    sql_type += " NOT NULL"
-                else:
-                    # 否则去掉字段名后面的问号
-                    attr_name = attr_name[:-1]
-            create_table_sql += f"\"{attr_name}\" {sql_type}," # 列名需要加引号，因为有些列名是SQL关键字(如: Outer)
-        create_table_sql = create_table_sql[:-1] + ");"
-        
-        return create_table_sql
+        # 属性类型需要从实体实例中获取, 因此为每个实体类型创建一个空实例
+        return get_create_table_sql(ifc_file.create_entity(entity_name))
 
     def generate_sql_from_schema(self, schema_version):
         """
-        生成在数据库中创建实体表的SQL函数
+        生成在数据库中创建实体表的SQL语句, 写入本目录下的create_table_<schema_version>.sql
         ifcopenshell.express.parse有double free bug
-        """            
+        """
         w = ifcopenshell.ifcopenshell_wrapper
         s = w.schema_by_name(schema_version)
-        # print(s.entities()[0].all_attributes())
+        ifc_file = ifcopenshell.file(schema=schema_version)
         entities = s.entities()
         create_sql = []
         failed_classes = []
-        result_path = f"create_table_{schema_version}.sql"
+        result_path = get_compiled_schema_path(schema_version)
         if os.path.exists(result_path):
             os.remove(result_path)
         with open(result_path, 'a') as r:
             for entity in entities:
                 try:
-                    sql_stmt = self.__get_create_table_sql(entity)
+                    sql_stmt = self.__get_create_table_sql(ifc_file, entity)
                     if sql_stmt == "":
                         continue
                     create_sql.append(sql_stmt)
                     r.write(sql_stmt + '\n')
                 except Exception as e:
-                    failed_classes.append(entity.name)
-                    print(f"\033[31mERROR\033[0m when compiling \033[33m{entity.name}\033[0m")
+                    failed_classes.append(entity.name())
+                    print(f"\033[31mERROR\033[0m when compiling \033[33m{entity.name()}\033[0m")
                     print(e)
             print(f"Successfully compiled \033[32m{len(create_sql)}\033[0m entities.")
             print(f"Failed to compile \033[31m{len(failed_classes)}\033[0m entities.")
@@ -125,4 +182,4 @@ class PostbimCompilor:
 
 if __name__ == '__main__':
     comp = PostbimCompilor()
-    comp.generate_sql_from_schema("IFC4")
+    comp.generate_sql_from_schema(sys.argv[1] if len(sys.argv) > 1 else "IFC4")
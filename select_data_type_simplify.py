@@ -2,10 +2,13 @@ import os
 import psycopg2
 import json
 import logging
+import configparser
 import numpy as np
 
 from util.common import Timer
 import util.common as util
+from util.pg_pool import get_connection_manager
+import util.plan_capture as plan_capture
 
 database_name = 'micro_benchmark'
 json_table_name = 'json_comp_json'
@@ -34,21 +37,15 @@ class JsonComp:
         return json.dumps({f"{data_type}": value})
     
     def _connect_to_db(self, user, password, host, port, database_name):
-        try:
-            conn = psycopg2.connect(database="postgres", user=user, password=password, host=host, port=port)
-            conn.autocommit = True
-            cur = conn.cursor()
-            cur.execute(f"CREATE DATABASE {database_name}")
-        except psycopg2.errors.DuplicateDatabase:
-            pass
-        except Exception as e:
-            raise e
-        finally:
-            conn.close()
-            cur.close()
-        conn = psycopg2.connect(database=database_name, user=user, password=password, host=host, port=port)
+        # 从共享的连接池中取出连接(数据库不存在时先创建), 计时中不包含建立连接的时间
+        conn = get_connection_manager(user, password, host, port).getconn(database_name)
+        # 开启查询计划捕获时, 捕获阶段中的每条查询先执行一次EXPLAIN ANALYZE
+        conn.cursor_factory = plan_capture.get_capturing_cursor() if plan_capture.get_plan_capture() is not None else None
         self._database_name.add(database_name)
         return conn
+
+    def _release_conn(self, conn):
+        get_connection_manager(self._user, self._password, self._host, self._port).putconn(conn)
     
     # 创建新表，如果已存在则清空已有记录
     def _create_table(self, conn, table_name, create_table_query):
@@ -105,7 +102,7 @@ class JsonComp:
             print(e)
         finally:
             cursor.close()
-            conn.close()
+            self._release_conn(conn)
 
     @Timer.eclapse
     def prepare_json(self, record_num, data_type='integer'):
@@ -131,7 +128,7 @@ class JsonComp:
             print(e)
         finally:
             cursor.close()
-            conn.close()
+            self._release_conn(conn)
             
     @Timer.eclapse
     def prepare_raw(self, record_num, data_type='integer'):
@@ -153,6 +150,8 @@ class JsonComp:
                 command = f"INSERT INTO {raw_table_name} (data) VALUES ('Basic Wall:Interior - Partition (92mm Stud):204300')"
             self._execute_query(conn, cursor, command, False)
         conn.commit()
+        cursor.close()
+        self._release_conn(conn)
         
     @Timer.eclapse
     def point_query_on_json(self, data_type, query_point):
@@ -167,7 +166,7 @@ class JsonComp:
         rows = cursor.fetchall()
         # print(f"Query {len(rows)} records from {table_name}")
         cursor.close()
-        conn.close()
+        self._release_conn(conn)
         
     @Timer.eclapse
     def point_query_on_jsonb(self, data_type, query_point):
@@ -182,7 +181,7 @@ class JsonComp:
         rows = cursor.fetchall()
         # print(f"Query {len(rows)} records from {table_name}")
         cursor.close()
-        conn.close()
+        self._release_conn(conn)
     
     @Timer.eclapse
     def point_query_on_raw(self, data_type, query_point):
@@ -202,7 +201,7 @@ class JsonComp:
             logger.error(e)
         finally:
             cursor.close()
-            conn.close()
+            self._release_conn(conn)
     
     @Timer.eclapse
     def range_query_on_json(self, data_type, record_num, range_start, range_end):
@@ -220,7 +219,7 @@ class JsonComp:
             logger.error(e)
         finally:
             cursor.close()
-            conn.close()
+            self._release_conn(conn)
     
     @Timer.eclapse
     def range_query_on_jsonb(self, data_type, record_num, range_start, range_end):
@@ -238,7 +237,7 @@ class JsonComp:
             logger.error(e)
         finally:
             cursor.close()
-            conn.close()
+            self._release_conn(conn)
     
     @Timer.eclapse
     def range_query_on_raw(self, data_type, record_num, range_start, range_end):
@@ -257,7 +256,7 @@ class JsonComp:
             logger.error(e)
         finally:
             cursor.close()
-            conn.close()
+            self._release_conn(conn)
         
     @Timer.eclapse
     def aggregate_query_on_json(self, data_type):
@@ -275,6 +274,7 @@ class JsonComp:
         self._execute_query(conn, cursor, query, True)
         rows = cursor.fetchall()
         cursor.close()
+        self._release_conn(conn)
         
     @Timer.eclapse
     def aggregate_query_on_jsonb(self, data_type):
@@ -292,6 +292,7 @@ class JsonComp:
         self._execute_query(conn, cursor, query, True)
         rows = cursor.fetchall()
         cursor.close()
+        self._release_conn(conn)
         
     @Timer.eclapse
     def aggregate_query_on_raw(self, data_type):
@@ -307,8 +308,7 @@ class JsonComp:
         self._execute_query(conn, cursor, query, True)
         rows = cursor.fetchall()
         cursor.close()
-        conn.close()
-        conn.close()
+        self._release_conn(conn)
     
     def cleanup(self):
         conn = self._connect_to_db(self._user, self._password, self._host, self._port, database_name)
@@ -318,13 +318,20 @@ class JsonComp:
         cursor.execute(f"DROP TABLE json_comp_jsonb")
         cursor.execute(f"DROP TABLE raw_base_type")
         cursor.close()
-        conn.close()
+        self._release_conn(conn)
         pass
     
     
 if __name__ == '__main__': 
     json_comp = JsonComp()
     
+    # config.ini中[BENCHMARK]的capture_plans为True时捕获每条查询的执行计划
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+    plan_capture_enabled = config.get('BENCHMARK', 'capture_plans', fallback="False") == "True"
+    if plan_capture_enabled:
+        plan_capture.set_plan_capture(plan_capture.PlanCapture())
+    
     # 测试数据范围
     record_size = []
     start_record_size = 1000
@@ -347,25 +354,36 @@ if __name__ == '__main__':
             json_comp.prepare_json(record_num, data_type)
             json_comp.prepare_raw(record_num, data_type)
             
-            # 范围插叙测试
-            for ratio in selectity:
-                range_start = 1
-                range_end = int(record_num * ratio)
-                json_comp.range_query_on_jsonb(data_type, record_num, range_start, range_end)
-                json_comp.range_query_on_json(data_type, record_num, range_start, range_end)
-                json_comp.range_query_on_raw(data_type, record_num, range_start, range_end)
+            def run_queries():
+                # 范围插叙测试
+                for ratio in selectity:
+                    range_start = 1
+                    range_end = int(record_num * ratio)
+                    json_comp.range_query_on_jsonb(data_type, record_num, range_start, range_end)
+                    json_comp.range_query_on_json(data_type, record_num, range_start, range_end)
+                    json_comp.range_query_on_raw(data_type, record_num, range_start, range_end)
+                
+                # 聚合查询测试
+                json_comp.aggregate_query_on_jsonb(data_type)
+                json_comp.aggregate_query_on_json(data_type)
+                json_comp.aggregate_query_on_raw(data_type)
+                
+                # TODO: 或许可以先建索引再查
+                # 点查测试
+                json_comp.point_query_on_jsonb(data_type, 1)
+                json_comp.point_query_on_json(data_type, 1)
+                json_comp.point_query_on_raw(data_type, 1)
             
-            # 聚合查询测试
-            json_comp.aggregate_query_on_jsonb(data_type)
-            json_comp.aggregate_query_on_json(data_type)
-            json_comp.aggregate_query_on_raw(data_type)
-            
-            # TODO: 或许可以先建索引再查
-            # 点查测试
-            json_comp.point_query_on_jsonb(data_type, 1)
-            json_comp.point_query_on_json(data_type, 1)
-            json_comp.point_query_on_raw(data_type, 1)
+            run_queries()
+            if plan_capture_enabled:
+                # 计时的查询结束后再执行一次并捕获查询计划, EXPLAIN ANALYZE不影响上面打印的耗时
+                with plan_capture.get_plan_capture().phase("JSONCOMP", f"{data_type}.{record_num}"):
+                    run_queries()
             
             print(f"Record number: {record_num}, Data type: {data_type}")
             print("----------------------------------------------------")
-        json_comp.cleanup()
\ No newline at end of file
+        json_comp.cleanup()
+    
+    if plan_capture_enabled:
+        result_path = plan_capture.get_plan_capture().dump(config.get('BENCHMARK', 'result_dir', fallback="results"))
+        print(f"Query plans written to {result_path}")
\ No newline at end of file
@@ -39,7 +39,9 @@ class IfcImporter:
             attr_type = entity.attribute_type(i)
             
             if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
-                attr_type = "TEXT"
+                # NominalValue: 被包装值的字符串形式, 以及被包装值的IFC类型、数值和布尔值
+                create_table_sql += '"NominalValue" TEXT,"NominalValueType" VARCHAR(150),"NominalValueNum" DOUBLE PRECISION,"NominalValueBool" BOOLEAN,'
+                continue
             elif(attr_type in attr_type_map):
                 attr_type = attr_type_map[attr_type]
             elif attr_type == "DERIVED":
@@ -61,7 +63,15 @@ class IfcImporter:
             attr_value = attr_info[entity.attribute_name(i)]
             
             if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
-                insert_sql += f"""'{str(attr_value.get_info()['wrappedValue']).replace("'", "''")}',"""
+                if attr_value is None:
+                    insert_sql += "NULL,NULL,NULL,NULL,"
+                    continue
+                wrapped = attr_value.wrappedValue
+                number = wrapped if isinstance(wrapped, (int, float)) and not isinstance(wrapped, bool) else None
+                flag = wrapped if isinstance(wrapped, bool) else None
+                insert_sql += f"""'{str(wrapped).replace("'", "''")}','{attr_value.is_a()}',"""
+                insert_sql += "NULL," if number is None else f"'{number}',"
+                insert_sql += "NULL," if flag is None else f"{flag},"
                 continue
                     
             if attr_type == "DERIVED":
@@ -2,13 +2,13 @@ CREATE SEQUENCE ifc_instance_id_seq START 1;
 
 -- Function: 从数据库中获取实体在属性集中的值
 -- Input: entity_name, pset_name, property_name, condition
--- Output: eid, value_result
-CREATE OR REPLACE FUNCTION get_pset_value(entity_name text, pset_name text, property_name text, condition text) RETURNS TABLE(eid INTEGER, value_result text) AS $$
+-- Output: eid, value_result(NominalValue), value_num(NominalValueNum), value_bool(NominalValueBool)
+CREATE OR REPLACE FUNCTION get_pset_value(entity_name text, pset_name text, property_name text, condition text) RETURNS TABLE(eid INTEGER, value_result text, value_num DOUBLE PRECISION, value_bool BOOLEAN) AS $$
 DECLARE
     sql text;
 BEGIN
     sql := format('
-    SELECT r1.eid as eid, ifcpropertysinglevalue."NominalValue" AS value_result
+    SELECT r1.eid as eid, ifcpropertysinglevalue."NominalValue" AS value_result, ifcpropertysinglevalue."NominalValueNum" AS value_num, ifcpropertysinglevalue."NominalValueBool" AS value_bool
     FROM (
         SELECT %s.id as eid, UNNEST(ifcpropertyset."HasProperties") as HasProperties
         -- 获取实体
@@ -9,7 +9,8 @@ from util.common import Timer
 from task1_geom_edit.task1 import *
 
 class RawfileTask1Impl:
-    def __init__(self):
+    def __init__(self, args=None):
+        # args为config.ini中[RAWFILE]节的选项(由Task3使用), Task1不需要任何选项
         self.models = []
     
     def prepare_data(self, workloads):
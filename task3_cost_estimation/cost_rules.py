@@ -0,0 +1,208 @@
+import math
+import ifcopenshell
+import ifcopenshell.ifcopenshell_wrapper
+
+from task3_cost_estimation.task3 import CostEstimator
+
+
+def get_subtype_names(schema_version, ifc_class):
+    '''
+    返回ifc_class及其全部子类型的实体类型名, 与ifc_file.by_type(ifc_class)包含的实体类型相同.
+    '''
+    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema_version)
+    names = []
+    queue = [schema.declaration_by_name(ifc_class)]
+    while queue:
+        declaration = queue.pop()
+        names.append(declaration.name())
+        queue.extend(declaration.subtypes())
+    return names
+
+
+def _sql_literal(value):
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sql_in(values):
+    return "(" + ", ".join(_sql_literal(value) for value in values) + ")"
+
+
+def _get_value_column(value):
+    '''
+    属性值在entity_property表中对应的列.
+    '''
+    if isinstance(value, bool):
+        return "value_bool"
+    if isinstance(value, (int, float)):
+        return "value_num"
+    return "value_text"
+
+
+class CostRule:
+    '''
+    一个度量的声明式定义: 对entity_classes(包括子类型)中满足全部filters的实体, 累加quantity指定的属性值, 结果以unit为单位.
+
+    metric: CostEstimator中的度量名, 如"total_slab_area". 内置度量之外的度量名也可以使用, 其值只保存在CostEstimator中, 不计入造价项
+    entity_classes: 实体类型名的列表
+    quantity: (属性集名, 属性名), 缺少该属性的实体不计入. quantity和filters都应是单值属性(IfcPropertySingleValue),
+        entity_property表只包含单值属性, 这样evaluate和to_sql的结果才相同
+    filters: [(属性集名, 属性名, 运算符, 值), ...], 运算符为"="(属性值等于给定值)或"!="(属性值不等于给定值, 包括缺少该属性).
+        例如("Pset_WallCommon", "IsExternal", "!=", True)选择缺少IsExternal的墙, 与各个Postgresql查询写法中的IS NOT TRUE相同
+    storey: 只统计该名称的楼层直接或间接包含的实体(见build_containment_index), None表示不限制楼层
+    '''
+    def __init__(self, metric, entity_classes, quantity, unit="m^2", filters=(), storey=None):
+        for _, _, op, _ in filters:
+            if op not in ("=", "!="):
+                raise ValueError(f"Unsupported filter operator: {op}")
+        self.metric = metric
+        self.entity_classes = list(entity_classes)
+        self.quantity = quantity
+        self.unit = unit
+        self.filters = list(filters)
+        self.storey = storey
+
+    def matches(self, psets):
+        for pset_name, prop_name, op, expected in self.filters:
+            value = psets.get(pset_name, {}).get(prop_name)
+            if (value == expected) != (op == "="):
+                return False
+        return True
+
+
+class CostRuleEngine:
+    '''
+    把一组CostRule编译为按实体类型分派的规则表, 一次遍历属性索引(build_pset_index)同时计算全部度量.
+    同样的规则也可以生成一条在entity_property和spatial_containment表上执行的SQL语句, 供Postgresql后端使用.
+    '''
+    def __init__(self, rules):
+        metrics = [rule.metric for rule in rules]
+        if len(set(metrics)) != len(metrics):
+            raise ValueError("Each metric can only be defined by one rule")
+        self.rules = list(rules)
+        self._dispatch = {}  # schema版本 -> {实体类型名: [规则序号, ...]}
+
+    def has_storey_scope(self):
+        return any(rule.storey is not None for rule in self.rules)
+
+    def _get_dispatch(self, schema_version):
+        if schema_version not in self._dispatch:
+            dispatch = {}
+            for i, rule in enumerate(self.rules):
+                for ifc_class in rule.entity_classes:
+                    for name in get_subtype_names(schema_version, ifc_class):
+                        if i not in dispatch.setdefault(name, []):
+                            dispatch[name].append(i)
+            self._dispatch[schema_version] = dispatch
+        return self._dispatch[schema_version]
+
+    def evaluate(self, ifc_file, pset_index, containment_index=None):
+        '''
+        一次遍历属性索引中的实体, 返回{度量名: 属性值之和}. 有楼层限制的规则需要containment_index(见build_containment_index).
+        '''
+        dispatch = self._get_dispatch(ifc_file.schema)
+        storey_elements = {}  # 楼层名 -> 该名称的全部楼层包含的实体id
+        for rule in self.rules:
+            if rule.storey is not None and rule.storey not in storey_elements:
+                storey_elements[rule.storey] = {element_id for storey in ifc_file.by_type("IfcBuildingStorey") if storey.Name == rule.storey
+                                                for element_ids in containment_index[storey.id()].values() for element_id in element_ids}
+
+        values = [[] for _ in self.rules]
+        for element_id, psets in pset_index.items():
+            rule_ids = dispatch.get(ifc_file.by_id(element_id).is_a())
+            if rule_ids is None:
+                continue
+            for i in rule_ids:
+                rule = self.rules[i]
+                if rule.storey is not None and element_id not in storey_elements[rule.storey]:
+                    continue
+                if rule.matches(psets):
+                    value = psets.get(rule.quantity[0], {}).get(rule.quantity[1])
+                    # 缺少属性的实体不计入总和
+                    if value is not None:
+                        values[i].append(value)
+        return {rule.metric: math.fsum(rule_values) for rule, rule_values in zip(self.rules, values)}
+
+    def estimate(self, ifc_file, pset_index, containment_index=None, name=""):
+        '''
+        计算全部度量并写入CostEstimator.
+        '''
+        cost_result = CostEstimator()
+        cost_result.model_name = name
+        metrics = self.evaluate(ifc_file, pset_index, containment_index)
+        for rule in self.rules:
+            cost_result.set_metric(rule.metric, metrics[rule.metric], rule.unit)
+        return cost_result
+
+    def to_sql(self, schema_version="IFC4"):
+        '''
+        生成一条SQL语句, 按规则的顺序返回每个度量的属性值之和(没有满足条件的实体时为0).
+        需要导入时物化的entity_property表(build_property_table = True), 有楼层限制的规则还需要spatial_containment表(build_containment_table = True).
+        entity_property与build_pset_index一样包含实体类型上的属性集, 但只包含单值属性(IfcPropertySingleValue).
+        '''
+        properties = []  # 需要按实体聚合的(属性集名, 属性名, 列名)
+        def get_property(pset_name, prop_name, column):
+            if (pset_name, prop_name, column) not in properties:
+                properties.append((pset_name, prop_name, column))
+            return f"p{properties.index((pset_name, prop_name, column))}"
+
+        metric_columns = []
+        classes = []
+        for rule in self.rules:
+            rule_classes = [name for ifc_class in rule.entity_classes for name in get_subtype_names(schema_version, ifc_class)]
+            classes.extend(name for name in rule_classes if name not in classes)
+            conditions = [f"entity_class IN {_sql_in(rule_classes)}"]
+            for pset_name, prop_name, op, expected in rule.filters:
+                alias = get_property(pset_name, prop_name, _get_value_column(expected))
+                if op == "=":
+                    conditions.append(f"{alias} = {_sql_literal(expected)}")
+                elif isinstance(expected, bool):
+                    # 缺少该属性时为NULL, 与"!="的定义一样计入
+                    conditions.append(f"{alias} IS NOT {_sql_literal(expected)}")
+                else:
+                    conditions.append(f"{alias} IS DISTINCT FROM {_sql_literal(expected)}")
+            if rule.storey is not None:
+                conditions.append("eid IN (SELECT spatial_containment.eid FROM spatial_containment JOIN ifcbuildingstorey "
+                                  "ON ifcbuildingstorey.id = spatial_containment.storey_id "
+                                  f"WHERE ifcbuildingstorey.\"Name\" = {_sql_literal(rule.storey)})")
+            quantity = get_property(rule.quantity[0], rule.quantity[1], "value_num")
+            metric_columns.append(f"    COALESCE(SUM({quantity}) FILTER (WHERE {' AND '.join(conditions)}), 0) AS {rule.metric}")
+
+        aggregates = []
+        for i, (pset_name, prop_name, column) in enumerate(properties):
+            aggregate = "BOOL_OR" if column == "value_bool" else "MAX"
+            if column == "value_num" and any(rule.quantity == (pset_name, prop_name) for rule in self.rules):
+                aggregate = "SUM"
+            aggregates.append(f"        {aggregate}({column}) FILTER (WHERE pset_name = {_sql_literal(pset_name)} "
+                              f"AND prop_name = {_sql_literal(prop_name)}) AS p{i}")
+        property_names = " OR ".join(f"(pset_name = {_sql_literal(pset_name)} AND prop_name = {_sql_literal(prop_name)})"
+                                     for pset_name, prop_name, _ in properties)
+        return (
+            "WITH element_metric AS (\n"
+            "    SELECT eid, entity_class,\n"
+            + ",\n".join(aggregates) + "\n"
+            "    FROM entity_property\n"
+            f"    WHERE entity_class IN {_sql_in(classes)} AND ({property_names})\n"
+            "    GROUP BY eid, entity_class\n"
+            ")\n"
+            "SELECT\n"
+            + ",\n".join(metric_columns) + "\n"
+            "FROM element_metric;\n"
+        )
+
+
+# workload1的度量定义, 与pg_task3_workload1_filter.sql中all_metrics的列顺序相同
+WORKLOAD1_RULES = CostRuleEngine([
+    # 1. 场地: 一楼所有IfcCovering的面积之和
+    CostRule("total_site_area", ["IfcCovering"], ("Dimensions", "Area"), "ft^2", storey="Level 1"),
+    # 2. 地板: 全部IfcCovering的面积之和
+    CostRule("total_slab_area", ["IfcCovering"], ("Dimensions", "Area"), "ft^2"),
+    # 3. 内/外墙: 按Pset_WallCommon.IsExternal区分, 缺少IsExternal的墙计入内墙
+    CostRule("total_interior_wall_area", ["IfcWall"], ("Dimensions", "Area"), "ft^2", filters=[("Pset_WallCommon", "IsExternal", "!=", True)]),
+    CostRule("total_exterior_wall_area", ["IfcWall"], ("Dimensions", "Area"), "ft^2", filters=[("Pset_WallCommon", "IsExternal", "=", True)]),
+    # 4. 屋面: IfcRoof的面积之和
+    CostRule("total_roof_area", ["IfcRoof"], ("Dimensions", "Area"), "ft^2"),
+])
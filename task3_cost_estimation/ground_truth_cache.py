@@ -0,0 +1,58 @@
+import os
+import json
+import hashlib
+import ifcopenshell
+
+from task3_cost_estimation.task3 import CostEstimator
+from task3_cost_estimation.rawfile_task3_impl import ESTIMATOR_VERSION
+
+
+def get_model_fingerprint(path, chunk_size=1 << 20):
+    '''
+    计算IFC文件内容的sha256, 与文件路径和修改时间无关.
+    '''
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class GroundTruthCache:
+    '''
+    RAWFILE基准造价结果的磁盘缓存.
+    
+    缓存键由模型文件内容的sha256、estimate_cost_workload1的版本号ESTIMATOR_VERSION以及ifcopenshell的版本组成,
+    模型未修改时重复运行测试可以直接读取基准结果, 跳过RAWFILE的数据导入和造价计算.
+    修改造价计算逻辑后应递增ESTIMATOR_VERSION, 否则会继续使用旧的基准结果.
+    '''
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self._fingerprints = {}  # (path, size, mtime) -> sha256, 避免get/put重复计算大文件的哈希
+
+    def _get_cache_path(self, workload):
+        stat = os.stat(workload)
+        file_key = (os.path.realpath(workload), stat.st_size, stat.st_mtime_ns)
+        if file_key not in self._fingerprints:
+            self._fingerprints[file_key] = get_model_fingerprint(workload)
+        key = f"{self._fingerprints[file_key]}_v{ESTIMATOR_VERSION}_ifcopenshell{ifcopenshell.version}"
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, workload):
+        '''
+        返回缓存的CostEstimator, 未命中时返回None.
+        '''
+        cache_path = self._get_cache_path(workload)
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "r") as f:
+            return CostEstimator.from_dict(json.load(f))
+
+    def put(self, workload, cost_result):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_path = self._get_cache_path(workload)
+        # 先写临时文件再重命名, 避免并发运行时读到写了一半的结果
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(cost_result.to_dict(), f, indent=2)
+        os.replace(temp_path, cache_path)
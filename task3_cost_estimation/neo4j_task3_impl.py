@@ -5,6 +5,7 @@ import ifcopenshell
 import os
 
 from util.common import Timer
+from util.model_cache import open_model
 
 
 class Node(dict):
@@ -349,7 +350,7 @@ class Neo4jTask3Impl:
             
             for workload in workloads:
                 self._database_name.append(os.path.basename(workload).split(".")[0])
-                ifc_file = ifcopenshell.open(workload)
+                ifc_file = open_model(workload)
                 # Create graph
                 graph = PropertyGraph()
                 create_full_graph(graph, ifc_file)
@@ -0,0 +1,14 @@
+-- Workload1的containment写法: 在flat写法的基础上, 楼层范围内的统计查询加载时物化的spatial_containment表(build_containment_table = True)
+-- spatial_containment包含楼层通过空间分解关系直接或间接包含的全部构件, 与基准结果中的get_decomposition一致
+-- 这里的查询替换pg_task3_workload1_flat.sql中的同名查询, 输出以ft^2为单位的面积
+
+-- ## site_area
+-- Job1: 一楼所有IfcCovering的面积之和
+SELECT SUM(entity_property.value_num) AS total_site_area
+FROM ifcbuildingstorey
+JOIN spatial_containment
+ON spatial_containment.storey_id = ifcbuildingstorey.id
+JOIN entity_property
+ON entity_property.eid = spatial_containment.eid
+WHERE ifcbuildingstorey."Name" = 'Level 1' AND spatial_containment.entity_class = 'IfcCovering'
+AND entity_property.entity_class = 'IfcCovering' AND entity_property.pset_name = 'Dimensions' AND entity_property.prop_name = 'Area';
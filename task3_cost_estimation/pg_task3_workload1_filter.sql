@@ -0,0 +1,32 @@
+-- Workload1的单语句写法: 只扫描一次加载时物化的entity_property表, 用条件聚合(SUM ... FILTER)同时计算全部面积
+-- entity_property包含实体类型上的属性(build_property_table = True), 一楼包含的构件取自spatial_containment表(build_containment_table = True),
+-- 与基准结果的属性索引和楼层包含关系闭包一致
+-- 输出: total_site_area, total_slab_area, total_interior_wall_area, total_exterior_wall_area, total_roof_area (ft^2)
+
+-- ## all_metrics
+WITH element_metric AS (
+    -- 每个构件一行: 面积之和及IsExternal, 缺少IsExternal时为NULL
+    SELECT eid, entity_class,
+        SUM(value_num) FILTER (WHERE pset_name = 'Dimensions' AND prop_name = 'Area') AS area,
+        BOOL_OR(value_bool) FILTER (WHERE pset_name = 'Pset_WallCommon' AND prop_name = 'IsExternal') AS is_external
+    FROM entity_property
+    WHERE entity_class IN ('IfcCovering', 'IfcWall', 'IfcWallStandardCase', 'IfcRoof')
+    AND ((pset_name = 'Dimensions' AND prop_name = 'Area') OR (pset_name = 'Pset_WallCommon' AND prop_name = 'IsExternal'))
+    GROUP BY eid, entity_class
+),
+level1_element AS (
+    -- 一楼直接或间接包含的构件
+    SELECT spatial_containment.eid
+    FROM ifcbuildingstorey
+    JOIN spatial_containment
+    ON spatial_containment.storey_id = ifcbuildingstorey.id
+    WHERE ifcbuildingstorey."Name" = 'Level 1'
+)
+SELECT
+    -- 没有满足条件的构件时面积为0; 缺少IsExternal的墙(is_external为NULL)计入内墙
+    COALESCE(SUM(area) FILTER (WHERE entity_class = 'IfcCovering' AND eid IN (SELECT eid FROM level1_element)), 0) AS total_site_area,
+    COALESCE(SUM(area) FILTER (WHERE entity_class = 'IfcCovering'), 0) AS total_slab_area,
+    COALESCE(SUM(area) FILTER (WHERE entity_class IN ('IfcWall', 'IfcWallStandardCase') AND is_external IS NOT TRUE), 0) AS total_interior_wall_area,
+    COALESCE(SUM(area) FILTER (WHERE entity_class IN ('IfcWall', 'IfcWallStandardCase') AND is_external), 0) AS total_exterior_wall_area,
+    COALESCE(SUM(area) FILTER (WHERE entity_class = 'IfcRoof'), 0) AS total_roof_area
+FROM element_metric;
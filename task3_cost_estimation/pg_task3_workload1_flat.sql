@@ -0,0 +1,47 @@
+-- Workload1的扁平化写法: 查询加载时物化的entity_property表(build_property_table = True)
+-- 每个"-- ## <查询名>"之后是一条查询, 与pg_task3_workload1_query1..4.sql中的查询一一对应, 输出以ft^2为单位的面积
+
+-- ## site_area
+-- Job1: 一楼所有IfcCovering的面积之和
+SELECT SUM(entity_property.value_num) AS total_site_area
+FROM ifcbuildingstorey
+JOIN ifcrelcontainedinspatialstructure
+ON ifcrelcontainedinspatialstructure."RelatingStructure" = ifcbuildingstorey.id
+CROSS JOIN LATERAL UNNEST(ifcrelcontainedinspatialstructure."RelatedElements") AS elements(eid)
+JOIN entity_property
+ON entity_property.eid = elements.eid
+WHERE ifcbuildingstorey."Name" = 'Level 1'
+AND entity_property.entity_class = 'IfcCovering' AND entity_property.pset_name = 'Dimensions' AND entity_property.prop_name = 'Area';
+
+-- ## slab_area
+-- Job2: 地板面积之和
+SELECT SUM(value_num) AS total_slab_area
+FROM entity_property
+WHERE entity_class = 'IfcCovering' AND pset_name = 'Dimensions' AND prop_name = 'Area';
+
+-- ## interior_wall_area
+-- Job3: 内墙总面积, 缺少IsExternal的墙计入内墙
+SELECT SUM(area.value_num) AS total_interior_wall_area
+FROM entity_property AS area
+WHERE area.entity_class IN ('IfcWall', 'IfcWallStandardCase') AND area.pset_name = 'Dimensions' AND area.prop_name = 'Area'
+AND NOT EXISTS (
+    SELECT 1 FROM entity_property AS is_external
+    WHERE is_external.eid = area.eid AND is_external.pset_name = 'Pset_WallCommon'
+    AND is_external.prop_name = 'IsExternal' AND is_external.value_bool
+);
+
+-- ## exterior_wall_area
+-- Job3: 外墙总面积
+SELECT SUM(area.value_num) AS total_exterior_wall_area
+FROM entity_property AS area
+JOIN entity_property AS is_external
+ON is_external.eid = area.eid
+WHERE area.entity_class IN ('IfcWall', 'IfcWallStandardCase') AND area.pset_name = 'Dimensions' AND area.prop_name = 'Area'
+AND is_external.entity_class IN ('IfcWall', 'IfcWallStandardCase') AND is_external.pset_name = 'Pset_WallCommon'
+AND is_external.prop_name = 'IsExternal' AND is_external.value_bool;
+
+-- ## roof_area
+-- Job4: 屋面总面积
+SELECT SUM(value_num) AS total_roof_area
+FROM entity_property
+WHERE entity_class = 'IfcRoof' AND pset_name = 'Dimensions' AND prop_name = 'Area';
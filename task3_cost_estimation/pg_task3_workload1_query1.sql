@@ -1,6 +1,6 @@
 -- Job1: Calculate the total area of the site of the building
 -- Output: total_site_area
-SELECT SUM(CAST(ifcpropertysinglevalue."NominalValue" AS DOUBLE PRECISION))  as total_site_area
+SELECT SUM(ifcpropertysinglevalue."NominalValueNum")  as total_site_area
 FROM (
     SELECT ifccovering.id, UNNEST(ifcpropertyset."HasProperties") as HasProperties
     FROM (
@@ -1,6 +1,6 @@
 -- Job2: 计算地板面积之和
 -- Output: total_slab_area
-SELECT SUM(CAST(ifcpropertysinglevalue."NominalValue" AS DOUBLE PRECISION))  as total_site_area
+SELECT SUM(ifcpropertysinglevalue."NominalValueNum")  as total_site_area
 FROM (
     SELECT ifccovering.id, UNNEST(ifcpropertyset."HasProperties") as HasProperties
     -- 获取IfcCovering实体
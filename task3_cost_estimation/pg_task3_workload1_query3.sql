@@ -3,13 +3,13 @@
 
 -- Function: get_pset_value
 -- Input: table_name, pset_name, key_name, condition
--- Output: eid, value_result
-CREATE OR REPLACE FUNCTION get_pset_value(table_name text, pset_name text, key_name text, condition text) RETURNS TABLE(eid INTEGER, value_result text) AS $$
+-- Output: eid, value_result(NominalValue), value_num(NominalValueNum), value_bool(NominalValueBool)
+CREATE OR REPLACE FUNCTION get_pset_value(table_name text, pset_name text, key_name text, condition text) RETURNS TABLE(eid INTEGER, value_result text, value_num DOUBLE PRECISION, value_bool BOOLEAN) AS $$
 DECLARE
     sql text;
 BEGIN
     sql := format('
-    SELECT r1.eid as eid, ifcpropertysinglevalue."NominalValue" AS value_result
+    SELECT r1.eid as eid, ifcpropertysinglevalue."NominalValue" AS value_result, ifcpropertysinglevalue."NominalValueNum" AS value_num, ifcpropertysinglevalue."NominalValueBool" AS value_bool
     FROM (
         SELECT %s.id as eid, UNNEST(ifcpropertyset."HasProperties") as HasProperties
         -- 获取实体
@@ -34,20 +34,22 @@ END;
 $$ LANGUAGE plpgsql;
 
 -- ##
--- 计算内墙总面积
+-- 计算内墙总面积, 缺少IsExternal的墙计入内墙
 SELECT r1.sum + r2.sum AS total_interior_wall_area
 FROM 
 (
-    SELECT SUM(CAST(t1.value_result AS DOUBLE PRECISION)) AS sum
+    SELECT SUM(t1.value_num) AS sum
     FROM get_pset_value('ifcwall', 'Dimensions', 'Area', '1=1') AS t1
-    JOIN get_pset_value('ifcwall', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValue"=''False''') AS t2
-    ON t1.eid = t2.eid
+    WHERE t1.eid NOT IN (
+        SELECT t2.eid FROM get_pset_value('ifcwall', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValueBool"') AS t2
+    )
 ) AS r1,
 (
-    SELECT SUM(CAST(t3.value_result AS DOUBLE PRECISION)) AS sum
+    SELECT SUM(t3.value_num) AS sum
     FROM get_pset_value('ifcwallstandardcase', 'Dimensions', 'Area', '1=1') AS t3
-    JOIN get_pset_value('ifcwallstandardcase', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValue"=''False''') AS t4
-    ON t3.eid = t4.eid
+    WHERE t3.eid NOT IN (
+        SELECT t4.eid FROM get_pset_value('ifcwallstandardcase', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValueBool"') AS t4
+    )
 ) AS r2;
 
 -- ##
@@ -55,14 +57,14 @@ FROM
 SELECT r1.sum + r2.sum AS total_exterior_wall_area
 FROM 
 (
-    SELECT SUM(CAST(t1.value_result AS DOUBLE PRECISION)) AS sum
+    SELECT SUM(t1.value_num) AS sum
     FROM get_pset_value('ifcwall', 'Dimensions', 'Area', '1=1') AS t1
-    JOIN get_pset_value('ifcwall', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValue"=''True''') AS t2
+    JOIN get_pset_value('ifcwall', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValueBool"') AS t2
     ON t1.eid = t2.eid
 ) AS r1,
 (
-    SELECT SUM(CAST(t3.value_result AS DOUBLE PRECISION)) AS sum
+    SELECT SUM(t3.value_num) AS sum
     FROM get_pset_value('ifcwallstandardcase', 'Dimensions', 'Area', '1=1') AS t3
-    JOIN get_pset_value('ifcwallstandardcase', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValue"=''True''') AS t4
+    JOIN get_pset_value('ifcwallstandardcase', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValueBool"') AS t4
     ON t3.eid = t4.eid
 ) AS r2;
@@ -0,0 +1,18 @@
+-- Job3: 计算内外墙面积之和(storage = inherit)
+-- 按IFC继承关系建表时, ifcwall包含IfcWallStandardCase、IfcWallElementedCase等子类型的实体, 只需查询一次
+-- get_pset_value函数由pg_task3_workload1_query3.sql创建
+
+-- ##
+-- 计算内墙总面积, 缺少IsExternal的墙计入内墙
+SELECT SUM(t1.value_num) AS total_interior_wall_area
+FROM get_pset_value('ifcwall', 'Dimensions', 'Area', '1=1') AS t1
+WHERE t1.eid NOT IN (
+    SELECT t2.eid FROM get_pset_value('ifcwall', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValueBool"') AS t2
+);
+
+-- ##
+-- 计算外墙总面积
+SELECT SUM(t1.value_num) AS total_exterior_wall_area
+FROM get_pset_value('ifcwall', 'Dimensions', 'Area', '1=1') AS t1
+JOIN get_pset_value('ifcwall', 'Pset_WallCommon', 'IsExternal', 'ifcpropertysinglevalue."NominalValueBool"') AS t2
+ON t1.eid = t2.eid;
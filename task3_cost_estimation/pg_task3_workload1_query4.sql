@@ -1,2 +1,2 @@
-SELECT SUM(CAST(t1.value_result AS DOUBLE PRECISION)) AS sum
+SELECT SUM(t1.value_num) AS sum
 FROM get_pset_value('ifcroof', 'Dimensions', 'Area', '1=1') AS t1;
\ No newline at end of file
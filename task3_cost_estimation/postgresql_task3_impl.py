@@ -1,12 +1,45 @@
 import os
+import re
+import time
+import hashlib
 import psycopg2
+from concurrent.futures import ThreadPoolExecutor
 import ifcopenshell
 import ifcopenshell.util.selector as selector
 import ifcopenshell.util.element
 
 from util.common import Timer
-from task3_cost_estimation.task3 import CostEstimator
+from util.model_cache import open_model
+from task3_cost_estimation.task3 import CostEstimator, DECOMPOSITION_RELATIONS
+from task3_cost_estimation.cost_rules import WORKLOAD1_RULES
 import util.common as util
+import util.pg_copy as pg_copy
+from util.pg_parallel_loader import ParallelLoader
+from util.step_parser import StepLoader
+from util.pg_delta import DeltaImporter
+from util.pg_pool import get_connection_manager
+import util.plan_capture as plan_capture
+import util.step_parser as step_parser
+import schema.compile_schema as compile_schema
+
+# workload1查询的写法 -> 按"-- ## <查询名>"分节的查询文件, None表示pg_task3_workload1_query1..4.sql
+WORKLOAD1_VARIANTS = {
+    "join": None,
+    "inherit": None,  # 内外墙查询替换为pg_task3_workload1_query3_inherit.sql
+    "flat": "pg_task3_workload1_flat.sql",
+    "filter": "pg_task3_workload1_filter.sql",
+    "containment": "pg_task3_workload1_flat.sql",  # 场地面积查询替换为pg_task3_workload1_containment.sql
+    "rules": None,  # 由cost_rules.WORKLOAD1_RULES生成的一条语句
+}
+
+def get_index_name(table_name, attr_name):
+    '''
+    实体引用列上索引的名称. Postgresql的标识符最长63字节, 超长时截断并附加完整名称的哈希, 避免截断后的名称相同.
+    '''
+    index_name = f"{table_name}_{attr_name.lower()}_idx"
+    if len(index_name) <= 63:
+        return index_name
+    return index_name[:54] + "_" + hashlib.md5(index_name.encode("utf-8")).hexdigest()[:8]
 
 class PGTask3Impl:
     
@@ -16,39 +49,70 @@ class PGTask3Impl:
         self._password = args["password"]
         self._host = args["host"]
         self._port = args["port"]
+        # insert: 每个实体执行一条INSERT语句; copy: 按实体类型分组, 通过COPY ... FROM STDIN批量导入;
+        # parallel: 按实体类型(及id范围)分区, 由load_workers个进程各自通过COPY导入(0表示CPU核数);
+        # step: 不使用ifcopenshell打开模型, 由load_workers个进程分块解析STEP文件并通过COPY导入
+        self._load_mode = args.get("load_mode", "insert")
+        if self._load_mode not in ("insert", "copy", "parallel", "step"):
+            raise ValueError(f"Unsupported load mode: {self._load_mode}")
+        self._load_workers = int(args.get("load_workers", 0))
+        # 导入数据前在一个事务中创建schema/create_table_<schema>.sql中的全部实体表
+        self._precreate_tables = args.get("precreate_tables", "False") == "True"
+        # 先向不带主键的表中导入数据, 导入完成后再创建主键和索引并执行ANALYZE
+        self._defer_indexes = args.get("defer_indexes", "False") == "True"
+        # flat: 每个实体类型一个独立的表; inherit: 按IFC继承关系建表(INHERITS), 查询超类型的表时包含全部子类型的实体
+        storage = args.get("storage", "flat")
+        if storage not in ("flat", "inherit"):
+            raise ValueError(f"Unsupported storage: {storage}")
+        self._inheritance = storage == "inherit"
+        if self._inheritance and self._precreate_tables:
+            raise ValueError("precreate_tables is not supported with storage = inherit")
+        self.timings = {}  # 最近一次prepare_data中各步骤的耗时(秒)
+        self._run_sessions = []  # run使用的查询会话, 在计时之外打开, 在多次run之间复用
+        self._schema_version = "IFC4"  # 最近一次导入的模型的schema, rules写法按它展开实体类型的子类型
+        # 导入数据后物化entity_property表(实体的全部单值属性), 供flat写法的查询使用
+        self._property_table = args.get("build_property_table", "False") == "True"
+        # 导入数据后物化spatial_containment表(楼层包含的全部构件), 按楼层统计时不再展开空间分解关系
+        self._containment_table = args.get("build_containment_table", "False") == "True"
+        # 逗号分隔的workload1查询写法, 第一种用于task3.run, 其余的由run_all分别计时比较.
+        # join: 查询时展开属性关系; inherit: storage = inherit时的join写法; flat: 查询entity_property; filter: 在entity_property上用一条语句条件聚合出全部面积;
+        # containment: 在flat的基础上通过spatial_containment查询楼层包含的构件; rules: 由cost_rules中的度量规则生成的一条语句
+        default_variant = "inherit" if storage == "inherit" else "join"
+        self._query_variants = [x.strip() for x in args.get("workload1_variants", default_variant).split(",")]
+        for variant in self._query_variants:
+            if variant not in WORKLOAD1_VARIANTS:
+                raise ValueError(f"Unsupported workload1 variant: {variant}")
+        for variant in ("flat", "filter", "containment", "rules"):
+            if variant in self._query_variants and not self._property_table:
+                raise ValueError(f"workload1 variant {variant} requires build_property_table = True")
+        for variant in ("filter", "containment", "rules"):
+            if variant in self._query_variants and not self._containment_table:
+                raise ValueError(f"workload1 variant {variant} requires build_containment_table = True")
+        # join写法分别查询ifcwall和ifcwallstandardcase, inherit写法只查询ifcwall, 两者只在对应的存储方式下结果正确
+        mismatched_variant = "join" if self._inheritance else "inherit"
+        if mismatched_variant in self._query_variants:
+            raise ValueError(f"workload1 variant {mismatched_variant} does not match storage = {storage}")
+        self._query_variant = self._query_variants[0]
+        # 每个数据库的连接池大小, 不小于并发负载测试的最大客户端数
+        self._pool_size = int(args.get("pool_size", 32))
+        # workload1中互不依赖的查询的执行方式: serial(在一个连接上依次执行) 或 thread(每条查询使用一个连接, 由线程池并发执行)
+        self._query_executor = args.get("workload1_executor", "serial")
+        if self._query_executor not in ("serial", "thread"):
+            raise ValueError(f"Unsupported workload1 executor: {self._query_executor}")
+        # 最近一次run中各查询的耗时之和(summed)与其中最长的耗时(critical_path, 并发执行时run的耗时下限)
+        self.run_timings = {}
         
-    def _get_create_table_sql(self, entity):
-        create_table_sql = f"CREATE TABLE IF NOT EXISTS {entity.is_a()} (id INTEGER PRIMARY KEY, "  # 创建表的SQL语句
-        attr_type_map = {
-            "INT": "INTEGER",
-            "DOUBLE": "DOUBLE PRECISION",
-            "BOOL": "BOOLEAN",
-            "LOGICAL": "VARCHAR(10)",
-            "STRING": "VARCHAR(150)",
-            "ENUMERATION": "VARCHAR(150)",
-            "ENTITY INSTANCE": "INTEGER",
-            "AGGREGATE OF ENTITY INSTANCE": "INTEGER[]",
-            "AGGREGATE OF DOUBLE": "DOUBLE PRECISION[]",
-            "AGGREGATE OF INT": "INTEGER[]",
-            "AGGREGATE OF STRING": "text[]",
-        }
-        
-        for i in range(len(entity)):
-            attr_name = entity.attribute_name(i)
-            attr_type = entity.attribute_type(i)
-            
-            if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
-                attr_type = "TEXT"
-            elif(attr_type in attr_type_map):
-                attr_type = attr_type_map[attr_type]
-            elif attr_type == "DERIVED":
-                continue
-            else:
-                raise Exception(f"Unknown attribute type: {attr_type}, when creating table for {attr_name} in {entity}. info: {entity.get_info()}")
-            create_table_sql += f"\"{attr_name}\" {attr_type}," # 列名需要加引号，因为有些列名是SQL关键字(如: Outer)
-        create_table_sql = create_table_sql[:-1] + ");"
-        
-        return create_table_sql
+    def _create_entity_tables(self, cursor, entity, entity_inited):
+        '''
+        创建导入entity所需的表(storage = inherit时还包括各级超类型的表), 返回执行的建表语句.
+        '''
+        commands = []
+        for entity_type, command in compile_schema.get_create_table_sqls(entity, not self._defer_indexes, self._inheritance):
+            if entity_type not in entity_inited:
+                entity_inited.add(entity_type)
+                cursor.execute(command)
+                commands.append(command)
+        return commands
     
     def _get_insert_sql(self, entity):
         insert_sql = f"INSERT INTO {entity.is_a()} VALUES ({entity.id()},"
@@ -60,7 +124,9 @@ class PGTask3Impl:
             attr_value = attr_info[entity.attribute_name(i)]
             
             if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
-                insert_sql += f"""'{str(attr_value.get_info()['wrappedValue']).replace("'", "''")}',"""
+                # 依次写入NominalValue, NominalValueType, NominalValueNum, NominalValueBool
+                for value in pg_copy.get_nominal_values(attr_value):
+                    insert_sql += "NULL," if value is None else f"""'{str(value).replace("'", "''")}',"""
                 continue
                     
             if attr_type == "DERIVED":
@@ -92,114 +158,526 @@ class PGTask3Impl:
         
         return insert_sql
 
-    def _connect_to_db(self, user, password, host, port, database_name):
-        try:
-            conn = psycopg2.connect(database="postgres", user=user, password=password, host=host, port=port)
-            conn.autocommit = True
-            cur = conn.cursor()
-            cur.execute(f"CREATE DATABASE {database_name}")
-        except psycopg2.errors.DuplicateDatabase:
-            pass
-        except Exception as e:
-            raise e
-        finally:
-            conn.close()
-            cur.close()
-        conn = psycopg2.connect(database=database_name, user=user, password=password, host=host, port=port)
-        return conn
+    def _insert_entities(self, conn, ifc_file, entity_inited):
+        for entity in ifc_file:
+            entity_type = entity.is_a()
+            cursor = conn.cursor()
+            if(entity_type not in entity_inited):
+                # 创建实体表
+                for command in self._create_entity_tables(cursor, entity, entity_inited):
+                    print(command)
+                conn.commit()
+            try:
+                # 插入属性记录
+                command = self._get_insert_sql(entity)
+                cursor.execute(command)
+                # print(command)
+            except psycopg2.errors.UniqueViolation:
+                conn.rollback()
+            except Exception as e:
+                print(f"Error when inserting {entity}.")
+                print(e)
+                conn.rollback()
+        cursor.close()
+    
+    def _copy_entities(self, conn, ifc_file, entity_inited):
+        '''
+        按实体类型分组, 每种类型通过一次COPY导入. 某个类型导入失败时只回滚该类型, 不影响其他类型.
+        '''
+        entity_groups = {}
+        for entity in ifc_file:
+            entity_groups.setdefault(entity.is_a(), []).append(entity)
+        
+        cursor = conn.cursor()
+        for entity_type, entities in entity_groups.items():
+            if(entity_type not in entity_inited):
+                # 创建实体表
+                self._create_entity_tables(cursor, entities[0], entity_inited)
+            cursor.execute("SAVEPOINT copy_entities")
+            try:
+                pg_copy.copy_entities(cursor, entity_type, entities)
+            except psycopg2.errors.UniqueViolation:
+                # 数据库中已经导入过该模型
+                cursor.execute("ROLLBACK TO SAVEPOINT copy_entities")
+            except Exception as e:
+                print(f"Error when copying {entity_type}.")
+                print(e)
+                cursor.execute("ROLLBACK TO SAVEPOINT copy_entities")
+            cursor.execute("RELEASE SAVEPOINT copy_entities")
+        cursor.close()
+
+    def _create_compiled_tables(self, conn, schema_version):
+        '''
+        在一个事务中执行schema/compile_schema.py编译出的全部建表语句, 返回已创建的表名.
+        '''
+        schema_path = compile_schema.get_compiled_schema_path(schema_version)
+        if not os.path.exists(schema_path):
+            print(f"{schema_path} not found, tables will be created while loading. Run schema/compile_schema.py {schema_version} first.")
+            return set()
+        with open(schema_path, "r") as f:
+            create_table_sql = f.read()
+        if self._defer_indexes:
+            create_table_sql = compile_schema.remove_primary_keys(create_table_sql)
+        cursor = conn.cursor()
+        cursor.execute(create_table_sql)
+        conn.commit()
+        cursor.close()
+        return set(compile_schema.get_compiled_table_names(create_table_sql))
+
+    def _build_indexes(self, conn, schema_version, entity_types):
+        '''
+        为模型中出现的实体类型的表创建主键, 在实体引用列上创建B-tree索引, 在实体引用数组列上创建GIN索引, 最后执行ANALYZE.
+        '''
+        schema_file = ifcopenshell.file(schema=schema_version)
+        cursor = conn.cursor()
+        for entity_type in entity_types:
+            entity = schema_file.create_entity(entity_type)
+            table_name = entity_type.lower()
+            cursor.execute("SELECT 1 FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'", (table_name,))
+            if cursor.fetchone() is None:
+                cursor.execute(f"ALTER TABLE {table_name} ADD PRIMARY KEY (id)")
+            for i in range(len(entity)):
+                attr_name = entity.attribute_name(i)
+                attr_type = entity.attribute_type(i)
+                if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
+                    continue
+                if attr_type == "ENTITY INSTANCE":
+                    index_method = "btree"
+                elif attr_type == "AGGREGATE OF ENTITY INSTANCE":
+                    index_method = "gin"
+                else:
+                    continue
+                index_name = get_index_name(table_name, attr_name)
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} USING {index_method} (\"{attr_name}\")")
+        for entity_type in entity_types:
+            cursor.execute(f"ANALYZE {entity_type}")
+        conn.commit()
+        cursor.close()
+
+    def _has_rows(self, cursor):
+        '''
+        数据库中是否已有表包含数据.
+        '''
+        cursor.execute("SELECT tablename FROM pg_tables WHERE schemaname = 'public'")
+        table_names = [table_name for (table_name,) in cursor.fetchall()]
+        if len(table_names) == 0:
+            return False
+        cursor.execute(" UNION ALL ".join(f"(SELECT 1 FROM \"{table_name}\" LIMIT 1)" for table_name in table_names) + " LIMIT 1")
+        return cursor.fetchone() is not None
+
+    def _get_object_tables(self, cursor, schema_version):
+        '''
+        返回(数据库中全部表名的集合, IfcObjectDefinition子类型的各个表中"SELECT id, entity_class"子查询的列表).
+        '''
+        schema_file = ifcopenshell.file(schema=schema_version)
+        cursor.execute("SELECT tablename FROM pg_tables WHERE schemaname = 'public'")
+        table_names = {table_name for (table_name,) in cursor.fetchall()}
+        object_tables = []
+        for table_name in sorted(table_names):
+            try:
+                entity = schema_file.create_entity(table_name)
+            except RuntimeError:
+                # 不是实体表, 如entity_property
+                continue
+            if entity.is_a("IfcObjectDefinition"):
+                # storage = inherit时父表包含子类型的实体, 只取表自身的实体
+                object_tables.append(f"SELECT id, '{entity.is_a()}' AS entity_class FROM ONLY {table_name}")
+        return table_names, object_tables
+
+    def _build_property_table(self, conn, schema_version):
+        '''
+        物化entity_property表: 每行是一个实体(IfcObjectDefinition的子类型)的属性集中的一个IfcPropertySingleValue,
+        value_num/value_bool取自导入时填充的NominalValueNum/NominalValueBool, 并在查询条件列上建索引.
+        与rawfile_task3_impl.build_pset_index相同, 属性集包括实体类型(IfcRelDefinesByType -> IfcTypeObject.HasPropertySets)上的属性集,
+        实体自身通过IfcRelDefinesByProperties关联的同名属性覆盖类型上的属性.
+        '''
+        cursor = conn.cursor()
+        table_names, object_tables = self._get_object_tables(cursor, schema_version)
+        schema_file = ifcopenshell.file(schema=schema_version)
+        type_tables = []
+        for table_name in sorted(table_names):
+            try:
+                entity = schema_file.create_entity(table_name)
+            except RuntimeError:
+                continue
+            if entity.is_a("IfcTypeObject"):
+                type_tables.append(f'SELECT id, "HasPropertySets" FROM ONLY {table_name}')
+        cursor.execute("DROP TABLE IF EXISTS entity_property")
+        cursor.execute("CREATE TABLE entity_property (eid INTEGER, entity_class VARCHAR(150), pset_name VARCHAR(150), "
+                       "prop_name VARCHAR(150), value_text TEXT, value_num DOUBLE PRECISION, value_bool BOOLEAN)")
+        if len(object_tables) > 0 and {"ifcreldefinesbyproperties", "ifcpropertyset", "ifcpropertysinglevalue"} <= table_names:
+            # 属性集定义的来源: 实体类型上的属性集优先级为0, 实体自身的属性集为1
+            definitions = ['SELECT UNNEST("RelatedObjects") AS eid, "RelatingPropertyDefinition" AS pset_id, 1 AS priority FROM ifcreldefinesbyproperties']
+            if len(type_tables) > 0 and "ifcreldefinesbytype" in table_names:
+                # 与ifcopenshell.util.element.get_type一样, 每个实体只取第一个类型关系
+                definitions.append(f'''SELECT element_type.eid, psets.pset_id, 0
+                FROM (
+                    SELECT DISTINCT ON (rel.related_id) rel.related_id AS eid, types."HasPropertySets"
+                    FROM (SELECT id, UNNEST("RelatedObjects") AS related_id, "RelatingType" FROM ifcreldefinesbytype) AS rel
+                    JOIN ({" UNION ALL ".join(type_tables)}) AS types
+                    ON types.id = rel."RelatingType"
+                    ORDER BY rel.related_id, rel.id
+                ) AS element_type
+                CROSS JOIN LATERAL UNNEST(element_type."HasPropertySets") AS psets(pset_id)''')
+            cursor.execute(f'''
+            INSERT INTO entity_property
+            SELECT DISTINCT ON (objects.id, ifcpropertyset."Name", ifcpropertysinglevalue."Name")
+                objects.id, objects.entity_class, ifcpropertyset."Name", ifcpropertysinglevalue."Name", ifcpropertysinglevalue."NominalValue",
+                ifcpropertysinglevalue."NominalValueNum", ifcpropertysinglevalue."NominalValueBool"
+            FROM ({" UNION ALL ".join(object_tables)}) AS objects
+            JOIN ({" UNION ALL ".join(definitions)}) AS definitions
+            ON definitions.eid = objects.id
+            JOIN ifcpropertyset
+            ON ifcpropertyset.id = definitions.pset_id
+            CROSS JOIN LATERAL UNNEST(ifcpropertyset."HasProperties") AS properties(pid)
+            JOIN ifcpropertysinglevalue
+            ON ifcpropertysinglevalue.id = properties.pid
+            ORDER BY objects.id, ifcpropertyset."Name", ifcpropertysinglevalue."Name", definitions.priority DESC, ifcpropertyset.id DESC
+            ''')
+        cursor.execute("CREATE INDEX entity_property_prop_idx ON entity_property (entity_class, pset_name, prop_name)")
+        cursor.execute("CREATE INDEX entity_property_eid_idx ON entity_property (eid)")
+        cursor.execute("ANALYZE entity_property")
+        conn.commit()
+        cursor.close()
+
+    def _build_containment_table(self, conn, schema_version):
+        '''
+        物化spatial_containment表: 每行是一个楼层(IfcBuildingStorey)通过空间分解关系(见DECOMPOSITION_RELATIONS)直接或间接包含的一个实体,
+        与ifcopenshell.util.element.get_decomposition的结果相同, 并在(storey_id, entity_class)上建索引.
+        '''
+        cursor = conn.cursor()
+        table_names, object_tables = self._get_object_tables(cursor, schema_version)
+        relations = []
+        for relation, (relating, related) in DECOMPOSITION_RELATIONS.items():
+            if relation.lower() not in table_names:
+                continue
+            # 开洞与填充关系的子实体是单个引用, 其余是引用数组
+            child = f'"{related}"' if relation in ("IfcRelVoidsElement", "IfcRelFillsElement") else f'UNNEST("{related}")'
+            relations.append(f'SELECT "{relating}" AS parent, {child} AS child FROM {relation.lower()}')
+
+        cursor.execute("DROP TABLE IF EXISTS spatial_containment")
+        cursor.execute("CREATE TABLE spatial_containment (storey_id INTEGER, eid INTEGER, entity_class VARCHAR(150))")
+        if len(object_tables) > 0 and len(relations) > 0 and "ifcbuildingstorey" in table_names:
+            cursor.execute(f'''
+            INSERT INTO spatial_containment
+            WITH RECURSIVE decomposition AS (
+                {" UNION ALL ".join(relations)}
+            ),
+            closure(storey_id, eid) AS (
+                SELECT ifcbuildingstorey.id, decomposition.child
+                FROM ifcbuildingstorey
+                JOIN decomposition
+                ON decomposition.parent = ifcbuildingstorey.id
+                UNION
+                SELECT closure.storey_id, decomposition.child
+                FROM closure
+                JOIN decomposition
+                ON decomposition.parent = closure.eid
+            )
+            SELECT closure.storey_id, closure.eid, objects.entity_class
+            FROM closure
+            JOIN ({" UNION ALL ".join(object_tables)}) AS objects
+            ON objects.id = closure.eid
+            ''')
+        cursor.execute("CREATE INDEX spatial_containment_storey_idx ON spatial_containment (storey_id, entity_class)")
+        cursor.execute("ANALYZE spatial_containment")
+        conn.commit()
+        cursor.close()
+
+    @property
+    def _connections(self):
+        # 连接池不随对象序列化, 并发负载测试的子进程中按连接参数取得本进程的连接池
+        return get_connection_manager(self._user, self._password, self._host, self._port, self._pool_size)
+
+    def _connect_to_db(self, database_name):
+        '''
+        从连接池中取出数据库的一个连接(数据库不存在时先创建), 用完后通过self._connections.putconn归还.
+        '''
+        return self._connections.getconn(database_name)
         
     @Timer.eclapse
     def prepare_data(self, workloads):
         entity_inited = set()  # 记录已经初始化的实体
-        try:
-            for workload in workloads:
-                # 创建数据库并连接
-                model_name = os.path.basename(workload).split(".")[0]
-                self._database_name.append(model_name)
-                conn = self._connect_to_db(self._user, self._password, self._host, self._port, model_name)
+        self.timings = {"load": 0.0}
+        if self._defer_indexes:
+            self.timings["index"] = 0.0
+        if self._property_table:
+            self.timings["property_table"] = 0.0
+        if self._containment_table:
+            self.timings["containment_table"] = 0.0
+        for workload in workloads:
+            # 创建数据库并连接
+            model_name = os.path.basename(workload).split(".")[0]
+            self._database_name.append(model_name)
+            # 导入失败时连接也会归还到连接池
+            with self._connections.connection(model_name, create=True) as conn:
                 print(f"Connected to database {model_name}.")
+                if self._defer_indexes:
+                    # 不带主键的表不会拒绝重复的实体, 重复导入后也无法再创建主键
+                    cursor = conn.cursor()
+                    has_rows = self._has_rows(cursor)
+                    cursor.close()
+                    conn.rollback()
+                    if has_rows:
+                        raise RuntimeError(f"Database {model_name} already holds data, defer_indexes requires an empty database. "
+                                           "Drop the database (or run cleanup) before loading again.")
                 print(f"Loading {workload}...")
                 # 将模型转换为关系表
-                ifc_file = ifcopenshell.open(workload)
-                for entity in ifc_file:
-                    entity_type = entity.is_a()
-                    cursor = conn.cursor()
-                    if(entity_type not in entity_inited):
-                        # 创建实体表
-                        entity_inited.add(entity_type)
-                        command = self._get_create_table_sql(entity)
-                        cursor.execute(command)
-                        conn.commit()
-                        print(command)
-                    try:
-                        # 插入属性记录
-                        command = self._get_insert_sql(entity)
-                        cursor.execute(command)
-                        # print(command)
-                    except psycopg2.errors.UniqueViolation:
-                        conn.rollback()
-                    except Exception as e:
-                        print(f"Error when inserting {entity}.")
-                        print(e)
-                        conn.rollback()
+                start_time = time.perf_counter()
+                if self._load_mode == "step":
+                    schema_version = step_parser.read_schema(workload)
+                else:
+                    ifc_file = open_model(workload)
+                    schema_version = ifc_file.schema
+                self._schema_version = schema_version
+                if self._precreate_tables:
+                    entity_inited |= self._create_compiled_tables(conn, schema_version)
+                if self._load_mode == "step":
+                    step_loader = StepLoader(self._load_workers, primary_key=not self._defer_indexes, inheritance=self._inheritance)
+                    entity_types = step_loader.load(conn, workload, entity_inited)
+                elif self._load_mode == "parallel":
+                    conn_args = {"database": model_name, "user": self._user, "password": self._password,
+                                 "host": self._host, "port": self._port}
+                    parallel_loader = ParallelLoader(conn_args, self._load_workers, primary_key=not self._defer_indexes,
+                                                     inheritance=self._inheritance)
+                    parallel_loader.load(conn, workload, entity_inited, ifc_file)
+                elif self._load_mode == "copy":
+                    self._copy_entities(conn, ifc_file, entity_inited)
+                else:
+                    self._insert_entities(conn, ifc_file, entity_inited)
                 conn.commit()
-                cursor.close()
-                conn.close()
-        except Exception as e:
-            print(e)
+                self.timings["load"] += time.perf_counter() - start_time
+                if self._defer_indexes:
+                    start_time = time.perf_counter()
+                    if self._load_mode != "step":
+                        entity_types = {entity.is_a() for entity in ifc_file}
+                    self._build_indexes(conn, schema_version, entity_types)
+                    self.timings["index"] += time.perf_counter() - start_time
+                if self._property_table:
+                    start_time = time.perf_counter()
+                    self._build_property_table(conn, schema_version)
+                    self.timings["property_table"] += time.perf_counter() - start_time
+                if self._containment_table:
+                    start_time = time.perf_counter()
+                    self._build_containment_table(conn, schema_version)
+                    self.timings["containment_table"] += time.perf_counter() - start_time
+        # 在prepare_data中打开run使用的会话, 会话的初始化不计入run的耗时
+        self._open_run_sessions()
         pass
 
+    @Timer.eclapse
+    def update_data(self, workload):
+        '''
+        增量导入模型的新版本, 数据库名与prepare_data相同. 只写入与数据库中已有版本不同的实体, 见util.pg_delta.DeltaImporter.
+        数据库中还没有记录实体的匹配键时, 删除数据库后完整导入一次并记录匹配键.
+        '''
+        model_name = os.path.basename(workload).split(".")[0]
+        ifc_file = open_model(workload)
+        importer = DeltaImporter(self._inheritance)
+        self._schema_version = ifc_file.schema
+        conn = self._connect_to_db(model_name)
+        try:
+            if importer.has_entity_keys(conn):
+                if model_name not in self._database_name:
+                    self._database_name.append(model_name)
+                stats = importer.apply(conn, ifc_file)
+                if self._property_table:
+                    self._build_property_table(conn, ifc_file.schema)
+                if self._containment_table:
+                    self._build_containment_table(conn, ifc_file.schema)
+                return stats
+        finally:
+            self._connections.putconn(conn)
+
+        print(f"No entity keys in database {model_name}, reloading {workload}...")
+        self._close_run_sessions()
+        self._connections.drop_database(model_name)
+        if model_name in self._database_name:
+            self._database_name.remove(model_name)
+        self.prepare_data([workload])
+        with self._connections.connection(model_name, create=True) as conn:
+            importer.record(conn, ifc_file)
+        return {"upserted": len(list(ifc_file)), "deleted": 0, "unchanged": 0}
+
     @Timer.eclapse
     def run(self):
         cost_result = self._run_workload1()
         return cost_result
     
-    def _run_workload1(self):
-        cost_result = CostEstimator()
-        conn = self._connect_to_db(self._user, self._password, self._host, self._port, "workload1")
-        cur = conn.cursor()
-        
-        # 1. 通过一楼所有的地板面积之和计算场地总面积
-        # 从pg_task3_workload1.sql读取SQL语句
-        query1 = open("task3_cost_estimation/pg_task3_workload1_query1.sql", "r").read()
-        cur.execute(query1)
-        total_site_area = util.square_unit_transform(cur.fetchone()[0], "ft^2")
-        cost_result.set_site_area(total_site_area)
-        
-        # 2. 计算地板面积之和
-        query2 = open("task3_cost_estimation/pg_task3_workload1_query2.sql", "r").read()
-        cur.execute(query2)
-        total_slab_area = util.square_unit_transform(cur.fetchone()[0], "ft^2")
-        cost_result.set_slab_area(total_slab_area)
-        
-        # 3. 计算内/外墙总面积
-        query3_all = open("task3_cost_estimation/pg_task3_workload1_query3.sql", "r").read().split("-- ##")
-        cur.execute(query3_all[0])  # 创建获取Pset_value的函数
-        
-        cur.execute(query3_all[1])
-        tuple = cur.fetchone()
-        cost_result.set_interior_wall_area(tuple[0], "ft^2")
+    def _workload_database(self):
+        return self._database_name[0] if len(self._database_name) > 0 else "workload1"
+    
+    def _load_workload1_queries(self):
+        '''
+        读取workload1的SQL语句, 返回(初始化语句列表, 查询名 -> SQL的有序字典).
+        每条查询返回一个以ft^2为单位的面积, filter写法的all_metrics一次返回全部面积.
+        '''
+        sql_dir = os.path.dirname(os.path.abspath(__file__))
+        def read_sql(file_name):
+            with open(os.path.join(sql_dir, file_name), "r") as f:
+                return f.read()
         
-        cur.execute(query3_all[2])
-        tuple = cur.fetchone()
-        cost_result.set_exterior_wall_area(tuple[0], "ft^2")
+        def read_sections(file_name):
+            # 每个以"-- ## <查询名>"开头的行之后是一条查询
+            sections = re.split(r"^-- ## ", read_sql(file_name), flags=re.MULTILINE)[1:]
+            return {section.split("\n", 1)[0].strip(): section.split("\n", 1)[1] for section in sections}
         
-        # 4. 计算屋面总面积
-        query4_all = open("task3_cost_estimation/pg_task3_workload1_query4.sql", "r").read()
-        cur.execute(query4_all)  # 创建获取Pset_value的函数
-        tuple = cur.fetchone()
-        cost_result.set_roof_area(tuple[0], "ft^2")
+        if self._query_variant == "rules":
+            # 与filter写法一样, all_metrics一次返回全部面积
+            return [], {"all_metrics": WORKLOAD1_RULES.to_sql(self._schema_version)}
+        if WORKLOAD1_VARIANTS[self._query_variant] is not None:
+            queries = read_sections(WORKLOAD1_VARIANTS[self._query_variant])
+            if self._query_variant == "containment":
+                queries.update(read_sections("pg_task3_workload1_containment.sql"))
+            return [], queries
+
+        query3_all = read_sql("pg_task3_workload1_query3.sql").split("-- ##")
+        setup = [query3_all[0]]  # 创建获取Pset_value的函数
+        if self._query_variant == "inherit":
+            # 按继承关系建表时ifcwall包含IfcWallStandardCase等子类型, 内外墙面积只需查询一次ifcwall
+            query3_all[1:] = read_sql("pg_task3_workload1_query3_inherit.sql").split("-- ##")[1:]
+        queries = {
+            "site_area": read_sql("pg_task3_workload1_query1.sql"),
+            "slab_area": read_sql("pg_task3_workload1_query2.sql"),
+            "interior_wall_area": query3_all[1],
+            "exterior_wall_area": query3_all[2],
+            "roof_area": read_sql("pg_task3_workload1_query4.sql"),
+        }
+        return setup, queries
+    
+    def get_query_variants(self):
+        '''
+        返回配置的workload1查询写法, 第一种为默认写法.
+        '''
+        return list(self._query_variants)
+
+    def set_query_variant(self, variant):
+        if variant not in self._query_variants:
+            raise ValueError(f"workload1 variant {variant} is not configured")
+        changed = variant != self._query_variant
+        self._query_variant = variant
+        if changed and len(self._run_sessions) > 0:
+            # 会话中的初始化语句与查询写法有关, 切换写法时(在计时之外)重新打开
+            self._open_run_sessions()
+
+    def __getstate__(self):
+        # 连接无法序列化, 并发负载测试的子进程中通过open_session打开自己的会话
+        state = self.__dict__.copy()
+        state["_run_sessions"] = []
+        return state
+
+    def _open_run_sessions(self):
+        '''
+        打开run使用的查询会话: thread方式每条查询一个会话, serial方式一个会话.
+        会话的初始化语句(如CREATE OR REPLACE FUNCTION)只在这里执行一次, 不计入run的耗时.
+        '''
+        self._close_run_sessions()
+        query_names = self.get_query_names()
+        count = len(query_names) if self._query_executor == "thread" and len(query_names) > 1 else 1
+        for _ in range(count):
+            self._run_sessions.append(self.open_session())
+
+    def _close_run_sessions(self):
+        sessions, self._run_sessions = self._run_sessions, []
+        for session in sessions:
+            self.close_session(session)
+
+    def get_query_names(self):
+        return list(self._load_workload1_queries()[1].keys())
+    
+    def open_session(self):
+        '''
+        打开一个独立的查询会话(数据库连接), 供并发负载测试的每个客户端使用.
+        '''
+        setup, queries = self._load_workload1_queries()
+        conn = self._connect_to_db(self._workload_database())
+        try:
+            cur = conn.cursor()
+            # 并发打开会话时, 同时执行CREATE OR REPLACE FUNCTION会报错(tuple concurrently updated), 因此用事务级锁串行化初始化语句
+            cur.execute("SELECT pg_advisory_xact_lock(3)")
+            for statement in setup:
+                cur.execute(statement)
+            conn.commit()
+            cur.close()
+            conn.autocommit = True
+        except Exception:
+            self._connections.putconn(conn)
+            raise
+        return {"conn": conn, "queries": queries}
+    
+    def execute_query(self, session, query_name):
+        cur = session["conn"].cursor()
+        try:
+            plan_capture.explain(cur, session["queries"][query_name], query_name)
+            cur.execute(session["queries"][query_name])
+            row = cur.fetchone()
+            # filter写法的查询一次返回全部面积
+            return row[0] if len(row) == 1 else row
+        finally:
+            cur.close()
+    
+    def close_session(self, session):
+        self._connections.putconn(session["conn"])
+    
+    def _execute_queries(self):
+        '''
+        执行workload1的全部查询, 返回{查询名: 结果}, 并把各查询的耗时之和与最长的耗时记入run_timings.
+        '''
+        query_names = self.get_query_names()
+        latencies = {}
+        def execute(session, query_name):
+            start_time = time.perf_counter()
+            result = self.execute_query(session, query_name)
+            latencies[query_name] = time.perf_counter() - start_time
+            return result
+
+        if len(self._run_sessions) == 0:
+            # 没有经过prepare_data(如直接连接已导入的数据库)时, 第一次run打开会话
+            self._open_run_sessions()
+        if self._query_executor == "thread" and len(query_names) > 1:
+            # 每条查询使用一个独立的会话(连接), 由线程池并发执行
+            with ThreadPoolExecutor(max_workers=len(query_names)) as pool:
+                futures = {query_name: pool.submit(execute, session, query_name) for query_name, session in zip(query_names, self._run_sessions)}
+                results = {query_name: future.result() for query_name, future in futures.items()}
+        else:
+            session = self._run_sessions[0]
+            results = {query_name: execute(session, query_name) for query_name in query_names}
+        self.run_timings = {"summed": sum(latencies.values()), "critical_path": max(latencies.values())}
+        return results
+
+    def _run_workload1(self):
+        cost_result = CostEstimator()
+        results = self._execute_queries()
+        if self._query_variant == "rules":
+            # 按规则的顺序返回每个度量, 由规则决定度量名和单位
+            for rule, value in zip(WORKLOAD1_RULES.rules, results["all_metrics"]):
+                cost_result.set_metric(rule.metric, value, rule.unit)
+            return cost_result
+        if "all_metrics" in results:
+            # 一条语句同时计算全部面积
+            site_area, slab_area, interior_wall_area, exterior_wall_area, roof_area = results["all_metrics"]
+        else:
+            # 1. 通过一楼所有的地板面积之和计算场地总面积
+            site_area = results["site_area"]
+            # 2. 计算地板面积之和
+            slab_area = results["slab_area"]
+            # 3. 计算内/外墙总面积
+            interior_wall_area = results["interior_wall_area"]
+            exterior_wall_area = results["exterior_wall_area"]
+            # 4. 计算屋面总面积
+            roof_area = results["roof_area"]
         
+        cost_result.set_site_area(site_area, "ft^2")
+        cost_result.set_slab_area(slab_area, "ft^2")
+        cost_result.set_interior_wall_area(interior_wall_area, "ft^2")
+        cost_result.set_exterior_wall_area(exterior_wall_area, "ft^2")
+        cost_result.set_roof_area(roof_area, "ft^2")
         return cost_result
     
     def cleanup(self):
-        conn = self._connect_to_db(self._user, self._password, self._host, self._port, self._user)
-        conn.autocommit = True
+        self._close_run_sessions()
         for database_name in self._database_name:
-            cursor = conn.cursor()
-            cursor.execute(f"DROP DATABASE {database_name}")
-            conn.commit()
-            cursor.close()
+            self._connections.drop_database(database_name)
         print(f"Cleaned up {len(self._database_name)} databases.")
-        conn.close()
+        self._database_name = []
         pass
\ No newline at end of file
@@ -1,25 +1,18 @@
 from util.common import Timer
-from task3_cost_estimation.task3 import CostEstimator
+from util.model_cache import open_model
+from task3_cost_estimation.task3 import DECOMPOSITION_RELATIONS
+from task3_cost_estimation.cost_rules import WORKLOAD1_RULES
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 import ifcopenshell
 import ifcopenshell.util.selector as selector
 import ifcopenshell.util.element
         
-def estimate_cost_workload1(ifc_file, name="20210219Architecture.ifc"):
+def get_site_area(ifc_file):
     '''
-    为模型20210219Architecture.ifc专门写的造价计算模型, 因为这个模型的楼板是通过IfcCovering表达的, 而不是通过IfcSlab.
-    
-    需要计算造价的实体类型有: 
-    1. 场地: 第一层的IfcCovering的投影面积
-    2. 地板: IfcCovering
-    3. 外墙 : IfcWall / IfcWallStandardCase, 通过Pset_WallCommon中的IscExternal属性是否为True判断是否为外墙
-    4. 内墙: IfcWall / IfcWallStandardCase, 通过Pset_WallCommon中的IscExternal属性是否为False判断是否为外墙
-    5. 屋顶: IfcRoof
+    通过一楼所有的地板(IfcCovering)面积之和计算场地总面积, 单位ft^2.
     '''
-    cost_result = CostEstimator()
-    cost_result.model_name = name
-
-    # 1. 通过一楼所有的地板面积之和计算场地总面积
     total_site_area = 0
     storeys = ifc_file.by_type("IfcBuildingstorey")
     for storey in storeys:
@@ -33,18 +26,24 @@ def estimate_cost_workload1(ifc_file, name="20210219Architecture.ifc"):
                 area = selector.get_element_value(element, "Dimensions.Area")
                 total_site_area += area
                 count_covering += 1
-    cost_result.set_site_area(total_site_area, "ft^2")
+    return total_site_area
 
-    # 2. 计算地板面积之和
+def get_slab_area(ifc_file):
+    '''
+    计算地板(IfcCovering)面积之和, 单位ft^2.
+    '''
     total_slab_area = 0
     coverings = ifc_file.by_type("IfcCovering")
     # print("coverings: ", len(coverings))
     for covering in coverings:
         area = selector.get_element_value(covering, "Dimensions.Area")
         total_slab_area += area
-    cost_result.set_slab_area(total_slab_area, "ft^2")
-    
-    # 3. 计算内/外墙总面积
+    return total_slab_area
+
+def get_wall_areas(ifc_file):
+    '''
+    计算内/外墙总面积, 返回(内墙面积, 外墙面积), 单位ft^2.
+    '''
     total_interior_wall_area = 0
     total_exterior_wall_area = 0
     walls = ifc_file.by_type("IfcWall")
@@ -55,33 +54,190 @@ def estimate_cost_workload1(ifc_file, name="20210219Architecture.ifc"):
             total_exterior_wall_area += area
         else:
             total_interior_wall_area += area
-    cost_result.set_exterior_wall_area(total_exterior_wall_area, "ft^2")
-    cost_result.set_interior_wall_area(total_interior_wall_area, "ft^2")
-    
-    # 4. 计算屋面总面积
+    return total_interior_wall_area, total_exterior_wall_area
+
+def get_roof_area(ifc_file):
+    '''
+    计算屋面(IfcRoof)总面积, 单位ft^2.
+    '''
     total_roof_area = 0
     roofs = ifc_file.by_type("IfcRoof")
     # print("roofs: ", len(roofs))
     for roof in roofs:
         area = selector.get_element_value(roof, "Dimensions.Area")
         total_roof_area += area
-    cost_result.set_roof_area(total_roof_area, "ft^2")
+    return total_roof_area
+
+# workload1中可以单独执行的查询, 与PGTask3Impl中的查询一一对应, 用于并发负载测试
+WORKLOAD1_QUERIES = {
+    "site_area": get_site_area,
+    "slab_area": get_slab_area,
+    "interior_wall_area": lambda ifc_file: get_wall_areas(ifc_file)[0],
+    "exterior_wall_area": lambda ifc_file: get_wall_areas(ifc_file)[1],
+    "roof_area": get_roof_area,
+}
+
+# estimate_cost_workload1的版本号, 修改造价计算逻辑后需要递增, 使缓存的基准结果失效
+ESTIMATOR_VERSION = 4
+
+def build_pset_index(ifc_file):
+    '''
+    一次遍历IfcRelDefinesByProperties和IfcRelDefinesByType, 建立属性索引{实体id: {属性集名: {属性名: 值}}}.
+    
+    结果与对每个实体调用ifcopenshell.util.element.get_psets相同(包括每个属性集中的"id"): 包含属性集和数量集(IfcElementQuantity),
+    先取实体类型(IfcTypeObject.HasPropertySets)的属性集, 再由实体自身的同名属性覆盖.
+    每个属性集只解析一次, 不再对每个实体重复查找IsDefinedBy关系.
+    '''
+    definitions = {}  # 属性集定义id -> (属性集名, {属性名: 值})
+    def read(definition):
+        if definition.id() not in definitions:
+            definitions[definition.id()] = (definition.Name, ifcopenshell.util.element.get_property_definition(definition))
+        return definitions[definition.id()]
+
+    # 实体id -> 类型对象, 与ifcopenshell.util.element.get_type一样只取第一个类型关系
+    element_types = {}
+    for rel in ifc_file.by_type("IfcRelDefinesByType"):
+        for element in rel.RelatedObjects:
+            element_types.setdefault(element.id(), rel.RelatingType)
+    # 实体id -> 实体自身的属性集定义
+    element_definitions = {}
+    for rel in ifc_file.by_type("IfcRelDefinesByProperties"):
+        definition = rel.RelatingPropertyDefinition
+        # IfcPropertySetDefinitionSet包装了一组属性集定义
+        related_definitions = definition.wrappedValue if definition.is_a("IfcPropertySetDefinitionSet") else (definition,)
+        for element in rel.RelatedObjects:
+            element_definitions.setdefault(element.id(), []).extend(related_definitions)
+
+    pset_index = {}
+    for element_id in element_types.keys() | element_definitions.keys():
+        psets = {}
+        element_type = element_types.get(element_id)
+        if element_type is not None:
+            for definition in element_type.HasPropertySets or []:
+                name, properties = read(definition)
+                psets.setdefault(name, {}).update(properties)
+        for definition in element_definitions.get(element_id, []):
+            name, properties = read(definition)
+            psets.setdefault(name, {}).update(properties)
+        pset_index[element_id] = psets
+    return pset_index
+
+def build_containment_index(ifc_file):
+    '''
+    一次遍历空间分解关系(见DECOMPOSITION_RELATIONS), 建立楼层的包含关系闭包{楼层id: {实体类型: [实体id, ...]}}.
     
-    return cost_result
+    每个楼层包含的实体与ifcopenshell.util.element.get_decomposition(storey)相同: 直接包含的构件、聚合的部件、
+    嵌套的对象、开洞及其填充构件, 以及子空间中的全部构件. 按楼层统计时只需按实体类型查表, 不再对每个楼层重复遍历关系.
+    '''
+    children = {}  # 父实体id -> 子实体列表
+    for relation, (relating, related) in DECOMPOSITION_RELATIONS.items():
+        try:
+            rels = ifc_file.by_type(relation)
+        except RuntimeError:
+            # 当前schema中没有该关系(如IFC4中的IfcRelAdheresToElement)
+            continue
+        for rel in rels:
+            related_objects = getattr(rel, related)
+            if isinstance(related_objects, ifcopenshell.entity_instance):
+                related_objects = (related_objects,)
+            children.setdefault(getattr(rel, relating).id(), []).extend(related_objects)
+
+    containment_index = {}
+    for storey in ifc_file.by_type("IfcBuildingStorey"):
+        visited = set()
+        queue = [storey.id()]
+        while queue:
+            for element in children.get(queue.pop(), []):
+                if element.id() not in visited:
+                    visited.add(element.id())
+                    queue.append(element.id())
+        elements_by_class = {}
+        for element_id in sorted(visited):
+            elements_by_class.setdefault(ifc_file.by_id(element_id).is_a(), []).append(element_id)
+        containment_index[storey.id()] = elements_by_class
+    return containment_index
+
+def estimate_cost_workload1(ifc_file, name="20210219Architecture.ifc"):
+    '''
+    为模型20210219Architecture.ifc专门写的造价计算模型, 因为这个模型的楼板是通过IfcCovering表达的, 而不是通过IfcSlab.
+    
+    需要计算造价的实体类型有: 
+    1. 场地: 第一层的IfcCovering的投影面积
+    2. 地板: IfcCovering
+    3. 外墙 : IfcWall / IfcWallStandardCase, 通过Pset_WallCommon中的IscExternal属性是否为True判断是否为外墙
+    4. 内墙: IfcWall / IfcWallStandardCase, 通过Pset_WallCommon中的IscExternal属性是否为False判断是否为外墙
+    5. 屋顶: IfcRoof
+    '''
+    # 全部度量由cost_rules.WORKLOAD1_RULES声明, 一次遍历属性索引同时计算
+    pset_index = build_pset_index(ifc_file)
+    containment_index = build_containment_index(ifc_file)
+    return WORKLOAD1_RULES.estimate(ifc_file, pset_index, containment_index, name)
+
+def estimate_workload(workload):
+    '''
+    解析模型并计算造价, 返回以模型文件名命名的CostEstimator. 不经过共享的模型缓存, 因此耗时总是包含模型解析;
+    作为进程池任务执行时模型在子进程中解析, 只有造价结果被传回主进程.
+    '''
+    return estimate_cost_workload1(ifcopenshell.open(workload), os.path.basename(workload))
+
+def estimate_workloads(workloads, workers=0):
+    '''
+    由workers个进程(0表示CPU核数)并行解析多个模型并计算造价, 按workloads的顺序返回CostEstimator列表.
+    只有一个模型或workers为1时在当前进程中依次计算.
+    '''
+    workers = min(workers if workers > 0 else os.cpu_count(), len(workloads))
+    if workers <= 1:
+        return [estimate_workload(workload) for workload in workloads]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(estimate_workload, workloads))
 
 class RawfileTask3Impl:
-    def __init__(self):
+    def __init__(self, args=None):
+        args = args or {}
         self.ifc_files = []
+        self._workloads = []
+        # run_workloads中解析模型和计算造价的进程数, 0表示CPU核数
+        self.workers = int(args.get("workers", 1))
+    
+    def __getstate__(self):
+        # ifcopenshell.file无法序列化, 在子进程中按路径重新打开模型
+        state = self.__dict__.copy()
+        state["ifc_files"] = []
+        return state
     
     @Timer.eclapse
     def prepare_data(self, workloads):
         for workload in workloads:
-            ifc_file = ifcopenshell.open(workload)
+            ifc_file = open_model(workload)
             self.ifc_files.append(ifc_file)
+            self._workloads.append(workload)
         pass
     @Timer.eclapse
     def run(self):
-        return estimate_cost_workload1(self.ifc_files[0])
+        return estimate_cost_workload1(self.open_session())
+    
+    @Timer.eclapse
+    def run_workloads(self):
+        '''
+        由workers个进程解析prepare_data中的全部模型并计算造价, 按模型顺序返回CostEstimator列表.
+        run只计算第一个已解析的模型, 用于与其他后端比较; run_workloads的耗时包含每个模型的解析.
+        '''
+        return estimate_workloads(self._workloads, self.workers)
+    
+    def get_query_names(self):
+        return list(WORKLOAD1_QUERIES.keys())
+    
+    def open_session(self):
+        if len(self.ifc_files) == 0:
+            self.ifc_files.append(open_model(self._workloads[0]))
+        return self.ifc_files[0]
+    
+    def execute_query(self, session, query_name):
+        return WORKLOAD1_QUERIES[query_name](session)
+    
+    def close_session(self, session):
+        pass
     
     def cleanup(self):
-        pass
\ No newline at end of file
+        self.ifc_files = []
+        self._workloads = []
\ No newline at end of file
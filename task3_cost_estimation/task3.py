@@ -1,5 +1,16 @@
 from util.common import square_unit_transform, float_equal
 
+# 空间分解关系 -> (父实体属性, 子实体属性), 与ifcopenshell.util.element.get_decomposition遍历的关系相同.
+# RAWFILE的包含关系索引和Postgresql的spatial_containment表都按这些关系计算楼层包含的全部构件
+DECOMPOSITION_RELATIONS = {
+    "IfcRelContainedInSpatialStructure": ("RelatingStructure", "RelatedElements"),
+    "IfcRelAggregates": ("RelatingObject", "RelatedObjects"),
+    "IfcRelNests": ("RelatingObject", "RelatedObjects"),
+    "IfcRelVoidsElement": ("RelatingBuildingElement", "RelatedOpeningElement"),
+    "IfcRelFillsElement": ("RelatingOpeningElement", "RelatedBuildingElement"),
+    "IfcRelAdheresToElement": ("RelatingElement", "RelatedSurfaceFeatures"),  # IFC4X3
+}
+
 class CostEstimator:
     '''
     造价结果类, 用于保存造价计算结果.
@@ -37,6 +48,8 @@ class CostEstimator:
             "total_interior_wall_area": 0, # 内墙总面积
             "total_roof_area": 0, # 屋面总面积
         }
+        # 度量的单位, 面积度量统一换算为m^2, 只有以其他单位设置的度量(见set_metric)才记录在这里
+        self._units = {}
         
         # 各个子项目单位造价
         self.pile_foundation_unit_cost = 300
@@ -70,6 +83,8 @@ class CostEstimator:
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, CostEstimator):
             return False
+        if self._metrics.keys() != __value._metrics.keys() or self._units != __value._units:
+            return False
         
         for key in self._cost_items.keys():
             if not float_equal(self._cost_items[key], __value._cost_items[key]):
@@ -83,6 +98,31 @@ class CostEstimator:
     def get_metric(self, metric_name):
         return self._metrics[metric_name]
     
+    def get_metric_unit(self, metric_name):
+        return self._units.get(metric_name, "m^2")
+    
+    def set_metric(self, metric_name, value, unit="m^2"):
+        '''
+        按度量名设置度量值. 内置的五个面积度量(如"total_site_area")同时更新由该度量计算的造价项;
+        其他度量(如CostRule定义的度量)只保存度量值, 面积单位的值换算为m^2, 其他单位(如"m^3"、"count")的值按原单位保存.
+        '''
+        setters = {
+            "total_site_area": self.set_site_area,
+            "total_slab_area": self.set_slab_area,
+            "total_exterior_wall_area": self.set_exterior_wall_area,
+            "total_interior_wall_area": self.set_interior_wall_area,
+            "total_roof_area": self.set_roof_area,
+        }
+        if metric_name in setters:
+            setters[metric_name](value, unit)
+            return
+        try:
+            self._metrics[metric_name] = square_unit_transform(value, unit)
+            self._units.pop(metric_name, None)
+        except ValueError:
+            self._metrics[metric_name] = value
+            self._units[metric_name] = unit
+    
     def set_site_area(self, area, unit="m^2"):
         self._metrics["total_site_area"] = square_unit_transform(area, unit)
         self._cost_items["total_preliminary_work_cost"] = self.preliminary_work_unit_cost * self._metrics["total_site_area"]
@@ -127,6 +167,18 @@ class CostEstimator:
         }
         pass
 
+    def to_dict(self):
+        return {"model_name": self.model_name, "metrics": dict(self._metrics), "units": dict(self._units), "cost_items": dict(self._cost_items)}
+    
+    @classmethod
+    def from_dict(cls, data):
+        estimator = cls()
+        estimator.model_name = data["model_name"]
+        estimator._metrics.update(data["metrics"])
+        estimator._units.update(data.get("units", {}))
+        estimator._cost_items.update(data["cost_items"])
+        return estimator
+
     def get_cost_items(self):
         # 返回cost_item所有字段的值
         return self._cost_items
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+from task3_cost_estimation.cost_rules import CostRule, CostRuleEngine, WORKLOAD1_RULES
+from task3_cost_estimation.rawfile_task3_impl import build_containment_index, build_pset_index, WORKLOAD1_QUERIES
+from task3_cost_estimation.task3 import CostEstimator
+from task3_cost_estimation.test_workload_generator import create_seed_model
+
+
+class CostRuleEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.ifc_file = create_seed_model(os.path.join(self.tmp_dir.name, "seed.ifc"))
+        self.pset_index = build_pset_index(self.ifc_file)
+        self.containment_index = build_containment_index(self.ifc_file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_workload1_rules_match_selector_queries(self):
+        metrics = WORKLOAD1_RULES.evaluate(self.ifc_file, self.pset_index, self.containment_index)
+        for metric, query_name in [("total_site_area", "site_area"), ("total_slab_area", "slab_area"),
+                                   ("total_interior_wall_area", "interior_wall_area"),
+                                   ("total_exterior_wall_area", "exterior_wall_area"), ("total_roof_area", "roof_area")]:
+            self.assertAlmostEqual(metrics[metric], WORKLOAD1_QUERIES[query_name](self.ifc_file), places=6, msg=metric)
+
+    def test_filters_and_storey_scope(self):
+        engine = CostRuleEngine([
+            CostRule("total_exterior_wall_area", ["IfcWallStandardCase"], ("Dimensions", "Area"),
+                     filters=[("Pset_WallCommon", "IsExternal", "=", True)], storey="Level 2"),
+            CostRule("total_roof_area", ["IfcRoof"], ("Dimensions", "Area"), storey="Level 2"),
+        ])
+        metrics = engine.evaluate(self.ifc_file, self.pset_index, self.containment_index)
+        # 二楼只有一面IfcWallStandardCase通过墙类型成为外墙, 面积依次为10.0 + 1.5 * i
+        self.assertAlmostEqual(metrics["total_exterior_wall_area"], 10.0 + 1.5 * 11)
+        self.assertAlmostEqual(metrics["total_roof_area"], 10.0 + 1.5 * 13)
+        self.assertEqual(set(metrics), {"total_exterior_wall_area", "total_roof_area"})
+
+    def test_estimate_uses_set_metric(self):
+        cost_result = WORKLOAD1_RULES.estimate(self.ifc_file, self.pset_index, self.containment_index, "seed")
+        expected = CostEstimator()
+        for metric, value in WORKLOAD1_RULES.evaluate(self.ifc_file, self.pset_index, self.containment_index).items():
+            expected.set_metric(metric, value, "ft^2")
+        self.assertEqual(cost_result, expected)
+
+    def test_estimate_keeps_custom_metrics(self):
+        engine = CostRuleEngine([
+            CostRule("total_slab_area", ["IfcCovering"], ("Dimensions", "Area"), "ft^2"),
+            CostRule("level2_wall_area", ["IfcWall"], ("Dimensions", "Area"), "ft^2", storey="Level 2"),
+        ])
+        metrics = engine.evaluate(self.ifc_file, self.pset_index, self.containment_index)
+        cost_result = engine.estimate(self.ifc_file, self.pset_index, self.containment_index, "seed")
+        # 面积单位的自定义度量换算为m^2, 不影响造价项
+        self.assertAlmostEqual(cost_result.get_metric("level2_wall_area"), metrics["level2_wall_area"] * 0.092903)
+        self.assertEqual(cost_result.get_metric_unit("level2_wall_area"), "m^2")
+        self.assertAlmostEqual(cost_result.get_cost_items()["total_pile_foundation_cost"], 300 * metrics["total_slab_area"] * 0.092903)
+        self.assertEqual(cost_result.get_cost_items()["total_interior_wall_cost"], 0)
+        # 其他单位的度量按原单位保存, 并参与比较和序列化
+        cost_result.set_metric("wall_count", 4, "count")
+        self.assertEqual(cost_result.get_metric_unit("wall_count"), "count")
+        self.assertEqual(CostEstimator.from_dict(cost_result.to_dict()), cost_result)
+        self.assertNotEqual(cost_result, engine.estimate(self.ifc_file, self.pset_index, self.containment_index, "seed"))
+
+    def test_to_sql_expands_subtypes(self):
+        sql = WORKLOAD1_RULES.to_sql("IFC4")
+        self.assertIn("'IfcWallStandardCase'", sql)
+        self.assertIn("spatial_containment", sql)
+        # 缺少IsExternal的墙计入内墙, 与各个查询写法相同
+        self.assertIn("IS NOT TRUE", sql)
+        for rule in WORKLOAD1_RULES.rules:
+            self.assertIn(f"AS {rule.metric}", sql)
+        self.assertLess(sql.index("total_site_area"), sql.index("total_roof_area"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import ifcopenshell
+from task3_cost_estimation.ground_truth_cache import GroundTruthCache
+from task3_cost_estimation.rawfile_task3_impl import estimate_cost_workload1
+from task3_cost_estimation.test_workload_generator import create_seed_model
+
+class GroundTruthCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_path = os.path.join(self.temp_dir, "seed.ifc")
+        create_seed_model(self.model_path)
+        self.cache = GroundTruthCache(os.path.join(self.temp_dir, "ground_truth"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.get(self.model_path))
+        expected = estimate_cost_workload1(ifcopenshell.open(self.model_path))
+        self.cache.put(self.model_path, expected)
+        cached = self.cache.get(self.model_path)
+        self.assertEqual(cached, expected)
+        self.assertEqual(cached.get_cost_items(), expected.get_cost_items())
+
+    def test_keyed_by_content_and_version(self):
+        self.cache.put(self.model_path, estimate_cost_workload1(ifcopenshell.open(self.model_path)))
+        # 复制到其他路径的相同模型命中缓存
+        copied_path = os.path.join(self.temp_dir, "copied.ifc")
+        shutil.copy(self.model_path, copied_path)
+        self.assertIsNotNone(GroundTruthCache(self.cache.cache_dir).get(copied_path))
+        # 模型内容改变或造价计算逻辑升级后缓存失效
+        with open(copied_path, "a") as f:
+            f.write("\n")
+        self.assertIsNone(self.cache.get(copied_path))
+        with mock.patch("task3_cost_estimation.ground_truth_cache.ESTIMATOR_VERSION", 0):
+            self.assertIsNone(self.cache.get(self.model_path))
+
+if __name__ == '__main__':
+    unittest.main()
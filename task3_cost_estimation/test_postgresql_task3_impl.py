@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+import ifcopenshell
+import psycopg2
+
+from task3_cost_estimation.cost_rules import CostRule, CostRuleEngine, WORKLOAD1_RULES
+from task3_cost_estimation.postgresql_task3_impl import PGTask3Impl
+from task3_cost_estimation.rawfile_task3_impl import build_containment_index, build_pset_index, estimate_cost_workload1
+from task3_cost_estimation.test_workload_generator import create_seed_model
+
+# 连接参数取自libpq的环境变量, 连接不上时跳过测试
+PG_ARGS = {
+    "host": os.environ.get("PGHOST", "localhost"),
+    "port": os.environ.get("PGPORT", "5432"),
+    "user": os.environ.get("PGUSER", "postgres"),
+    "password": os.environ.get("PGPASSWORD", ""),
+}
+
+
+def _pg_available():
+    try:
+        psycopg2.connect(database="postgres", connect_timeout=3, **PG_ARGS).close()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+@unittest.skipUnless(_pg_available(), "PostgreSQL is not available")
+class PGTask3ImplTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        # 数据库名取自模型文件名
+        self.model_path = os.path.join(self.tmp_dir.name, "vulcandb_test_seed.ifc")
+        create_seed_model(self.model_path)
+        self.task3 = PGTask3Impl(dict(PG_ARGS, load_mode="copy", build_property_table="True", build_containment_table="True",
+                                      workload1_variants="flat,filter,containment,rules"))
+        self.task3._connections.drop_database("vulcandb_test_seed")
+        self.task3.prepare_data([self.model_path])
+
+    def tearDown(self):
+        self.task3.cleanup()
+        self.tmp_dir.cleanup()
+
+    def test_variants_match_rawfile(self):
+        # 种子模型中有一面墙的IsExternal来自墙类型
+        expected = estimate_cost_workload1(ifcopenshell.open(self.model_path))
+        for variant in self.task3.get_query_variants():
+            self.task3.set_query_variant(variant)
+            self.assertEqual(self.task3.run(), expected, msg=variant)
+
+    def test_rules_sql_matches_evaluate(self):
+        ifc_file = ifcopenshell.open(self.model_path)
+        engine = CostRuleEngine(WORKLOAD1_RULES.rules + [
+            CostRule("level2_exterior_wall_area", ["IfcWall"], ("Dimensions", "Area"), "ft^2",
+                     filters=[("Pset_WallCommon", "IsExternal", "=", True)], storey="Level 2"),
+            CostRule("level1_interior_wall_area", ["IfcWall"], ("Dimensions", "Area"), "ft^2",
+                     filters=[("Pset_WallCommon", "IsExternal", "!=", True)], storey="Level 1"),
+        ])
+        expected = engine.evaluate(ifc_file, build_pset_index(ifc_file), build_containment_index(ifc_file))
+        with self.task3._connections.connection("vulcandb_test_seed") as conn:
+            cursor = conn.cursor()
+            cursor.execute(engine.to_sql(ifc_file.schema))
+            row = cursor.fetchone()
+            cursor.close()
+        self.assertEqual(len(row), len(engine.rules))
+        for rule, value in zip(engine.rules, row):
+            self.assertAlmostEqual(value, expected[rule.metric], places=6, msg=rule.metric)
+
+if __name__ == '__main__':
+    unittest.main()
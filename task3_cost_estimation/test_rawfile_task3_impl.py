@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+import ifcopenshell
+import ifcopenshell.guid
+import ifcopenshell.util.element
+
+from task3_cost_estimation.rawfile_task3_impl import build_containment_index, build_pset_index, estimate_cost_workload1, WORKLOAD1_QUERIES
+from task3_cost_estimation.rawfile_task3_impl import RawfileTask3Impl
+from task3_cost_estimation.task3 import CostEstimator
+from task3_cost_estimation.test_workload_generator import create_seed_model
+from task3_cost_estimation.workload_generator import generate_scaled_workload
+
+
+class PsetIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.ifc_file = create_seed_model(os.path.join(self.tmp_dir.name, "seed.ifc"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_index_matches_get_psets(self):
+        # 数量集和IfcPropertySetDefinitionSet也应被索引
+        wall = self.ifc_file.by_type("IfcWall")[0]
+        quantity = self.ifc_file.create_entity("IfcElementQuantity", GlobalId=ifcopenshell.guid.new(), Name="Qto_WallBaseQuantities",
+                                               Quantities=[self.ifc_file.create_entity("IfcQuantityArea", Name="NetSideArea", AreaValue=4.5)])
+        self.ifc_file.create_entity("IfcRelDefinesByProperties", GlobalId=ifcopenshell.guid.new(), RelatedObjects=[wall],
+                                    RelatingPropertyDefinition=quantity)
+        pset_index = build_pset_index(self.ifc_file)
+        for element in self.ifc_file.by_type("IfcElement"):
+            self.assertEqual(pset_index.get(element.id(), {}), ifcopenshell.util.element.get_psets(element, should_inherit=True))
+        self.assertEqual(pset_index[wall.id()]["Qto_WallBaseQuantities"]["NetSideArea"], 4.5)
+
+    def test_containment_matches_get_decomposition(self):
+        # 墙上的开洞及其填充的门, 以及聚合到一楼地板中的部件, 都应属于所在楼层
+        def create(ifc_class, **kwargs):
+            return self.ifc_file.create_entity(ifc_class, GlobalId=ifcopenshell.guid.new(), **kwargs)
+        wall = self.ifc_file.by_type("IfcWall")[0]
+        opening = create("IfcOpeningElement")
+        create("IfcRelVoidsElement", RelatingBuildingElement=wall, RelatedOpeningElement=opening)
+        create("IfcRelFillsElement", RelatingOpeningElement=opening, RelatedBuildingElement=create("IfcDoor"))
+        create("IfcRelAggregates", RelatingObject=self.ifc_file.by_type("IfcCovering")[0], RelatedObjects=[create("IfcCovering")])
+        containment_index = build_containment_index(self.ifc_file)
+        for storey in self.ifc_file.by_type("IfcBuildingStorey"):
+            expected = {}
+            for element in ifcopenshell.util.element.get_decomposition(storey):
+                expected.setdefault(element.is_a(), set()).add(element.id())
+            self.assertEqual({ifc_class: set(ids) for ifc_class, ids in containment_index[storey.id()].items()}, expected)
+        self.assertIn("IfcDoor", containment_index[self.ifc_file.by_type("IfcBuildingStorey")[0].id()])
+
+    def test_estimate_matches_selector_queries(self):
+        expected = CostEstimator()
+        expected.model_name = "seed"
+        expected.set_site_area(WORKLOAD1_QUERIES["site_area"](self.ifc_file), "ft^2")
+        expected.set_slab_area(WORKLOAD1_QUERIES["slab_area"](self.ifc_file), "ft^2")
+        expected.set_interior_wall_area(WORKLOAD1_QUERIES["interior_wall_area"](self.ifc_file), "ft^2")
+        expected.set_exterior_wall_area(WORKLOAD1_QUERIES["exterior_wall_area"](self.ifc_file), "ft^2")
+        expected.set_roof_area(WORKLOAD1_QUERIES["roof_area"](self.ifc_file), "ft^2")
+        self.assertEqual(estimate_cost_workload1(self.ifc_file, "seed"), expected)
+
+class RawfileTask3ImplTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.workloads = [os.path.join(self.tmp_dir.name, "seed.ifc")]
+        create_seed_model(self.workloads[0])
+        for scale in [2, 3]:
+            self.workloads.append(os.path.join(self.tmp_dir.name, f"seed_x{scale}.ifc"))
+            generate_scaled_workload(self.workloads[0], scale, self.workloads[-1])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parallel_workloads_match_serial(self):
+        expected = [estimate_cost_workload1(ifcopenshell.open(workload), os.path.basename(workload)) for workload in self.workloads]
+        task3 = RawfileTask3Impl({"workers": "2"})
+        task3.prepare_data(self.workloads)
+        results = task3.run_workloads()
+        self.assertEqual([result.model_name for result in results], [os.path.basename(workload) for workload in self.workloads])
+        self.assertEqual(results, expected)
+        self.assertEqual(task3.run(), estimate_cost_workload1(ifcopenshell.open(self.workloads[0])))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+import ifcopenshell
+import ifcopenshell.guid
+
+from task3_cost_estimation.rawfile_task3_impl import estimate_cost_workload1
+from task3_cost_estimation.workload_generator import generate_scaled_workload, get_expected_metrics
+
+
+def create_seed_model(path):
+    '''
+    创建一个包含两层楼的最小IFC4模型: 每层有2个IfcCovering, 2个IfcWall, 2个IfcWallStandardCase和1个IfcRoof,
+    每个构件都有Dimensions.Area属性, 墙体通过Pset_WallCommon.IsExternal区分内外墙.
+    '''
+    ifc_file = ifcopenshell.file(schema="IFC4")
+
+    def create(ifc_class, **kwargs):
+        return ifc_file.create_entity(ifc_class, GlobalId=ifcopenshell.guid.new(), **kwargs)
+
+    def create_pset(name, properties):
+        values = [ifc_file.create_entity("IfcPropertySingleValue", Name=key, NominalValue=value)
+                  for key, value in properties.items()]
+        return create("IfcPropertySet", Name=name, HasProperties=values)
+
+    def add_pset(element, name, properties):
+        create("IfcRelDefinesByProperties", RelatedObjects=[element], RelatingPropertyDefinition=create_pset(name, properties))
+
+    project = create("IfcProject", Name="Task3 Seed")
+    site = create("IfcSite", Name="Site")
+    building = create("IfcBuilding", Name="Building")
+    create("IfcRelAggregates", RelatingObject=project, RelatedObjects=[site])
+    create("IfcRelAggregates", RelatingObject=site, RelatedObjects=[building])
+
+    # 外墙属性定义在墙类型上, 测试类型属性集的继承
+    wall_type = create("IfcWallType", Name="Exterior", PredefinedType="STANDARD",
+                       HasPropertySets=[create_pset("Pset_WallCommon", {"IsExternal": ifc_file.createIfcBoolean(True)})])
+    typed_walls = []
+
+    storeys = []
+    area = 10.0
+    for name in ["Level 1", "Level 2"]:
+        storey = create("IfcBuildingStorey", Name=name)
+        storeys.append(storey)
+        elements = []
+        for ifc_class, is_external in [("IfcCovering", None), ("IfcCovering", None), ("IfcWall", True), ("IfcWall", False),
+                                       ("IfcWallStandardCase", None), ("IfcWallStandardCase", False), ("IfcRoof", None)]:
+            element = create(ifc_class)
+            add_pset(element, "Dimensions", {"Area": ifc_file.createIfcAreaMeasure(area)})
+            if is_external is not None:
+                add_pset(element, "Pset_WallCommon", {"IsExternal": ifc_file.createIfcBoolean(is_external)})
+            elif ifc_class.startswith("IfcWall"):
+                typed_walls.append(element)
+            elements.append(element)
+            area += 1.5
+        create("IfcRelContainedInSpatialStructure", RelatedElements=elements, RelatingStructure=storey)
+    create("IfcRelAggregates", RelatingObject=building, RelatedObjects=storeys)
+    create("IfcRelDefinesByType", RelatedObjects=typed_walls, RelatingType=wall_type)
+    ifc_file.write(path)
+    return ifc_file
+
+
+class WorkloadGeneratorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.seed_path = os.path.join(self.tmp_dir.name, "seed.ifc")
+        create_seed_model(self.seed_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_metrics_scale_predictably(self):
+        seed_metrics = estimate_cost_workload1(ifcopenshell.open(self.seed_path))._metrics
+        scaled_path = os.path.join(self.tmp_dir.name, "seed_x3.ifc")
+        generate_scaled_workload(self.seed_path, 3, scaled_path)
+        scaled = ifcopenshell.open(scaled_path)
+        self.assertEqual(len(scaled.by_type("IfcBuildingStorey")), 6)
+        self.assertEqual(len(scaled.by_type("IfcWall")), 3 * 8)
+
+        expected = get_expected_metrics(seed_metrics, 3)
+        actual = estimate_cost_workload1(scaled)._metrics
+        for metric, value in expected.items():
+            self.assertAlmostEqual(actual[metric], value, places=6)
+
+    def test_scale_one_keeps_model(self):
+        scaled_path = os.path.join(self.tmp_dir.name, "seed_x1.ifc")
+        generate_scaled_workload(self.seed_path, 1, scaled_path)
+        self.assertEqual(len(list(ifcopenshell.open(scaled_path))), len(list(ifcopenshell.open(self.seed_path))))
+
+if __name__ == '__main__':
+    unittest.main()
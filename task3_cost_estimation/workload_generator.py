@@ -0,0 +1,131 @@
+import argparse
+import ifcopenshell
+import ifcopenshell.guid
+
+# 需要复制的构件类型, 与estimate_cost_workload1中参与造价计算的实体类型一致
+REPLICATED_CLASSES = ["IfcWall", "IfcCovering", "IfcRoof"]
+
+
+def _copy_entity(ifc_file, entity):
+    '''
+    浅复制一个实体, 引用的其他实体(placement, representation等)保持共享; 带GlobalId的实体生成新的GlobalId.
+    '''
+    attributes = entity.get_info(recursive=False)
+    del attributes["id"]
+    del attributes["type"]
+    if "GlobalId" in attributes:
+        attributes["GlobalId"] = ifcopenshell.guid.new()
+    return ifc_file.create_entity(entity.is_a(), **attributes)
+
+
+def _copy_property_definition(ifc_file, definition):
+    '''
+    复制属性集(IfcPropertySet)或数量集(IfcElementQuantity), 集合中的每个属性/数量也一并复制.
+    '''
+    copied = _copy_entity(ifc_file, definition)
+    if definition.is_a("IfcPropertySet"):
+        copied.HasProperties = [_copy_entity(ifc_file, prop) for prop in definition.HasProperties]
+    elif definition.is_a("IfcElementQuantity"):
+        copied.Quantities = [_copy_entity(ifc_file, quantity) for quantity in definition.Quantities]
+    return copied
+
+
+def _copy_element(ifc_file, element, owner_history):
+    '''
+    复制一个构件及其全部属性集/数量集, 复制品与原构件共享类型(IfcRelDefinesByType)与几何表达.
+    '''
+    copied = _copy_entity(ifc_file, element)
+    for rel in element.IsDefinedBy:
+        if not rel.is_a("IfcRelDefinesByProperties"):
+            continue
+        definition = rel.RelatingPropertyDefinition
+        if not (definition.is_a("IfcPropertySet") or definition.is_a("IfcElementQuantity")):
+            continue
+        ifc_file.create_entity("IfcRelDefinesByProperties", GlobalId=ifcopenshell.guid.new(), OwnerHistory=owner_history,
+                               RelatedObjects=[copied], RelatingPropertyDefinition=_copy_property_definition(ifc_file, definition))
+    return copied
+
+
+def generate_scaled_workload(seed_path, scale, output_path):
+    '''
+    以seed_path中的模型为种子, 生成scale倍规模的IFC模型并写入output_path.
+
+    每一轮复制会为每个IfcBuildingStorey新建一个楼层(名称加上轮次后缀, 聚合到原楼层所属的建筑中),
+    并把原楼层中的IfcWall/IfcCovering/IfcRoof(含子类型)及其属性集复制到新楼层中.
+    因此生成模型的造价指标满足:
+    1. 地板、内墙、外墙、屋面面积为种子模型的scale倍;
+    2. 场地面积不变(只统计名为Level 1的楼层, 复制出的楼层不会被计入).
+    '''
+    if scale < 1:
+        raise ValueError(f"Scale factor must be a positive integer, got {scale}")
+    ifc_file = ifcopenshell.open(seed_path)
+    storeys = ifc_file.by_type("IfcBuildingStorey")
+    elements = []
+    for ifc_class in REPLICATED_CLASSES:
+        elements.extend(ifc_file.by_type(ifc_class))
+
+    # 记录每个构件所在的楼层, 以及与构件关联的类型关系
+    element_storey = {}
+    for element in elements:
+        for rel in element.ContainedInStructure:
+            element_storey[element.id()] = rel.RelatingStructure.id()
+    # 复制品统一在最后追加到原有的聚合关系与类型关系中, 避免每一轮都重建RelatedObjects列表
+    aggregate_rels = {}
+    for storey in storeys:
+        for rel in storey.Decomposes:
+            aggregate_rels.setdefault(rel.id(), [])
+    type_rels = {}
+    for element in elements:
+        for rel in element.IsTypedBy:
+            type_rels.setdefault(rel.id(), [])
+
+    for k in range(2, scale + 1):
+        storey_copies = {}
+        for storey in storeys:
+            storey_copy = _copy_entity(ifc_file, storey)
+            storey_copy.Name = f"{storey.Name} ({k})" if storey.Name else None
+            storey_copies[storey.id()] = (storey_copy, [])
+            for rel in storey.Decomposes:
+                aggregate_rels[rel.id()].append(storey_copy)
+
+        for element in elements:
+            element_copy = _copy_element(ifc_file, element, element.OwnerHistory)
+            if element.id() in element_storey and element_storey[element.id()] in storey_copies:
+                storey_copies[element_storey[element.id()]][1].append(element_copy)
+            for rel in element.IsTypedBy:
+                type_rels[rel.id()].append(element_copy)
+
+        for storey_copy, contained_elements in storey_copies.values():
+            if len(contained_elements) == 0:
+                continue
+            ifc_file.create_entity("IfcRelContainedInSpatialStructure", GlobalId=ifcopenshell.guid.new(),
+                                   OwnerHistory=storey_copy.OwnerHistory, RelatedElements=contained_elements,
+                                   RelatingStructure=storey_copy)
+
+    for rel_id, copies in list(aggregate_rels.items()) + list(type_rels.items()):
+        if len(copies) > 0:
+            rel = ifc_file.by_id(rel_id)
+            rel.RelatedObjects = list(rel.RelatedObjects) + copies
+
+    ifc_file.write(output_path)
+    return ifc_file
+
+
+def get_expected_metrics(seed_metrics, scale):
+    '''
+    根据种子模型的造价指标(CostEstimator._metrics)计算scale倍模型的期望指标.
+    '''
+    expected = {}
+    for metric, value in seed_metrics.items():
+        expected[metric] = value if metric == "total_site_area" else value * scale
+    return expected
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate a scaled Task3 workload from a seed IFC model.")
+    parser.add_argument("seed", help="path of the seed IFC model, e.g. datasets/task3/workload1.ifc")
+    parser.add_argument("scale", type=int, help="scale factor, e.g. 10")
+    parser.add_argument("output", help="path of the generated IFC model")
+    args = parser.parse_args()
+    generate_scaled_workload(args.seed, args.scale, args.output)
+    print(f"Generated {args.scale}x workload from {args.seed} to {args.output}")
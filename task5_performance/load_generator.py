@@ -0,0 +1,176 @@
+import os
+import json
+import time
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from util.benchmark import summarize
+
+_slot_counter = None  # 开环模式下各客户端共享的请求计数器, 由进程池/线程池的initializer设置
+
+
+def _init_client(slot_counter):
+    global _slot_counter
+    _slot_counter = slot_counter
+
+
+def _next_slot():
+    '''
+    认领下一个请求编号, 空闲的客户端先认领, 慢的客户端不会占住后面的请求.
+    '''
+    with _slot_counter.get_lock():
+        slot = _slot_counter.value
+        _slot_counter.value += 1
+    return slot
+
+
+def _run_client(backend, query_names, client_id, start_time, duration, rate):
+    '''
+    单个客户端的执行循环, 在[start_time, start_time + duration)内不断向backend发出查询.
+
+    rate为None时为闭环模式: 客户端上一个查询返回后立即发出下一个查询;
+    否则为开环模式: 第k个请求计划在start_time + k / rate时刻发出, 空闲的客户端从共享计数器认领下一个请求,
+    延迟从计划发出时刻开始计算, 因此包含了后端饱和时的排队时间.
+
+    返回[(查询名, 延迟秒数, 是否成功, 完成时刻, 错误信息), ...], 成功的请求错误信息为None
+    '''
+    session = backend.open_session()
+    samples = []
+    try:
+        end_time = start_time + duration
+        delay = start_time - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+        i = 0
+        while True:
+            if rate is None:
+                query_name = query_names[(client_id + i) % len(query_names)]
+                issued_at = time.time()
+            else:
+                slot = _next_slot()
+                query_name = query_names[slot % len(query_names)]
+                issued_at = start_time + slot / rate
+            if issued_at >= end_time:
+                break
+            delay = issued_at - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            error = None
+            try:
+                backend.execute_query(session, query_name)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            finished_at = time.time()
+            samples.append((query_name, finished_at - issued_at, error is None, finished_at, error))
+            i += 1
+    finally:
+        backend.close_session(session)
+    return samples
+
+
+class LoadGenerator:
+    '''
+    Task5并发负载生成器: 使用线程池或进程池模拟多个客户端, 并发执行Task3 workload1中的查询.
+
+    backend需要实现get_query_names/open_session/execute_query/close_session, 每个客户端使用独立的会话.
+    进程池模式下backend会被序列化到子进程中, 由子进程自行打开会话.
+    '''
+    def __init__(self, backend, query_names=None, executor="thread", startup_delay=1.0):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor: {executor}")
+        for method in ("get_query_names", "open_session", "execute_query", "close_session"):
+            if not callable(getattr(backend, method, None)):
+                raise ValueError(f"{type(backend).__name__} does not support Task5: missing {method}. "
+                                 "Only backends with workload1 queries (e.g. POSTGRESQL, RAWFILE) can be load tested.")
+        self._backend = backend
+        self._query_names = query_names if query_names is not None else backend.get_query_names()
+        if len(self._query_names) == 0:
+            raise ValueError(f"{type(backend).__name__} does not provide any query for load test.")
+        self._executor = executor
+        self._startup_delay = startup_delay  # 留给客户端建立会话的时间, 不计入测试时长
+
+    def run_level(self, concurrency, duration, rate=None):
+        '''
+        以指定并发数运行duration秒, 返回该负载水平下的吞吐量与延迟统计.
+        '''
+        pool_class = ThreadPoolExecutor if self._executor == "thread" else ProcessPoolExecutor
+        slot_counter = multiprocessing.Value("q", 0)
+        start_time = time.time() + self._startup_delay
+        with pool_class(max_workers=concurrency, initializer=_init_client, initargs=(slot_counter,)) as pool:
+            futures = [pool.submit(_run_client, self._backend, self._query_names, i, start_time, duration, rate)
+                       for i in range(concurrency)]
+            samples = [sample for future in futures for sample in future.result()]
+
+        succeeded = [sample for sample in samples if sample[2]]
+        elapsed = max([sample[3] for sample in samples] + [start_time + duration]) - start_time
+        level = {
+            "concurrency": concurrency,
+            "target_rate": rate,
+            "duration": duration,
+            "elapsed": elapsed,
+            "requests": len(samples),
+            "errors": len(samples) - len(succeeded),
+            "error_messages": {},  # 错误信息 -> 次数
+            "throughput": len(succeeded) / elapsed,
+            "latency": summarize([sample[1] for sample in succeeded]) if len(succeeded) > 0 else None,
+            "queries": {},
+        }
+        for sample in samples:
+            if not sample[2]:
+                level["error_messages"][sample[4]] = level["error_messages"].get(sample[4], 0) + 1
+        for query_name in self._query_names:
+            latencies = [sample[1] for sample in succeeded if sample[0] == query_name]
+            if len(latencies) > 0:
+                level["queries"][query_name] = summarize(latencies)
+        return level
+
+    def run(self, concurrency_levels, duration, rate=None):
+        '''
+        依次在每个并发水平下运行负载, 返回吞吐量-延迟曲线.
+        '''
+        curve = []
+        for concurrency in concurrency_levels:
+            print(f"Task5 running {concurrency} clients for {duration} seconds...")
+            level = self.run_level(concurrency, duration, rate)
+            curve.append(level)
+            print_level(level)
+        return curve
+
+
+def find_saturation(curve, threshold=0.95):
+    '''
+    返回吞吐量首次达到峰值吞吐量threshold倍时的负载水平, 继续增加并发只会增加延迟.
+    '''
+    peak = max(level["throughput"] for level in curve)
+    for level in curve:
+        if level["throughput"] >= peak * threshold:
+            return level
+    return None
+
+
+def print_level(level):
+    latency = level["latency"]
+    if latency is None:
+        print(f"  clients={level['concurrency']:<4} throughput={level['throughput']:.2f} req/s, all {level['errors']} requests failed")
+    else:
+        print(f"  clients={level['concurrency']:<4} throughput={level['throughput']:.2f} req/s "
+              f"p50={latency['p50']:.6f}s p95={latency['p95']:.6f}s p99={latency['p99']:.6f}s errors={level['errors']}")
+    for error, count in level.get("error_messages", {}).items():
+        print(f"    {count} x {error}")
+
+
+def dump_curve(result_dir, curve, metadata=None):
+    '''
+    将吞吐量-延迟曲线写入result_dir下的JSON文件, 返回文件路径.
+    '''
+    os.makedirs(result_dir, exist_ok=True)
+    result_path = os.path.join(result_dir, f"task5_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    saturation = find_saturation(curve)
+    with open(result_path, "w") as f:
+        json.dump({
+            "metadata": metadata or {},
+            "saturation_concurrency": saturation["concurrency"] if saturation else None,
+            "curve": curve,
+        }, f, indent=2)
+    return result_path
@@ -0,0 +1,105 @@
+import json
+import tempfile
+import time
+import unittest
+
+from task5_performance.load_generator import LoadGenerator, find_saturation, dump_curve
+
+
+class CountingBackend:
+    '''
+    实现Task5会话协议的最小后端, 记录打开/关闭的会话数, 名为"fail"的查询总是失败.
+    '''
+    def __init__(self, query_names=("area", "fail")):
+        self.query_names = list(query_names)
+        self.opened = 0
+        self.closed = 0
+
+    def get_query_names(self):
+        return list(self.query_names)
+
+    def open_session(self):
+        self.opened += 1
+        return {"executed": 0}
+
+    def execute_query(self, session, query_name):
+        if query_name == "fail":
+            raise RuntimeError("query failed")
+        session["executed"] += 1
+        return 1.0
+
+    def close_session(self, session):
+        self.closed += 1
+
+
+class SlowFirstSessionBackend(CountingBackend):
+    '''
+    第一个打开的会话每个查询耗时0.3秒, 其余会话立即返回.
+    '''
+    def open_session(self):
+        session = super().open_session()
+        session["slow"] = self.opened == 1
+        return session
+
+    def execute_query(self, session, query_name):
+        if session["slow"]:
+            time.sleep(0.3)
+        return super().execute_query(session, query_name)
+
+
+class NoQueryBackend:
+    def run(self):
+        pass
+
+
+class LoadGeneratorTest(unittest.TestCase):
+    def test_closed_loop_counts_requests_and_errors(self):
+        backend = CountingBackend()
+        level = LoadGenerator(backend, startup_delay=0).run_level(2, 0.2)
+        self.assertEqual(backend.opened, 2)
+        self.assertEqual(backend.closed, 2)
+        self.assertGreater(level["requests"], 0)
+        self.assertGreater(level["errors"], 0)
+        self.assertLess(level["errors"], level["requests"])
+        self.assertEqual(list(level["queries"].keys()), ["area"])
+        self.assertEqual(level["latency"]["count"], level["requests"] - level["errors"])
+        self.assertEqual(level["error_messages"], {"RuntimeError: query failed": level["errors"]})
+
+    def test_open_loop_follows_rate(self):
+        level = LoadGenerator(CountingBackend(["area"]), startup_delay=0).run_level(2, 0.5, rate=20)
+        # 第k个请求计划在k / rate时刻发出, 0.5秒内共10个请求
+        self.assertEqual(level["requests"], 10)
+        self.assertEqual(level["errors"], 0)
+        self.assertEqual(level["target_rate"], 20)
+
+    def test_open_loop_slots_go_to_idle_clients(self):
+        level = LoadGenerator(SlowFirstSessionBackend(["area"]), startup_delay=0).run_level(2, 0.5, rate=20)
+        self.assertEqual(level["requests"], 10)
+        # 慢客户端阻塞时由空闲客户端认领后续请求, 不会按客户端编号固定分配请求使其排队
+        self.assertLess(level["latency"]["p50"], 0.1)
+
+    def test_open_loop_process_executor(self):
+        level = LoadGenerator(CountingBackend(["area"]), executor="process", startup_delay=0.5).run_level(2, 0.5, rate=20)
+        # 计数器在子进程之间共享, 每个请求只被认领一次
+        self.assertEqual(level["requests"], 10)
+
+    def test_rejects_backend_without_queries(self):
+        with self.assertRaises(ValueError):
+            LoadGenerator(NoQueryBackend())
+        with self.assertRaises(ValueError):
+            LoadGenerator(CountingBackend([]))
+        with self.assertRaises(ValueError):
+            LoadGenerator(CountingBackend(), executor="fork")
+
+    def test_saturation_and_dump(self):
+        curve = [{"concurrency": 1, "throughput": 10.0}, {"concurrency": 2, "throughput": 19.5},
+                 {"concurrency": 4, "throughput": 20.0}]
+        self.assertEqual(find_saturation(curve)["concurrency"], 2)
+        with tempfile.TemporaryDirectory() as result_dir:
+            with open(dump_curve(result_dir, curve, {"test_class": "TEST"}), "r") as f:
+                result = json.load(f)
+        self.assertEqual(result["saturation_concurrency"], 2)
+        self.assertEqual(result["metadata"], {"test_class": "TEST"})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import os
+import json
+import math
+import time
+import statistics
+import contextlib
+
+
+def percentile(samples, p):
+    '''
+    计算样本的p分位数(0 <= p <= 100), 在相邻两个样本之间做线性插值.
+    '''
+    if len(samples) == 0:
+        raise ValueError("Cannot compute percentile of empty samples.")
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * p / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples):
+    '''
+    将一组耗时样本(秒)汇总为统计指标.
+    '''
+    return {
+        "count": len(samples),
+        "mean": statistics.fmean(samples),
+        "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+        "max": max(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+    }
+
+
+class BenchmarkRecorder:
+    '''
+    基准测试结果记录器, 按(后端, 阶段)保存每一次执行的耗时样本, 并输出为JSON结果文件.
+
+    Timer.eclapse只打印单次的墙钟时间, 无法区分性能回退与共享环境下的抖动,
+    因此每个阶段先执行warmup次预热(不计入样本), 再执行iterations次并记录全部样本.
+    
+    profiler: 可选的util.profiler.PhaseProfiler, 设置后每次计入样本的执行都会被cProfile和tracemalloc剖析,
+    此时的耗时包含剖析开销, 不应与未剖析的结果直接比较.
+
+    plan_capture: 可选的util.plan_capture.PlanCapture. measure的capture_plans为True时, 在计时的执行之后单独再执行一次
+    (不计时、不剖析), 其中捕获的查询计划按(后端, 阶段)写入结果, EXPLAIN ANALYZE的耗时不会进入样本.
+    '''
+    def __init__(self, profiler=None, plan_capture=None):
+        self._samples = {}  # (backend, phase) -> [seconds, ...]
+        self._profile_reports = {}  # (backend, phase) -> 剖析摘要
+        self._plan_reports = {}  # (backend, phase) -> {查询标签: 执行计划及耗时/缓冲区统计}
+        self.profiler = profiler
+        self.plan_capture = plan_capture
+        self.started_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    def record(self, backend, phase, seconds):
+        self._samples.setdefault((backend, phase), []).append(seconds)
+
+    def measure(self, backend, phase, func, *args, warmup=0, iterations=1, reset=None, breakdown=None, capture_plans=False, **kwargs):
+        '''
+        重复执行func并记录耗时, 返回最后一次执行的结果.
+
+        reset: 可选的回调函数, 在两次执行之间调用(不计时), 例如在重复导入数据前调用cleanup.
+        breakdown: 可选的回调函数, 每次计入样本的执行结束后调用, 返回{步骤名: 秒数},
+        各步骤的耗时记录为"<phase>.<步骤名>", 例如数据导入中的加载与建索引耗时.
+        capture_plans: 为True且设置了plan_capture时, 计时的执行结束后再执行一次func并捕获其中的查询计划.
+        只用于可以重复执行的阶段(如查询), 不用于数据导入.
+        '''
+        result = None
+        for i in range(warmup + iterations):
+            if i > 0 and reset is not None:
+                reset()
+            with contextlib.ExitStack() as stack:
+                if i >= warmup and self.profiler is not None:
+                    stack.enter_context(self.profiler.phase(backend, phase))
+                result, time_cost = self._timed_call(func, args, kwargs)
+            if i >= warmup:
+                self.record(backend, phase, time_cost)
+                if breakdown is not None:
+                    for step, seconds in breakdown().items():
+                        self.record(backend, f"{phase}.{step}", seconds)
+        if capture_plans and self.plan_capture is not None:
+            with self.plan_capture.phase(backend, phase):
+                func(*args, **kwargs)
+        return result
+
+    def _timed_call(self, func, args, kwargs):
+        start_time = time.perf_counter()
+        result = func(*args, **kwargs)
+        return result, time.perf_counter() - start_time
+
+    def get_samples(self, backend, phase):
+        return self._samples.get((backend, phase), [])
+
+    def merge(self, other):
+        '''
+        合并另一个记录器(例如子进程中产生的记录器)的全部样本.
+        '''
+        for (backend, phase), samples in other._samples.items():
+            self._samples.setdefault((backend, phase), []).extend(samples)
+        self._profile_reports.update(other._profile_reports)
+        self._plan_reports.update(other._plan_reports)
+
+    def dump_profiles(self):
+        '''
+        写出剖析文件并保存剖析摘要和捕获的查询计划. 之后不再剖析和捕获, 记录器可以被序列化传回主进程.
+        '''
+        if self.profiler is not None:
+            self._profile_reports.update(self.profiler.dump())
+            self.profiler = None
+        if self.plan_capture is not None:
+            # 不在phase()之内捕获的计划(如直接调用capture)没有对应的阶段
+            self._plan_reports.update({key: plans for key, plans in self.plan_capture.reports().items() if key[0] is not None})
+            self.plan_capture = None
+
+    def results(self):
+        results = []
+        for (backend, phase), samples in self._samples.items():
+            result = {
+                "backend": backend,
+                "phase": phase,
+                "samples": samples,
+                "summary": summarize(samples),
+            }
+            if (backend, phase) in self._profile_reports:
+                result["profile"] = self._profile_reports[(backend, phase)]
+            if (backend, phase) in self._plan_reports:
+                result["plans"] = self._plan_reports[(backend, phase)]
+            results.append(result)
+        return results
+
+    def print_summary(self):
+        print(f"{'backend':<12}{'phase':<36}{'n':>4}{'p50(s)':>12}{'p95(s)':>12}{'p99(s)':>12}{'stddev(s)':>12}")
+        for result in self.results():
+            summary = result["summary"]
+            print(f"{result['backend']:<12}{result['phase']:<36}{summary['count']:>4}"
+                  f"{summary['p50']:>12.6f}{summary['p95']:>12.6f}{summary['p99']:>12.6f}{summary['stddev']:>12.6f}")
+
+    def dump(self, result_dir, metadata=None):
+        '''
+        将全部样本及统计结果写入result_dir下的JSON文件, 返回文件路径.
+        '''
+        self.dump_profiles()
+        os.makedirs(result_dir, exist_ok=True)
+        file_name = f"benchmark_{self.started_at.replace('-', '').replace(':', '').replace('T', '_')}.json"
+        result_path = os.path.join(result_dir, file_name)
+        with open(result_path, "w") as f:
+            json.dump({
+                "started_at": self.started_at,
+                "metadata": metadata or {},
+                "results": self.results(),
+            }, f, indent=2)
+        return result_path
@@ -0,0 +1,90 @@
+import os
+from collections import OrderedDict
+
+import ifcopenshell
+
+
+def _current_rss():
+    '''
+    返回当前进程的常驻内存(字节), 无法获取时返回None.
+    '''
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class ModelCache:
+    '''
+    已解析IFC模型的缓存, 使同一次测试中的多个后端共享同一个ifcopenshell.file对象, 避免重复解析大模型.
+
+    缓存以(文件真实路径, 文件大小, 修改时间)为键, 文件被修改后会重新解析.
+    每个模型占用的内存按解析前后进程RSS的增量估算(不少于文件大小), 超过max_bytes时按LRU顺序淘汰,
+    但至少保留最近使用的一个模型. max_bytes为0时不缓存.
+    缓存返回的模型被多个后端共享, 使用者不应修改模型.
+    '''
+    def __init__(self, max_bytes=8 * 1024 ** 3):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._models = OrderedDict()  # key -> (ifc_file, estimated_bytes)
+        self._used_bytes = 0
+
+    def _get_key(self, path):
+        stat = os.stat(path)
+        return (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+
+    def open(self, path):
+        if self.max_bytes <= 0:
+            return ifcopenshell.open(path)
+
+        key = self._get_key(path)
+        if key in self._models:
+            self.hits += 1
+            self._models.move_to_end(key)
+            return self._models[key][0]
+
+        self.misses += 1
+        # 同一路径的旧版本模型已经失效
+        for stale_key in [k for k in self._models if k[0] == key[0]]:
+            self._remove(stale_key)
+
+        rss_before = _current_rss()
+        ifc_file = ifcopenshell.open(path)
+        rss_after = _current_rss()
+        estimated_bytes = key[1]
+        if rss_before is not None and rss_after is not None:
+            estimated_bytes = max(estimated_bytes, rss_after - rss_before)
+
+        self._models[key] = (ifc_file, estimated_bytes)
+        self._used_bytes += estimated_bytes
+        while self._used_bytes > self.max_bytes and len(self._models) > 1:
+            self._remove(next(iter(self._models)))
+        return ifc_file
+
+    def _remove(self, key):
+        _, estimated_bytes = self._models.pop(key)
+        self._used_bytes -= estimated_bytes
+
+    def clear(self):
+        self._models.clear()
+        self._used_bytes = 0
+
+    def __len__(self):
+        return len(self._models)
+
+
+# 进程内共享的缓存默认不缓存, 由run_all.py按config.ini中的model_cache_size开启
+_model_cache = ModelCache(max_bytes=0)
+
+
+def get_model_cache():
+    return _model_cache
+
+
+def open_model(path):
+    '''
+    通过进程内共享的模型缓存打开IFC模型, 用于替代ifcopenshell.open.
+    '''
+    return _model_cache.open(path)
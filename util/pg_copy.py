@@ -0,0 +1,137 @@
+import math
+
+import schema.compile_schema as compile_schema
+
+# COPY文本格式中需要转义的字符
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def format_array_element(value):
+    '''
+    将数组中的一个元素转换为PostgreSQL数组字面量中的写法.
+    '''
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return format_scalar(value)
+
+
+def format_scalar(value):
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
+        return repr(value)
+    return str(value)
+
+
+def format_copy_value(value):
+    '''
+    将一个Python值转换为COPY ... FROM STDIN文本格式中的一个字段:
+    None -> \\N, bool -> t/f, list/tuple -> {a,b,c}, 其余值转换为字符串并转义反斜杠、制表符和换行符.
+    '''
+    if value is None:
+        return "\\N"
+    if isinstance(value, (list, tuple)):
+        value = "{" + ",".join(format_array_element(x) for x in value) + "}"
+    else:
+        value = format_scalar(value)
+    return value.translate(_COPY_ESCAPES)
+
+
+def format_copy_row(values):
+    return "\t".join(format_copy_value(value) for value in values) + "\n"
+
+
+class CopyRowReader:
+    '''
+    把逐行生成的COPY文本包装为文件对象, 供cursor.copy_expert按块读取, 不需要先在内存中拼出整张表的数据.
+    '''
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._buffer = ""
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def get_entity_columns(entity):
+    '''
+    返回实体表的列名: id及实体的全部非DERIVED属性, 与schema/compile_schema.py生成的表结构一致.
+    '''
+    column_names = ["id"]
+    for i in range(len(entity)):
+        if entity.attribute_type(i) == "DERIVED":
+            continue
+        if entity.is_a("ifcpropertysinglevalue") and entity.attribute_name(i) == "NominalValue":
+            column_names.extend(column_name for column_name, _ in compile_schema.NOMINAL_VALUE_COLUMNS)
+        else:
+            column_names.append(entity.attribute_name(i))
+    return column_names
+
+
+def get_nominal_values(value):
+    '''
+    返回IfcPropertySingleValue.NominalValue对应的各列的值(见compile_schema.NOMINAL_VALUE_COLUMNS):
+    [str(wrappedValue), IFC类型名, 数值或None, 布尔值或None]. IfcLogical的UNKNOWN不是布尔值.
+    '''
+    if value is None:
+        return [None] * len(compile_schema.NOMINAL_VALUE_COLUMNS)
+    wrapped = value.wrappedValue
+    number = float(wrapped) if isinstance(wrapped, (int, float)) and not isinstance(wrapped, bool) else None
+    flag = wrapped if isinstance(wrapped, bool) else None
+    return [str(wrapped), value.is_a(), number, flag]
+
+
+def get_entity_row(entity):
+    '''
+    返回实体对应的一行记录(与get_entity_columns的列一一对应), 转换规则与PGTask3Impl._get_insert_sql相同.
+    '''
+    row = [entity.id()]
+    for i in range(len(entity)):
+        attr_name = entity.attribute_name(i)
+        attr_type = entity.attribute_type(i)
+        attr_value = entity[i]
+
+        if attr_type == "DERIVED":
+            continue
+        if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
+            row.extend(get_nominal_values(attr_value))
+        elif attr_value is None:
+            row.append(None)
+        elif attr_type == "STRING" or attr_type == "ENUMERATION" or attr_type == "LOGICAL":
+            row.append(str(attr_value))
+        elif attr_type == "ENTITY INSTANCE":
+            row.append(attr_value.id())
+        elif attr_type == "AGGREGATE OF ENTITY INSTANCE":
+            row.append([x.id() for x in attr_value])
+        else:
+            row.append(attr_value)
+    return row
+
+
+def copy_rows(cursor, table_name, column_names, rows):
+    '''
+    通过COPY table_name (column_names) FROM STDIN将rows(每行为一个值列表)写入表中.
+    '''
+    columns = ",".join(f"\"{column_name}\"" for column_name in column_names)
+    cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN", CopyRowReader(format_copy_row(row) for row in rows))
+
+
+def copy_entities(cursor, entity_type, entities):
+    '''
+    通过一次COPY将同一类型的实体写入对应的实体表.
+    '''
+    copy_rows(cursor, entity_type, get_entity_columns(entities[0]), (get_entity_row(entity) for entity in entities))
@@ -0,0 +1,241 @@
+import hashlib
+import ifcopenshell
+import psycopg2.extras
+
+import util.pg_copy as pg_copy
+import schema.compile_schema as compile_schema
+
+# 记录数据库中每个实体的匹配键和行哈希, 用于模型新版本的增量导入
+ENTITY_KEY_TABLE = "ifc_entity_key"
+
+
+def _iter_references(value):
+    '''
+    依次返回属性值中引用的实体(不含选择类型中没有实体id的带类型的值).
+    '''
+    if isinstance(value, ifcopenshell.entity_instance):
+        if value.id() != 0:
+            yield value
+    elif isinstance(value, tuple):
+        for x in value:
+            yield from _iter_references(x)
+
+
+def _get_attributes(entity):
+    return [entity[i] for i in range(len(entity)) if entity.attribute_type(i) != "DERIVED"]
+
+
+def _get_value_key(value, keys):
+    if isinstance(value, ifcopenshell.entity_instance):
+        if value.id() == 0:
+            return (value.is_a(), _get_value_key(value.wrappedValue, keys))
+        # 只有引用成环时被引用的实体还没有键
+        return keys.get(value.id(), "cycle:" + value.is_a())
+    if isinstance(value, tuple):
+        return tuple(_get_value_key(x, keys) for x in value)
+    return value
+
+
+def _hash(value):
+    return hashlib.blake2b(repr(value).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_entity_keys(ifc_file):
+    '''
+    返回{实体id: 匹配键}. IfcRoot的子类型用GlobalId作为键("g:<GlobalId>"), 其余实体用结构哈希("h:<哈希值>"),
+    结构哈希由实体类型、属性值和被引用实体的键计算(Merkle哈希), 与实体id无关, 因此重新编号的实体也能匹配.
+    '''
+    keys = {}
+    visiting = set()
+    for entity in ifc_file:
+        stack = [entity]
+        while len(stack) > 0:
+            current = stack[-1]
+            current_id = current.id()
+            if current_id in keys:
+                stack.pop()
+                continue
+            if current.is_a("IfcRoot"):
+                keys[current_id] = "g:" + current.GlobalId
+                stack.pop()
+                continue
+            attributes = _get_attributes(current)
+            if current_id not in visiting:
+                visiting.add(current_id)
+                children = [x for attr in attributes for x in _iter_references(attr)
+                            if x.id() not in keys and x.id() not in visiting]
+                if len(children) > 0:
+                    stack.extend(children)
+                    continue
+            keys[current_id] = "h:" + _hash((current.is_a(), _get_value_key(tuple(attributes), keys)))
+            visiting.discard(current_id)
+            stack.pop()
+    return keys
+
+
+class DeltaImporter:
+    '''
+    把IFC模型的新版本与数据库中已导入的版本比较, 只执行有变化的INSERT/UPDATE/DELETE.
+
+    完整导入后调用record记录每个实体的匹配键(见get_entity_keys)和行哈希. 增量导入时新版本中的实体按匹配键对应到
+    数据库中的实体并沿用其id(引用也随之改写), 找不到对应实体的分配新id; 行哈希不同的实体通过INSERT ... ON CONFLICT
+    更新, 数据库中没有被对应到的实体被删除. 整个增量导入在一个事务中完成.
+    '''
+    def __init__(self, inheritance=False):
+        self.inheritance = inheritance  # 新的实体类型是否按继承关系建表, 与完整导入时的storage一致
+        self._layouts = {}  # 实体类型 -> (行中引用列的位置, 是否可以建表)
+        self._schema_files = {}
+
+    def _get_layout(self, entity):
+        entity_type = entity.is_a()
+        if entity_type not in self._layouts:
+            # NominalValue对应多列, 因此按列名确定引用列在行中的位置
+            column_names = pg_copy.get_entity_columns(entity)
+            ref_positions = []
+            for i in range(len(entity)):
+                if entity.is_a("ifcpropertysinglevalue") and entity.attribute_name(i) == "NominalValue":
+                    continue
+                if entity.attribute_type(i) in ("ENTITY INSTANCE", "AGGREGATE OF ENTITY INSTANCE"):
+                    ref_positions.append(column_names.index(entity.attribute_name(i)))
+            try:
+                compile_schema.get_create_table_sql(entity)
+                supported = True
+            except Exception:
+                # 含有嵌套聚合等属性的实体没有对应的表, 只记录匹配键
+                supported = False
+            self._layouts[entity_type] = (ref_positions, supported)
+        return self._layouts[entity_type]
+
+    def _get_row(self, entity, id_map):
+        '''
+        返回实体对应的一行记录, 实体id和引用都改写为数据库中的id, 聚合值转换为list.
+        '''
+        row = pg_copy.get_entity_row(entity)
+        row[0] = id_map[row[0]]
+        ref_positions, _ = self._get_layout(entity)
+        for position in ref_positions:
+            value = row[position]
+            if isinstance(value, list):
+                row[position] = [id_map.get(x, x) for x in value]
+            elif value is not None:
+                row[position] = id_map.get(value, value)
+        return [list(value) if isinstance(value, tuple) else value for value in row]
+
+    def has_entity_keys(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (ENTITY_KEY_TABLE,))
+        exists = cursor.fetchone()[0]
+        cursor.close()
+        return exists
+
+    def _create_key_table(self, cursor):
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {ENTITY_KEY_TABLE} (id INTEGER PRIMARY KEY, entity_type VARCHAR(150), "
+                       "entity_key VARCHAR(150), row_hash CHAR(32))")
+
+    def record(self, conn, ifc_file):
+        '''
+        记录完整导入的模型中每个实体的匹配键和行哈希, 数据库中的实体id与文件中的id相同.
+        '''
+        keys = get_entity_keys(ifc_file)
+        id_map = {entity_id: entity_id for entity_id in keys}
+        cursor = conn.cursor()
+        self._create_key_table(cursor)
+        cursor.execute(f"TRUNCATE {ENTITY_KEY_TABLE}")
+        rows = ((entity.id(), entity.is_a(), keys[entity.id()], _hash(self._get_row(entity, id_map))) for entity in ifc_file)
+        pg_copy.copy_rows(cursor, ENTITY_KEY_TABLE, ["id", "entity_type", "entity_key", "row_hash"], rows)
+        conn.commit()
+        cursor.close()
+
+    def _read_entity_keys(self, conn):
+        '''
+        返回{匹配键: [(id, 实体类型, 行哈希), ...]}.
+        '''
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT id, entity_type, entity_key, row_hash FROM {ENTITY_KEY_TABLE} ORDER BY id")
+        stored = {}
+        for entity_id, entity_type, entity_key, row_hash in cursor:
+            stored.setdefault(entity_key, []).append((entity_id, entity_type, row_hash))
+        cursor.close()
+        return stored
+
+    def diff(self, stored, ifc_file):
+        '''
+        比较新版本与数据库中的实体(_read_entity_keys的返回值), 返回增量导入需要执行的修改:
+        {"upserts": {实体类型: [行, ...]}, "deletes": {实体类型: [id, ...]}, "keys": [(id, 实体类型, 匹配键, 行哈希), ...],
+         "unchanged": 未变化的实体数量}
+        '''
+        keys = get_entity_keys(ifc_file)
+        next_id = max((entity_id for entries in stored.values() for entity_id, _, _ in entries), default=0) + 1
+        remaining = {key: sorted(entries, reverse=True) for key, entries in stored.items()}  # 同一个键下按id从小到大对应
+        id_map = {}
+        matched = {}  # 新版本中的实体id -> 数据库中对应实体的(实体类型, 行哈希)
+        for entity in sorted(ifc_file, key=lambda x: x.id()):
+            candidates = remaining.get(keys[entity.id()])
+            if candidates:
+                entity_id, entity_type, row_hash = candidates.pop()
+                matched[entity.id()] = (entity_type, row_hash)
+            else:
+                entity_id = next_id
+                next_id += 1
+            id_map[entity.id()] = entity_id
+
+        delta = {"upserts": {}, "deletes": {}, "keys": [], "unchanged": 0}
+        for entity in ifc_file:
+            entity_type = entity.is_a()
+            row = self._get_row(entity, id_map)
+            row_hash = _hash(row)
+            stored_type, stored_hash = matched.get(entity.id(), (None, None))
+            if stored_type == entity_type and stored_hash == row_hash:
+                delta["unchanged"] += 1
+                continue
+            if stored_type is not None and stored_type != entity_type:
+                # 同一个GlobalId的实体类型发生变化, 从原来的表中删除
+                delta["deletes"].setdefault(stored_type, []).append(row[0])
+            if self._get_layout(entity)[1]:
+                delta["upserts"].setdefault(entity_type, []).append(row)
+            delta["keys"].append((row[0], entity_type, keys[entity.id()], row_hash))
+        for entries in remaining.values():
+            for entity_id, entity_type, _ in entries:
+                delta["deletes"].setdefault(entity_type, []).append(entity_id)
+        return delta
+
+    def _get_schema_file(self, schema_version):
+        if schema_version not in self._schema_files:
+            self._schema_files[schema_version] = ifcopenshell.file(schema=schema_version)
+        return self._schema_files[schema_version]
+
+    def apply(self, conn, ifc_file):
+        '''
+        在一个事务中把ifc_file与数据库中已记录的版本之间的差异写入数据库, 返回各类修改的数量.
+        '''
+        delta = self.diff(self._read_entity_keys(conn), ifc_file)
+        schema_file = self._get_schema_file(ifc_file.schema)
+        cursor = conn.cursor()
+        deleted_ids = []
+        for entity_type, entity_ids in delta["deletes"].items():
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (entity_type.lower(),))
+            if cursor.fetchone()[0]:
+                cursor.execute(f"DELETE FROM ONLY {entity_type} WHERE id = ANY(%s)", (entity_ids,))
+            deleted_ids.extend(entity_ids)
+        for entity_type, rows in delta["upserts"].items():
+            entity = schema_file.create_entity(entity_type)
+            for _, create_table_sql in compile_schema.get_create_table_sqls(entity, inheritance=self.inheritance):
+                cursor.execute(create_table_sql)
+            column_names = pg_copy.get_entity_columns(entity)
+            columns = ",".join(f"\"{column_name}\"" for column_name in column_names)
+            updates = ",".join(f"\"{column_name}\" = EXCLUDED.\"{column_name}\"" for column_name in column_names[1:])
+            conflict_action = f"DO UPDATE SET {updates}" if len(column_names) > 1 else "DO NOTHING"
+            psycopg2.extras.execute_values(cursor, f"INSERT INTO {entity_type} ({columns}) VALUES %s ON CONFLICT (id) {conflict_action}", rows)
+
+        # 类型发生变化的实体的键被删除后重新写入
+        cursor.execute(f"DELETE FROM {ENTITY_KEY_TABLE} WHERE id = ANY(%s)", (deleted_ids,))
+        psycopg2.extras.execute_values(cursor, f"INSERT INTO {ENTITY_KEY_TABLE} (id, entity_type, entity_key, row_hash) VALUES %s "
+                                       "ON CONFLICT (id) DO UPDATE SET entity_type = EXCLUDED.entity_type, "
+                                       "entity_key = EXCLUDED.entity_key, row_hash = EXCLUDED.row_hash", delta["keys"])
+        conn.commit()
+        cursor.close()
+
+        upserted = sum(len(rows) for rows in delta["upserts"].values())
+        stats = {"upserted": upserted, "deleted": len(deleted_ids), "unchanged": delta["unchanged"]}
+        print(f"Delta import: {stats['upserted']} upserted, {stats['deleted']} deleted, {stats['unchanged']} unchanged.")
+        return stats
@@ -0,0 +1,181 @@
+import os
+import math
+import uuid
+import multiprocessing
+import psycopg2
+import ifcopenshell
+from concurrent.futures import ProcessPoolExecutor
+
+import util.pg_copy as pg_copy
+import schema.compile_schema as compile_schema
+from util.model_cache import open_model
+
+
+# 正在导入的模型: 模型路径 -> 主进程中已解析的ifcopenshell.file. 导入进程由fork启动, 直接继承这里的模型, 不再重新解析
+_forked_models = {}
+
+
+def _load_partitions(model_path, conn_args, partitions, gid):
+    '''
+    子进程任务: 在一个独立的连接中通过COPY导入分配给该进程的全部分区.
+
+    使用两阶段提交, 导入完成后只执行PREPARE TRANSACTION, 由主进程统一提交. 返回导入的实体数量.
+    '''
+    ifc_file = _forked_models.get(model_path)
+    if ifc_file is None:
+        # 不支持fork的平台上, 每个进程各自解析一次模型
+        ifc_file = ifcopenshell.open(model_path)
+    conn = psycopg2.connect(**conn_args)
+    try:
+        conn.tpc_begin(gid)
+        cursor = conn.cursor()
+        loaded = 0
+        for entity_type, entity_ids in partitions:
+            cursor.execute("SAVEPOINT copy_entities")
+            try:
+                pg_copy.copy_entities(cursor, entity_type, [ifc_file.by_id(entity_id) for entity_id in entity_ids])
+                loaded += len(entity_ids)
+            except psycopg2.errors.UniqueViolation:
+                # 数据库中已经导入过该模型
+                cursor.execute("ROLLBACK TO SAVEPOINT copy_entities")
+            cursor.execute("RELEASE SAVEPOINT copy_entities")
+        cursor.close()
+        conn.tpc_prepare()
+        return loaded
+    finally:
+        conn.close()
+
+
+class ParallelLoader:
+    '''
+    多进程并行导入IFC模型: 按实体类型划分分区(实体较多的类型再按id范围切分),
+    分区按大小分配给workers个进程, 每个进程使用独立的连接通过COPY导入.
+
+    各进程导入完成后执行PREPARE TRANSACTION, 全部成功后由主进程统一COMMIT PREPARED,
+    任一进程失败则全部ROLLBACK PREPARED, 整个模型的导入是原子的.
+    每个进程占用一个预备事务, 因此进程数不超过数据库的max_prepared_transactions, 其为0时无法并行导入.
+
+    模型只在主进程中解析一次(或由调用者传入已解析的模型), 导入进程由fork启动, 继承主进程中的模型对象后只执行COPY;
+    不支持fork的平台上每个导入进程各自解析一次模型.
+    '''
+    def __init__(self, conn_args, workers=0, partitions_per_worker=4, primary_key=True, inheritance=False):
+        self.conn_args = conn_args  # psycopg2.connect的参数, 包含database
+        self.primary_key = primary_key  # 新建的实体表是否带主键约束
+        self.inheritance = inheritance  # 是否按继承关系建表, 见compile_schema.get_inherited_create_table_sqls
+        self.workers = workers if workers > 0 else os.cpu_count()
+        self.partitions_per_worker = partitions_per_worker
+
+    def _get_partitions(self, ifc_file):
+        '''
+        返回[(实体类型, [实体id, ...]), ...], 每个分区不超过总实体数 / (workers * partitions_per_worker)个实体.
+        '''
+        entity_groups = {}
+        for entity in ifc_file:
+            entity_groups.setdefault(entity.is_a(), []).append(entity.id())
+        total = sum(len(entity_ids) for entity_ids in entity_groups.values())
+        partition_size = max(1, math.ceil(total / (self.workers * self.partitions_per_worker)))
+
+        partitions = []
+        for entity_type, entity_ids in entity_groups.items():
+            entity_ids.sort()
+            for i in range(0, len(entity_ids), partition_size):
+                partitions.append((entity_type, entity_ids[i:i + partition_size]))
+        return partitions
+
+    def _assign_partitions(self, partitions, workers=None):
+        '''
+        按实体数量从大到小依次把分区分配给当前负载最小的进程, workers默认为self.workers.
+        '''
+        workers = workers if workers is not None else self.workers
+        assignments = [[] for _ in range(min(workers, len(partitions)))]
+        loads = [0] * len(assignments)
+        for partition in sorted(partitions, key=lambda x: len(x[1]), reverse=True):
+            i = loads.index(min(loads))
+            assignments[i].append(partition)
+            loads[i] += len(partition[1])
+        return assignments
+
+    def _create_tables(self, conn, ifc_file, entity_inited):
+        '''
+        导入前创建模型中所有尚未创建的实体表并提交, 子进程中只执行COPY.
+        '''
+        cursor = conn.cursor()
+        for entity in ifc_file:
+            if entity.is_a() in entity_inited:
+                continue
+            for entity_type, create_table_sql in compile_schema.get_create_table_sqls(entity, self.primary_key, self.inheritance):
+                if entity_type not in entity_inited:
+                    entity_inited.add(entity_type)
+                    cursor.execute(create_table_sql)
+        conn.commit()
+        cursor.close()
+
+    def _get_max_prepared_transactions(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("SHOW max_prepared_transactions")
+        max_prepared_transactions = int(cursor.fetchone()[0])
+        cursor.close()
+        conn.commit()
+        return max_prepared_transactions
+
+    def _get_workers(self, max_prepared_transactions):
+        '''
+        返回实际使用的进程数: 每个进程占用一个预备事务, 进程数不超过max_prepared_transactions.
+        数据库不允许预备事务时无法原子导入, 直接报错, 不会退回到各进程分别提交.
+        '''
+        if max_prepared_transactions <= 0:
+            raise RuntimeError("Parallel load requires two-phase commit, but max_prepared_transactions is 0. "
+                               "Set max_prepared_transactions to at least load_workers in postgresql.conf, or use load_mode = copy.")
+        if max_prepared_transactions < self.workers:
+            print(f"max_prepared_transactions is {max_prepared_transactions}, loading with {max_prepared_transactions} "
+                  f"workers instead of {self.workers}.")
+        return min(self.workers, max_prepared_transactions)
+
+    def _finish_prepared(self, conn, gids, commit):
+        command = "COMMIT PREPARED" if commit else "ROLLBACK PREPARED"
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute("SELECT gid FROM pg_prepared_xacts WHERE gid = ANY(%s)", (gids,))
+        for (gid,) in cursor.fetchall():
+            cursor.execute(f"{command} %s", (gid,))
+        cursor.close()
+        conn.autocommit = False
+
+    def load(self, conn, model_path, entity_inited=None, ifc_file=None):
+        '''
+        将model_path中的模型并行导入conn所连接的数据库, 返回导入的实体数量.
+        conn只用于建表和提交预备事务, entity_inited为已经创建的实体表. ifc_file为调用者已经解析的该模型, 为None时在这里解析.
+        '''
+        entity_inited = entity_inited if entity_inited is not None else set()
+        ifc_file = ifc_file if ifc_file is not None else open_model(model_path)
+        self._create_tables(conn, ifc_file, entity_inited)
+        workers = self._get_workers(self._get_max_prepared_transactions(conn))
+        assignments = self._assign_partitions(self._get_partitions(ifc_file), workers)
+        if len(assignments) == 0:
+            return 0
+
+        load_id = uuid.uuid4().hex
+        gids = [f"ifc_load_{load_id}_{i}" for i in range(len(assignments))]
+        print(f"Loading {model_path} with {len(assignments)} workers...")
+
+        mp_context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+        if mp_context is not None:
+            _forked_models[model_path] = ifc_file
+        try:
+            with ProcessPoolExecutor(max_workers=len(assignments), mp_context=mp_context) as pool:
+                futures = [pool.submit(_load_partitions, model_path, self.conn_args, partitions, gid)
+                           for partitions, gid in zip(assignments, gids)]
+                errors = []
+                loaded = 0
+                for future in futures:
+                    try:
+                        loaded += future.result()
+                    except Exception as e:
+                        errors.append(e)
+        finally:
+            _forked_models.pop(model_path, None)
+
+        self._finish_prepared(conn, gids, commit=len(errors) == 0)
+        if len(errors) > 0:
+            raise Exception(f"{len(errors)} of {len(assignments)} loaders failed: {errors[0]}")
+        return loaded
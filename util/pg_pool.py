@@ -0,0 +1,138 @@
+import os
+import threading
+import contextlib
+import psycopg2
+import psycopg2.extensions
+from psycopg2.pool import PoolError
+
+
+class ConnectionManager:
+    '''
+    同一个Postgresql服务器上各数据库的连接池, 归还的连接保持打开, 下次直接复用, 查询计时中不再包含建立连接和认证的时间.
+
+    已经存在的数据库会被记录下来, 之后获取连接时不再尝试CREATE DATABASE.
+    每个数据库最多maxconn个连接, 连接池是线程安全的, 可供并发负载测试的多个客户端线程共享.
+    '''
+    def __init__(self, user, password, host, port, maxconn=32):
+        self._conn_args = {"user": user, "password": password, "host": host, "port": port}
+        self.maxconn = maxconn
+        self._idle = {}  # 数据库名 -> 空闲连接列表
+        self._sizes = {}  # 数据库名 -> 已打开的连接数(空闲的和已取出的)
+        self._databases = set()  # 已知存在的数据库
+        self._borrowed = {}  # id(已取出的连接) -> 数据库名
+        self._lock = threading.Lock()
+
+    def create_database(self, database_name):
+        '''
+        数据库不存在时创建数据库.
+        '''
+        if database_name in self._databases:
+            return
+        with self.connection("postgres") as conn:
+            conn.autocommit = True
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"CREATE DATABASE {database_name}")
+            except psycopg2.errors.DuplicateDatabase:
+                pass
+            finally:
+                cursor.close()
+        self._databases.add(database_name)
+
+    def getconn(self, database_name, create=True):
+        '''
+        从连接池中取出一个连接, create为True时先确保数据库存在. 用完后通过putconn归还.
+        '''
+        if create:
+            self.create_database(database_name)
+        with self._lock:
+            idle = self._idle.setdefault(database_name, [])
+            if len(idle) > 0:
+                conn = idle.pop()
+                self._borrowed[id(conn)] = database_name
+                return conn
+            if self._sizes.get(database_name, 0) >= self.maxconn:
+                raise PoolError(f"connection pool of {database_name} exhausted")
+            self._sizes[database_name] = self._sizes.get(database_name, 0) + 1
+        try:
+            conn = psycopg2.connect(database=database_name, **self._conn_args)
+        except Exception:
+            with self._lock:
+                self._sizes[database_name] -= 1
+            raise
+        with self._lock:
+            self._borrowed[id(conn)] = database_name
+        return conn
+
+    def putconn(self, conn):
+        '''
+        归还连接: 回滚未提交的事务并恢复autocommit = False, 已断开的连接直接丢弃.
+        '''
+        close = conn.closed != 0
+        if not close:
+            try:
+                if conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+                conn.autocommit = False
+            except psycopg2.Error:
+                close = True
+        with self._lock:
+            database_name = self._borrowed.pop(id(conn), None)
+            if database_name not in self._idle:
+                # 连接池已被drop_database或closeall关闭
+                close = True
+            elif close:
+                self._sizes[database_name] -= 1
+            else:
+                self._idle[database_name].append(conn)
+        if close:
+            conn.close()
+
+    @contextlib.contextmanager
+    def connection(self, database_name, create=False):
+        conn = self.getconn(database_name, create)
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def drop_database(self, database_name):
+        '''
+        关闭该数据库的全部连接后删除数据库.
+        '''
+        with self._lock:
+            idle = self._idle.pop(database_name, [])
+            self._sizes.pop(database_name, None)
+        for conn in idle:
+            conn.close()
+        self._databases.discard(database_name)
+        with self.connection("postgres") as conn:
+            conn.autocommit = True
+            cursor = conn.cursor()
+            cursor.execute(f"DROP DATABASE IF EXISTS {database_name}")
+            cursor.close()
+
+    def closeall(self):
+        with self._lock:
+            idle, self._idle, self._sizes = self._idle, {}, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_connection_managers = {}  # (进程id, user, password, host, port) -> ConnectionManager
+_connection_managers_lock = threading.Lock()
+
+
+def get_connection_manager(user, password, host, port, maxconn=32):
+    '''
+    返回进程内共享的连接管理器. fork出的子进程不复用父进程的连接, 会创建自己的连接管理器.
+    连接参数相同的调用者共享同一个连接管理器, 其连接池大小取各调用者要求的最大值.
+    '''
+    key = (os.getpid(), user, password, host, str(port))
+    with _connection_managers_lock:
+        if key not in _connection_managers:
+            _connection_managers[key] = ConnectionManager(user, password, host, port, maxconn)
+        manager = _connection_managers[key]
+        manager.maxconn = max(manager.maxconn, maxconn)
+        return manager
@@ -0,0 +1,138 @@
+import os
+import re
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+# 只捕获只读查询的执行计划: EXPLAIN ANALYZE会真正执行语句, DML会被执行两次, DDL不能EXPLAIN
+_EXPLAINABLE = re.compile(r"^\s*(?:--[^\n]*\n\s*)*(SELECT|WITH|VALUES|TABLE)\b", re.IGNORECASE)
+
+# 计划根节点中的缓冲区计数(包含全部子节点) -> 记录中的字段名
+_BUFFER_KEYS = {
+    "Shared Hit Blocks": "shared_hit",
+    "Shared Read Blocks": "shared_read",
+    "Local Hit Blocks": "local_hit",
+    "Local Read Blocks": "local_read",
+}
+
+
+def get_plan_summary(plan):
+    '''
+    从EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)的结果中取出规划耗时、执行耗时(毫秒)和根节点的共享/本地缓冲区命中与读取块数.
+    '''
+    plan = plan[0]
+    summary = {"planning_ms": plan.get("Planning Time"), "execution_ms": plan.get("Execution Time")}
+    for key, name in _BUFFER_KEYS.items():
+        summary[name] = plan["Plan"].get(key, 0)
+    return summary
+
+
+class PlanCapture:
+    '''
+    执行计划捕获器: 对后端执行的只读查询执行EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON),
+    记录执行计划、规划与执行耗时以及缓冲区命中/读取块数, 便于比较不同测试之间的计划变化.
+
+    捕获到的计划按(后端, 阶段)和查询标签分组, 由BenchmarkRecorder写入测试结果.
+    只有在phase()之内才会捕获: BenchmarkRecorder在计时的执行结束后单独再执行一次阶段并在其中捕获,
+    因此EXPLAIN ANALYZE不计入任何耗时样本.
+    '''
+    def __init__(self):
+        self._reports = {}  # (后端, 阶段) -> {查询标签: {"samples": [...], "plan": 最近一次的计划}}
+        self._phase = (None, None)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, backend, phase):
+        previous, self._phase = self._phase, (backend, phase)
+        try:
+            yield
+        finally:
+            self._phase = previous
+
+    @property
+    def active(self):
+        '''
+        是否在phase()之内, explain和CapturingCursor只在此时捕获.
+        '''
+        return self._phase != (None, None)
+
+    def capture(self, cursor, statement, label=None):
+        '''
+        在cursor所在的连接上EXPLAIN ANALYZE一条语句, 不是只读查询时不捕获. 返回捕获到的摘要或None.
+        '''
+        if _EXPLAINABLE.match(statement) is None:
+            return None
+        if label is None:
+            label = " ".join(statement.split())[:80]
+        cursor.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        summary = get_plan_summary(plan)
+        with self._lock:
+            report = self._reports.setdefault(self._phase, {}).setdefault(label, {"samples": []})
+            report["samples"].append(summary)
+            report["plan"] = plan
+        return summary
+
+    def reports(self):
+        with self._lock:
+            return {key: dict(report) for key, report in self._reports.items()}
+
+    def dump(self, result_dir):
+        '''
+        将全部捕获结果写入result_dir下的plans_<时间>.json, 用于不经过BenchmarkRecorder的脚本. 返回文件路径.
+        '''
+        os.makedirs(result_dir, exist_ok=True)
+        result_path = os.path.join(result_dir, f"plans_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(result_path, "w") as f:
+            json.dump([{"backend": backend, "phase": phase, "plans": plans}
+                       for (backend, phase), plans in self.reports().items()], f, indent=2)
+        return result_path
+
+
+_active_capture = None
+
+
+def set_plan_capture(capture):
+    '''
+    设置进程内生效的捕获器, None表示关闭捕获.
+    '''
+    global _active_capture
+    _active_capture = capture
+
+
+def get_plan_capture():
+    return _active_capture
+
+
+def explain(cursor, statement, label=None):
+    '''
+    捕获器处于phase()之内时EXPLAIN ANALYZE一条语句, 否则什么也不做. 后端在执行查询之前调用.
+    '''
+    if _active_capture is not None and _active_capture.active:
+        _active_capture.capture(cursor, statement, label)
+
+
+_capturing_cursor = None
+
+
+def get_capturing_cursor():
+    '''
+    返回CapturingCursor游标类: 捕获器处于phase()之内时, 执行不带参数的查询之前先在同一个连接的另一个游标上EXPLAIN ANALYZE该查询,
+    用于直接调用cursor.execute的代码. 游标类在第一次调用时才定义, 导入本模块不需要安装psycopg2.
+    '''
+    global _capturing_cursor
+    if _capturing_cursor is None:
+        import psycopg2.extensions
+
+        class CapturingCursor(psycopg2.extensions.cursor):
+            def execute(self, query, vars=None):
+                if _active_capture is not None and _active_capture.active and vars is None:
+                    with self.connection.cursor(cursor_factory=psycopg2.extensions.cursor) as cursor:
+                        _active_capture.capture(cursor, query)
+                return super().execute(query, vars)
+
+        _capturing_cursor = CapturingCursor
+    return _capturing_cursor
@@ -4,11 +4,14 @@ import ifcopenshell
 import ifcopenshell.util.selector as selector
 import ifcopenshell.util.element
 from ifcopenshell.api import run
-from ifcopenshell import express
 
 from util.common import Timer
 from task3_cost_estimation.task3 import CostEstimator
 import util.common as util
+from util.pg_parallel_loader import ParallelLoader
+from util.pg_pool import get_connection_manager
+import util.pg_copy as pg_copy
+import schema.compile_schema as compile_schema
 
 class Postbim:
     def __init__(self, args):
@@ -18,8 +21,10 @@ class Postbim:
         self.__host = args["host"]
         self.__port = args["port"]
         
+        self.__connections = get_connection_manager(self.__user, self.__password, self.__host, self.__port)
         try:
-            self.__conn = psycopg2.connect(database=self.__database_name, user=self.__user, password=self.__password, host=self.__host, port=self.__port)
+            # 检查数据库能否连接
+            self.__connections.putconn(self.__connections.getconn(self.__database_name, create=False))
         except Exception as e:
             print(e)
             raise Exception("Failed to connect to database.")
@@ -45,7 +50,9 @@ class Postbim:
             attr_type = entity.attribute_type(i)
             
             if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
-                attr_type = "TEXT"
+                # NominalValue TEXT之后是被包装值的类型、数值和布尔值
+                create_table_sql += "".join(f"\"{column_name}\" {column_type}," for column_name, column_type in compile_schema.NOMINAL_VALUE_COLUMNS)
+                continue
             elif(attr_type in attr_type_map):
                 attr_type = attr_type_map[attr_type]
             elif attr_type == "DERIVED":
@@ -67,7 +74,9 @@ class Postbim:
             attr_value = attr_info[entity.attribute_name(i)]
             
             if entity.is_a("ifcpropertysinglevalue") and attr_name == "NominalValue":
-                insert_sql += f"'{str(attr_value.get_info()['wrappedValue']).replace("'", "''")}',"
+                # 依次写入NominalValue, NominalValueType, NominalValueNum, NominalValueBool
+                for value in pg_copy.get_nominal_values(attr_value):
+                    insert_sql += "NULL," if value is None else f"""'{str(value).replace("'", "''")}',"""
                 continue
                     
             if attr_type == "DERIVED":
@@ -101,7 +110,7 @@ class Postbim:
 
     def __createdb_for_model(self, user, password, host, port, model_name):
             """
-            创建数据库并返回连接对象。
+            创建数据库(已存在时跳过)并从连接池中取出一个连接, 用完后需要归还连接池。
 
             参数：
             user (str)：数据库用户名。
@@ -113,36 +122,31 @@ class Postbim:
             返回：
             conn (psycopg2.extensions.connection)：数据库连接对象。
             """
-            try:
-                conn = self.__conn
-                conn.autocommit = True
-                cur = conn.cursor()
-                cur.execute(f"CREATE DATABASE {model_name}")
-            except psycopg2.errors.DuplicateDatabase:
-                pass
-            except Exception as e:
-                raise e
-            finally:
-                conn.close()
-                cur.close()
-            conn = psycopg2.connect(database=model_name, user=user, password=password, host=host, port=port)
-            return conn
+            return self.__connections.getconn(model_name)
         
-    def load_model(self, model_path, model_name):
+    def load_model(self, model_path, model_name, workers=1):
             """
             加载模型并将其转换为关系表存储在数据库中。
 
             Args:
                 model_path (str): 模型文件的路径。
                 model_name (str): 数据库模型的名称。
+                workers (int): 导入进程数, 不为1时使用ParallelLoader多进程并行导入(0表示CPU核数)。
             """
             entity_inited = set()  # 记录已经初始化的实体
+            conn = None
             try:
                 # 创建数据库并连接
                 conn = self.__createdb_for_model(self.__user, self.__password, self.__host, self.__port, model_name)
                 print(f"Connected to database {model_name}.")
                 print(f"Loading {model_path}...")
                 
+                if workers != 1:
+                    conn_args = {"database": model_name, "user": self.__user, "password": self.__password,
+                                 "host": self.__host, "port": self.__port}
+                    ParallelLoader(conn_args, workers).load(conn, model_path, entity_inited)
+                    return
+                
                 # 将模型转换为关系表
                 ifc_file = ifcopenshell.open(model_path)
                 for entity in ifc_file:
@@ -169,6 +173,11 @@ class Postbim:
                         
                 conn.commit()
                 cursor.close()
-                conn.close()
             except Exception as e:
+                if workers != 1:
+                    # 并行导入是原子的, 失败时没有导入任何数据, 异常直接抛给调用者
+                    raise
                 print(e)
+            finally:
+                if conn is not None:
+                    self.__connections.putconn(conn)
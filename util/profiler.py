@@ -0,0 +1,78 @@
+import os
+import io
+import pstats
+import cProfile
+import resource
+import tracemalloc
+from contextlib import contextmanager
+
+
+class PhaseProfiler:
+    '''
+    测试阶段性能剖析器, 使用cProfile记录函数耗时, 使用tracemalloc记录Python内存分配.
+
+    同一(后端, 阶段)的多次执行累积到同一个cProfile结果中, 剖析结束后在output_dir下为每个阶段生成:
+    1. <后端>_<阶段>.prof: 完整的cProfile结果, 可用pstats/snakeviz查看;
+    2. <后端>_<阶段>_hotspots.txt: 按累计耗时排序的前top_n个函数;
+    3. <后端>_<阶段>_memory.txt: Python内存峰值及阶段结束时占用内存最多的top_n个代码行.
+
+    注意tracemalloc只能追踪Python分配的内存, ifcopenshell等C++扩展分配的内存需要参考进程的最大RSS.
+    '''
+    def __init__(self, output_dir, top_n=20):
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self._profiles = {}  # (backend, phase) -> cProfile.Profile
+        self._reports = {}   # (backend, phase) -> dict
+
+    @contextmanager
+    def phase(self, backend, phase):
+        key = (backend, phase)
+        if key not in self._profiles:
+            self._profiles[key] = cProfile.Profile()
+            self._reports[key] = {"python_peak_bytes": 0}
+        profile = self._profiles[key]
+        report = self._reports[key]
+
+        tracemalloc.start()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            if peak >= report["python_peak_bytes"]:
+                report["python_peak_bytes"] = peak
+                report["top_allocations"] = [str(stat) for stat in snapshot.statistics("lineno")[:self.top_n]]
+            report["process_max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def dump(self):
+        '''
+        将所有阶段的剖析结果写入output_dir, 返回(后端, 阶段) -> 剖析摘要的字典.
+        '''
+        os.makedirs(self.output_dir, exist_ok=True)
+        for (backend, phase), profile in self._profiles.items():
+            report = self._reports[(backend, phase)]
+            file_prefix = os.path.join(self.output_dir, f"{backend}_{phase}".replace(".", "_"))
+
+            profile.dump_stats(file_prefix + ".prof")
+            stream = io.StringIO()
+            stats = pstats.Stats(profile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(self.top_n)
+            with open(file_prefix + "_hotspots.txt", "w") as f:
+                f.write(stream.getvalue())
+
+            with open(file_prefix + "_memory.txt", "w") as f:
+                f.write(f"Python peak memory: {report['python_peak_bytes']} bytes\n")
+                f.write(f"Process max RSS: {report['process_max_rss_kb']} KB\n")
+                f.write(f"Top {self.top_n} allocations at the end of the phase:\n")
+                for line in report.get("top_allocations", []):
+                    f.write(line + "\n")
+
+            report["prof_file"] = file_prefix + ".prof"
+            report["hotspots"] = []
+            for func, (_, ncalls, tottime, cumtime, _) in sorted(stats.stats.items(), key=lambda x: x[1][3], reverse=True)[:self.top_n]:
+                report["hotspots"].append({"function": pstats.func_std_string(func), "ncalls": ncalls,
+                                           "tottime": tottime, "cumtime": cumtime})
+        return self._reports
@@ -0,0 +1,345 @@
+import io
+import os
+import re
+import mmap
+import functools
+import psycopg2
+import ifcopenshell
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import util.pg_copy as pg_copy
+import schema.compile_schema as compile_schema
+
+# STEP(ISO-10303-21) DATA段中的词法单元, 空白和注释被跳过
+_TOKEN_PATTERN = re.compile(r"""\s*(?:
+    (?P<string>'(?:[^']|'')*')
+  | (?P<ref>\#\d+)
+  | (?P<enum>\.[A-Za-z0-9_]+\.)
+  | (?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<keyword>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<binary>"[0-9A-Fa-f]*")
+  | (?P<comment>/\*.*?\*/)
+  | (?P<punct>[()=,;$*])
+)""", re.VERBOSE | re.DOTALL)
+
+# STEP字符串中的控制指令: \X2\..\X0\(UTF-16), \X4\..\X0\(UTF-32), \X\hh(ISO 8859-1), \S\c, \P?\(代码页), \\(反斜杠)
+_STRING_ESCAPE_PATTERN = re.compile(r"\\X2\\((?:[0-9A-Fa-f]{4})*)\\X0\\|\\X4\\((?:[0-9A-Fa-f]{8})*)\\X0\\|\\X\\([0-9A-Fa-f]{2})|\\S\\(.)|\\P[A-I]\\|\\\\")
+
+# DATA段中的字符串、注释, 以及顶层的";"之后换行开始的下一个实体记录(#id=), 只有后者可以作为块的切分点
+_BOUNDARY_PATTERN = re.compile(rb"'(?:[^']|'')*'|/\*.*?\*/|;[ \t\r]*\n(?=#\d+[ \t]*=)", re.DOTALL)
+
+_DERIVED = object()  # 属性值'*'
+
+
+class _Ref(int):
+    '''
+    实体引用#id.
+    '''
+
+
+class _Enum(str):
+    '''
+    枚举值.NAME., 也用于表示布尔值.T./.F.和逻辑值.U..
+    '''
+
+
+def _replace_string_escape(match):
+    if match.group(1) is not None:
+        return bytes.fromhex(match.group(1)).decode("utf-16-be")
+    if match.group(2) is not None:
+        return bytes.fromhex(match.group(2)).decode("utf-32-be")
+    if match.group(3) is not None:
+        return chr(int(match.group(3), 16))
+    if match.group(4) is not None:
+        return chr(ord(match.group(4)) + 128)
+    if match.group(0) == "\\\\":
+        return "\\"
+    return ""
+
+
+def decode_string(raw):
+    '''
+    将STEP字符串字面量(不含两端的单引号)解码为Python字符串.
+    '''
+    value = raw.replace("''", "'")
+    if "\\" in value:
+        value = _STRING_ESCAPE_PATTERN.sub(_replace_string_escape, value)
+    return value
+
+
+def parse_records(text):
+    '''
+    解析DATA段中的一段文本, 依次返回(实体id, 实体类型, 参数列表).
+
+    参数值的表示: $ -> None, * -> _DERIVED, #id -> _Ref, .X. -> _Enum, 字符串 -> str, 数字 -> int/float,
+    聚合 -> list, 带类型的值(如IFCLABEL('a')) -> (类型名, 参数列表).
+    复合实体实例(#1=(IFCA()IFCB());)的实体类型为None.
+    text必须由完整的实体记录组成, 括号不匹配或末尾的记录不完整时抛出ValueError.
+    '''
+    record_id = None
+    record_type = None
+    keyword = None
+    stack = []  # 正在解析的嵌套列表, stack[0]为实体的参数列表
+    type_names = []  # 与stack对应, 带类型的值的类型名, 聚合为None
+    for match in _TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        token = match.group(kind)
+        if kind == "punct":
+            if token == "(":
+                if len(stack) == 0:
+                    record_type = keyword
+                    type_names.append(None)
+                else:
+                    type_names.append(keyword)
+                stack.append([])
+                keyword = None
+            elif token == ")":
+                if len(stack) == 0:
+                    raise ValueError(f"Unbalanced ')' at offset {match.start(kind)}")
+                value = stack.pop()
+                type_name = type_names.pop()
+                if len(stack) == 0:
+                    yield record_id, record_type, value
+                    record_id = record_type = None
+                else:
+                    stack[-1].append(value if type_name is None else (type_name, value))
+            elif token == "$":
+                _append(stack, None)
+            elif token == "*":
+                _append(stack, _DERIVED)
+        elif kind == "ref":
+            if len(stack) == 0:
+                record_id = int(token[1:])
+            else:
+                stack[-1].append(_Ref(token[1:]))
+        elif kind == "keyword":
+            keyword = token
+        elif kind == "string":
+            _append(stack, decode_string(token[1:-1]))
+        elif kind == "enum":
+            _append(stack, _Enum(token[1:-1]))
+        elif kind == "number":
+            _append(stack, float(token) if "." in token or "e" in token or "E" in token else int(token))
+        elif kind == "binary":
+            _append(stack, token[1:-1])
+    if len(stack) > 0 or record_id is not None:
+        raise ValueError(f"Incomplete record #{record_id} at the end of the text")
+
+
+def _append(stack, value):
+    if len(stack) > 0:
+        stack[-1].append(value)
+
+
+def _to_ref(value):
+    # 选择类型中带类型的值(如IFCLABEL('a'))没有实体id, 与ifcopenshell的entity.id()一致记为0
+    return int(value) if isinstance(value, _Ref) else 0
+
+
+def _to_refs(value):
+    return [_to_ref(x) for x in value]
+
+
+def _to_logical(value):
+    return {"T": "True", "F": "False", "U": "UNKNOWN"}.get(value, str(value))
+
+
+def _to_bool(value):
+    return value == "T"
+
+
+def _to_wrapped_str(value):
+    '''
+    IfcPropertySingleValue.NominalValue: 取带类型的值中被包装的值并转换为字符串, 与str(wrappedValue)一致.
+    '''
+    if not isinstance(value, tuple):
+        return str(value)
+    wrapped = value[1][0] if len(value[1]) > 0 else None
+    if isinstance(wrapped, _Enum):
+        return _to_logical(wrapped)
+    if isinstance(wrapped, list):
+        return str(tuple(wrapped))
+    return str(wrapped)
+
+
+def _to_nominal_values(schema_version, value):
+    '''
+    IfcPropertySingleValue.NominalValue对应的各列的值, 与pg_copy.get_nominal_values一致.
+    '''
+    if not isinstance(value, tuple):
+        return [str(value), None, None, None]
+    wrapped = value[1][0] if len(value[1]) > 0 else None
+    type_name = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema_version).declaration_by_name(value[0]).name()
+    number = float(wrapped) if isinstance(wrapped, (int, float)) else None
+    flag = {"T": True, "F": False}.get(wrapped) if isinstance(wrapped, _Enum) else None
+    return [_to_wrapped_str(value), type_name, number, flag]
+
+
+_CONVERTERS = {
+    "INT": int,
+    "DOUBLE": float,
+    "BOOL": _to_bool,
+    "LOGICAL": _to_logical,
+    "STRING": str,
+    "ENUMERATION": str,
+    "ENTITY INSTANCE": _to_ref,
+    "AGGREGATE OF ENTITY INSTANCE": _to_refs,
+    "AGGREGATE OF DOUBLE": lambda value: [float(x) for x in value],
+    "AGGREGATE OF INT": lambda value: [int(x) for x in value],
+    "AGGREGATE OF STRING": lambda value: [str(x) for x in value],
+}
+
+_layouts = {}  # (schema, STEP实体类型) -> (表名, 列名, [(参数序号, 转换函数, 列数), ...]), 不支持的类型为None
+_schema_files = {}
+
+
+def _get_layout(schema_version, step_type):
+    '''
+    返回实体类型对应的表结构, 与PGTask3Impl/compile_schema中的表结构和类型转换规则一致.
+    '''
+    key = (schema_version, step_type)
+    if key not in _layouts:
+        if schema_version not in _schema_files:
+            _schema_files[schema_version] = ifcopenshell.file(schema=schema_version)
+        try:
+            entity = _schema_files[schema_version].create_entity(step_type)
+            compile_schema.get_create_table_sql(entity)
+        except Exception:
+            _layouts[key] = None
+            return None
+        converters = []
+        for i in range(len(entity)):
+            attr_type = entity.attribute_type(i)
+            if attr_type == "DERIVED":
+                continue
+            if entity.is_a("ifcpropertysinglevalue") and entity.attribute_name(i) == "NominalValue":
+                converters.append((i, functools.partial(_to_nominal_values, schema_version), len(compile_schema.NOMINAL_VALUE_COLUMNS)))
+            else:
+                converters.append((i, _CONVERTERS[attr_type], 1))
+        _layouts[key] = (entity.is_a(), pg_copy.get_entity_columns(entity), converters)
+    return _layouts[key]
+
+
+def parse_chunk(path, start, end, schema_version):
+    '''
+    解析文件中[start, end)字节范围内的实体, 返回({表名: (行数, COPY文本)}, {不支持的实体类型: 数量}).
+    '''
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+
+    tables = {}
+    skipped = {}
+    for record_id, record_type, args in parse_records(text):
+        layout = _get_layout(schema_version, record_type) if record_type is not None else None
+        if layout is None:
+            skipped[record_type] = skipped.get(record_type, 0) + 1
+            continue
+        table_name, _, converters = layout
+        row = [record_id]
+        for i, converter, width in converters:
+            value = args[i] if i < len(args) else None
+            if value is None or value is _DERIVED:
+                row.extend([None] * width)
+            elif width > 1:
+                row.extend(converter(value))
+            else:
+                row.append(converter(value))
+        tables.setdefault(table_name, []).append(pg_copy.format_copy_row(row))
+    return {table_name: (len(rows), "".join(rows)) for table_name, rows in tables.items()}, skipped
+
+
+def read_schema(path):
+    '''
+    读取文件头FILE_SCHEMA中的schema名称, 如IFC4.
+    '''
+    with open(path, "rb") as f:
+        header = f.read(64 * 1024).decode("latin-1")
+    match = re.search(r"FILE_SCHEMA\s*\(\s*\(\s*'([^']+)'", header, re.IGNORECASE)
+    if match is None:
+        raise ValueError(f"FILE_SCHEMA not found in {path}")
+    return match.group(1).upper()
+
+
+def split_data_section(path, chunk_size):
+    '''
+    将DATA段按约chunk_size字节切分, 返回[(start, end), ...]. 切分点都位于某个实体记录的开头:
+    字符串和注释之外的";"之后换行并紧跟"#id=", 跨行的实体记录中以"#"开头的续行不会被切开.
+    '''
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = data.find(b"\nDATA;")
+        if start < 0:
+            raise ValueError(f"DATA section not found in {path}")
+        start += len(b"\nDATA;")
+        end = data.find(b"\nENDSEC;", start)
+        end = end if end >= 0 else len(data)
+
+        chunks = []
+        for match in _BOUNDARY_PATTERN.finditer(data, start, end):
+            if match.group(0)[:1] == b";" and match.end() - start >= chunk_size:
+                chunks.append((start, match.end()))
+                start = match.end()
+        if start < end:
+            chunks.append((start, end))
+        return chunks
+
+
+class StepLoader:
+    '''
+    直接解析STEP文件并通过COPY导入实体表, 不创建ifcopenshell实体对象.
+
+    DATA段被切分为约chunk_size字节的块, 由workers个进程并行解析为COPY文本, 主进程依次写入数据库.
+    表结构和值的转换规则与PGTask3Impl的COPY导入相同, 尚未创建的实体表由主进程按需创建;
+    含有嵌套聚合等不支持的属性类型的实体, 以及复合实体实例会被跳过.
+    '''
+    def __init__(self, workers=0, chunk_size=4 * 1024 * 1024, primary_key=True, inheritance=False):
+        self.workers = workers if workers > 0 else os.cpu_count()
+        self.chunk_size = chunk_size
+        self.primary_key = primary_key
+        self.inheritance = inheritance  # 是否按继承关系建表, 见compile_schema.get_inherited_create_table_sqls
+
+    def load(self, conn, path, entity_inited=None):
+        '''
+        将path中的模型导入conn所连接的数据库, 返回模型中的实体类型集合. entity_inited为已经创建的实体表.
+        '''
+        entity_inited = entity_inited if entity_inited is not None else set()
+        schema_version = read_schema(path)
+        schema_file = ifcopenshell.file(schema=schema_version)
+        chunks = split_data_section(path, self.chunk_size)
+        entity_types = set()
+        skipped = {}
+
+        cursor = conn.cursor()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(parse_chunk, path, start, end, schema_version) for start, end in chunks}
+            for future in as_completed(futures):
+                tables, chunk_skipped = future.result()
+                futures.discard(future)
+                for record_type, count in chunk_skipped.items():
+                    skipped[record_type] = skipped.get(record_type, 0) + count
+                for table_name, (_, copy_text) in tables.items():
+                    entity_types.add(table_name)
+                    if table_name not in entity_inited:
+                        entity = schema_file.create_entity(table_name)
+                        for entity_type, create_table_sql in compile_schema.get_create_table_sqls(entity, self.primary_key, self.inheritance):
+                            if entity_type not in entity_inited:
+                                entity_inited.add(entity_type)
+                                cursor.execute(create_table_sql)
+                    column_names = _get_layout(schema_version, table_name)[1]
+                    columns = ",".join(f"\"{column_name}\"" for column_name in column_names)
+                    cursor.execute("SAVEPOINT copy_entities")
+                    try:
+                        cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN", io.StringIO(copy_text))
+                    except psycopg2.errors.UniqueViolation:
+                        # 数据库中已经导入过该模型
+                        cursor.execute("ROLLBACK TO SAVEPOINT copy_entities")
+                    cursor.execute("RELEASE SAVEPOINT copy_entities")
+        conn.commit()
+        cursor.close()
+        for record_type, count in skipped.items():
+            print(f"Skipped {count} unsupported {record_type} entities.")
+        return entity_types
@@ -0,0 +1,45 @@
+import unittest
+from util.benchmark import percentile, summarize, BenchmarkRecorder
+
+class BenchmarkTest(unittest.TestCase):
+    def test_percentile(self):
+        samples = [4.0, 1.0, 3.0, 2.0, 5.0]
+        self.assertEqual(percentile(samples, 0), 1.0)
+        self.assertEqual(percentile(samples, 50), 3.0)
+        self.assertEqual(percentile(samples, 100), 5.0)
+        self.assertAlmostEqual(percentile(samples, 95), 4.8)
+        self.assertAlmostEqual(percentile([1.0, 2.0], 50), 1.5)
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+
+    def test_summarize(self):
+        summary = summarize([1.0, 2.0, 3.0])
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["min"], 1.0)
+        self.assertEqual(summary["max"], 3.0)
+        self.assertAlmostEqual(summary["stddev"], 1.0)
+        self.assertEqual(summarize([1.0])["stddev"], 0.0)
+
+    def test_measure_skips_warmup(self):
+        recorder = BenchmarkRecorder()
+        calls = []
+        resets = []
+        result = recorder.measure("RAWFILE", "run", lambda: calls.append(1) or len(calls),
+                                  warmup=2, iterations=3, reset=lambda: resets.append(1))
+        self.assertEqual(result, 5)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(len(resets), 4)
+        self.assertEqual(len(recorder.get_samples("RAWFILE", "run")), 3)
+
+    def test_measure_breakdown(self):
+        recorder = BenchmarkRecorder()
+        timings = {}
+        def prepare():
+            timings["load"] = len(recorder.get_samples("POSTGRESQL", "prepare")) + 1.0
+            timings["index"] = 0.5
+        recorder.measure("POSTGRESQL", "prepare", prepare, warmup=1, iterations=2, breakdown=lambda: dict(timings))
+        self.assertEqual(recorder.get_samples("POSTGRESQL", "prepare.load"), [1.0, 2.0])
+        self.assertEqual(recorder.get_samples("POSTGRESQL", "prepare.index"), [0.5, 0.5])
+
+if __name__ == '__main__':
+    unittest.main()
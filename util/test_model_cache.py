@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import unittest
+import ifcopenshell
+from util.model_cache import ModelCache
+
+class ModelCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(2):
+            path = os.path.join(self.temp_dir, f"model{i}.ifc")
+            ifc_file = ifcopenshell.file(schema="IFC4")
+            ifc_file.create_entity("IfcProject", GlobalId=ifcopenshell.guid.new(), Name=f"Project {i}")
+            ifc_file.write(path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_reuse_parsed_model(self):
+        cache = ModelCache()
+        ifc_file = cache.open(self.paths[0])
+        self.assertIs(cache.open(self.paths[0]), ifc_file)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_reopen_modified_file(self):
+        cache = ModelCache()
+        ifc_file = cache.open(self.paths[0])
+        stat = os.stat(self.paths[0])
+        os.utime(self.paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNot(cache.open(self.paths[0]), ifc_file)
+        self.assertEqual(len(cache), 1)
+
+    def test_evict_least_recently_used(self):
+        cache = ModelCache(max_bytes=1)
+        cache.open(self.paths[0])
+        ifc_file = cache.open(self.paths[1])
+        self.assertEqual(len(cache), 1)
+        self.assertIs(cache.open(self.paths[1]), ifc_file)
+
+    def test_disabled(self):
+        cache = ModelCache(max_bytes=0)
+        self.assertIsNot(cache.open(self.paths[0]), cache.open(self.paths[0]))
+        self.assertEqual(len(cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+import ifcopenshell
+from util.pg_copy import format_copy_value, format_copy_row, CopyRowReader, get_entity_columns, get_entity_row
+
+class PGCopyTest(unittest.TestCase):
+    def test_format_scalar(self):
+        self.assertEqual(format_copy_value(None), "\\N")
+        self.assertEqual(format_copy_value(True), "t")
+        self.assertEqual(format_copy_value(12), "12")
+        self.assertEqual(format_copy_value(0.1), "0.1")
+        self.assertEqual(format_copy_value(float("inf")), "Infinity")
+        self.assertEqual(format_copy_value("a\tb\\c\nd"), "a\\tb\\\\c\\nd")
+
+    def test_format_array(self):
+        self.assertEqual(format_copy_value((1, 2, 3)), "{1,2,3}")
+        self.assertEqual(format_copy_value([]), "{}")
+        # 数组元素先按数组字面量转义, 再按COPY文本格式转义
+        self.assertEqual(format_copy_value(("a,b", 'say "hi"', None)), '{"a,b","say \\\\"hi\\\\"",NULL}')
+
+    def test_reader(self):
+        rows = [[1, "a"], [2, None]]
+        reader = CopyRowReader(format_copy_row(row) for row in rows)
+        data = reader.read(3) + reader.read(3) + reader.read()
+        self.assertEqual(data, "1\ta\n2\t\\N\n")
+        self.assertEqual(reader.read(10), "")
+
+    def test_nominal_value(self):
+        ifc_file = ifcopenshell.file(schema="IFC4")
+        area = ifc_file.create_entity("IfcPropertySingleValue", Name="Area", NominalValue=ifc_file.create_entity("IfcAreaMeasure", 12.5))
+        flag = ifc_file.create_entity("IfcPropertySingleValue", Name="IsExternal", NominalValue=ifc_file.create_entity("IfcBoolean", False))
+        empty = ifc_file.create_entity("IfcPropertySingleValue", Name="Empty")
+        self.assertEqual(get_entity_columns(area), ["id", "Name", "Description", "NominalValue", "NominalValueType",
+                                                    "NominalValueNum", "NominalValueBool", "Unit"])
+        self.assertEqual(get_entity_row(area)[3:7], ["12.5", "IfcAreaMeasure", 12.5, None])
+        self.assertEqual(get_entity_row(flag)[3:7], ["False", "IfcBoolean", None, False])
+        self.assertEqual(get_entity_row(empty)[3:7], [None, None, None, None])
+
+if __name__ == '__main__':
+    unittest.main()
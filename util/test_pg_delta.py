@@ -0,0 +1,57 @@
+import os
+import shutil
+import tempfile
+import unittest
+import ifcopenshell
+from util.pg_delta import DeltaImporter, get_entity_keys
+from task3_cost_estimation.test_workload_generator import create_seed_model
+
+class DeltaImporterTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_path = os.path.join(self.temp_dir, "seed.ifc")
+        create_seed_model(self.model_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _get_stored(self, importer, ifc_file):
+        # 数据库为空时所有实体都是新增的, 模型中的id从1开始连续编号, 因此分配的id与文件中的id相同
+        stored = {}
+        for entity_id, entity_type, entity_key, row_hash in importer.diff({}, ifc_file)["keys"]:
+            stored.setdefault(entity_key, []).append((entity_id, entity_type, row_hash))
+        return stored
+
+    def test_entity_keys(self):
+        ifc_file = ifcopenshell.open(self.model_path)
+        keys = get_entity_keys(ifc_file)
+        self.assertEqual(keys, get_entity_keys(ifcopenshell.open(self.model_path)))
+        for wall in ifc_file.by_type("IfcWall"):
+            self.assertEqual(keys[wall.id()], "g:" + wall.GlobalId)
+        # 值相同的属性(如两层楼中的IsExternal=False)结构哈希相同
+        values = [x for x in ifc_file.by_type("IfcPropertySingleValue") if x.Name == "IsExternal" and not x.NominalValue.wrappedValue]
+        self.assertEqual(len({keys[x.id()] for x in values}), 1)
+
+    def test_diff(self):
+        importer = DeltaImporter()
+        stored = self._get_stored(importer, ifcopenshell.open(self.model_path))
+        total = sum(len(entries) for entries in stored.values())
+        self.assertEqual(importer.diff(stored, ifcopenshell.open(self.model_path))["unchanged"], total)
+
+        ifc_file = ifcopenshell.open(self.model_path)
+        wall = ifc_file.by_type("IfcWall")[0]
+        wall.Name = "Renamed"
+        roof = ifc_file.by_type("IfcRoof")[0]
+        roof_id = roof.id()
+        ifc_file.remove(roof)
+        delta = importer.diff(stored, ifc_file)
+
+        self.assertEqual([row[0] for row in delta["upserts"]["IfcWall"]], [wall.id()])
+        self.assertEqual(delta["upserts"]["IfcWall"][0][3], "Renamed")
+        self.assertEqual(delta["deletes"], {"IfcRoof": [roof_id]})
+        # 删除屋顶后引用它的空间结构关系和属性关系被更新
+        self.assertIn("IfcRelContainedInSpatialStructure", delta["upserts"])
+        self.assertEqual(delta["unchanged"] + len(delta["keys"]), total - 1)
+
+if __name__ == '__main__':
+    unittest.main()
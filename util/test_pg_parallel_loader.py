@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import ifcopenshell
+import psycopg2
+from util.pg_parallel_loader import ParallelLoader
+from task3_cost_estimation.test_workload_generator import create_seed_model
+
+class ParallelLoaderTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_path = os.path.join(self.temp_dir, "seed.ifc")
+        create_seed_model(self.model_path)
+        self.ifc_file = ifcopenshell.open(self.model_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_partitions_cover_model(self):
+        loader = ParallelLoader({}, workers=3)
+        partitions = loader._get_partitions(self.ifc_file)
+        entity_ids = [entity_id for _, ids in partitions for entity_id in ids]
+        self.assertEqual(sorted(entity_ids), sorted(entity.id() for entity in self.ifc_file))
+        partition_size = -(-len(entity_ids) // (3 * loader.partitions_per_worker))
+        for entity_type, ids in partitions:
+            self.assertLessEqual(len(ids), partition_size)
+            self.assertTrue(all(self.ifc_file.by_id(entity_id).is_a() == entity_type for entity_id in ids))
+
+    def test_assign_partitions(self):
+        loader = ParallelLoader({}, workers=3)
+        partitions = loader._get_partitions(self.ifc_file)
+        assignments = loader._assign_partitions(partitions)
+        self.assertEqual(len(assignments), 3)
+        self.assertEqual(sum(len(x) for x in assignments), len(partitions))
+        loads = [sum(len(ids) for _, ids in assignment) for assignment in assignments]
+        self.assertLessEqual(max(loads) - min(loads), max(len(ids) for _, ids in partitions))
+        self.assertEqual(len(ParallelLoader({}, workers=8)._assign_partitions(partitions[:2])), 2)
+
+    def test_workers_limited_by_prepared_transactions(self):
+        # 每个进程占用一个预备事务, 不允许预备事务时不能退回到非原子的提交
+        loader = ParallelLoader({}, workers=4)
+        self.assertEqual(loader._get_workers(20), 4)
+        self.assertEqual(loader._get_workers(2), 2)
+        self.assertEqual(len(loader._assign_partitions(loader._get_partitions(self.ifc_file), 2)), 2)
+        with self.assertRaises(RuntimeError):
+            loader._get_workers(0)
+
+# 连接参数取自libpq的环境变量, 连接不上或不允许预备事务时跳过测试
+PG_ARGS = {"host": os.environ.get("PGHOST", "localhost"), "port": os.environ.get("PGPORT", "5432"),
+           "user": os.environ.get("PGUSER", "postgres"), "password": os.environ.get("PGPASSWORD", "")}
+
+def _get_max_prepared_transactions():
+    try:
+        conn = psycopg2.connect(database="postgres", connect_timeout=3, **PG_ARGS)
+    except psycopg2.Error:
+        return 0
+    cursor = conn.cursor()
+    cursor.execute("SHOW max_prepared_transactions")
+    max_prepared_transactions = int(cursor.fetchone()[0])
+    conn.close()
+    return max_prepared_transactions
+
+@unittest.skipUnless(_get_max_prepared_transactions() >= 2, "PostgreSQL with max_prepared_transactions >= 2 is not available")
+class ParallelLoadTest(unittest.TestCase):
+    database = "vulcandb_test_parallel_load"
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_path = os.path.join(self.temp_dir, "seed.ifc")
+        self.ifc_file = create_seed_model(self.model_path)
+        self.admin = psycopg2.connect(database="postgres", **PG_ARGS)
+        self.admin.autocommit = True
+        self.admin.cursor().execute(f"DROP DATABASE IF EXISTS {self.database}")
+        self.admin.cursor().execute(f"CREATE DATABASE {self.database}")
+        self.conn = psycopg2.connect(database=self.database, **PG_ARGS)
+
+    def tearDown(self):
+        self.conn.close()
+        self.admin.cursor().execute(f"DROP DATABASE IF EXISTS {self.database}")
+        self.admin.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_workers_reuse_parsed_model(self):
+        # 导入进程继承主进程中已解析的模型, 任何进程重新解析模型都会导致导入失败
+        with mock.patch("util.pg_parallel_loader.ifcopenshell.open", side_effect=AssertionError("model parsed again")), \
+             mock.patch("util.pg_parallel_loader.open_model", side_effect=AssertionError("model parsed again")):
+            loaded = ParallelLoader(dict(PG_ARGS, database=self.database), workers=2).load(self.conn, self.model_path, ifc_file=self.ifc_file)
+        self.assertEqual(loaded, len(list(self.ifc_file)))
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM ifcwall")
+        self.assertEqual(cursor.fetchone()[0], len(self.ifc_file.by_type("IfcWall", include_subtypes=False)))
+
+if __name__ == '__main__':
+    unittest.main()
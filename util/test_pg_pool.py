@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+import psycopg2.extensions
+from psycopg2.pool import PoolError
+from util.pg_pool import ConnectionManager, get_connection_manager
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql):
+        self.conn.executed.append(sql)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    '''
+    记录执行过的语句的连接, 代替psycopg2.connect返回的连接, 测试不需要Postgresql服务器.
+    '''
+    def __init__(self, database):
+        self.database = database
+        self.closed = 0
+        self.autocommit = False
+        self.executed = []
+        self.info = mock.Mock(transaction_status=psycopg2.extensions.TRANSACTION_STATUS_IDLE)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class ConnectionManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.opened = []
+        def connect(database, **kwargs):
+            self.opened.append(FakeConnection(database))
+            return self.opened[-1]
+        patcher = mock.patch("util.pg_pool.psycopg2.connect", side_effect=connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = ConnectionManager("postgres", "", "localhost", 5432, maxconn=2)
+
+    def _opened(self, database):
+        return [conn for conn in self.opened if conn.database == database]
+
+    def test_putconn_reuses_connection(self):
+        conn = self.manager.getconn("workload1")
+        self.assertEqual(self._opened("postgres")[0].executed, ["CREATE DATABASE workload1"])
+        conn.autocommit = True
+        conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+        self.manager.putconn(conn)
+        # 归还时回滚未提交的事务并恢复autocommit, 再次取出时复用同一个连接, 不再创建数据库
+        self.assertIs(self.manager.getconn("workload1"), conn)
+        self.assertFalse(conn.autocommit)
+        self.assertEqual(conn.info.transaction_status, psycopg2.extensions.TRANSACTION_STATUS_IDLE)
+        self.assertEqual(len(self._opened("workload1")), 1)
+        self.assertEqual(len(self._opened("postgres")[0].executed), 1)
+
+    def test_exhaustion_limit(self):
+        conns = [self.manager.getconn("workload1") for _ in range(2)]
+        with self.assertRaises(PoolError):
+            self.manager.getconn("workload1")
+        # 已断开的连接被丢弃, 腾出的位置可以打开新连接
+        conns[0].closed = 1
+        self.manager.putconn(conns[0])
+        self.assertIsNot(self.manager.getconn("workload1"), conns[0])
+        self.assertEqual(len(self._opened("workload1")), 3)
+        with self.assertRaises(PoolError):
+            self.manager.getconn("workload1")
+
+    def test_putconn_after_drop_database(self):
+        borrowed = self.manager.getconn("workload1")
+        idle = self.manager.getconn("workload1")
+        self.manager.putconn(idle)
+        self.manager.drop_database("workload1")
+        self.assertEqual(idle.closed, 1)
+        self.assertIn("DROP DATABASE IF EXISTS workload1", self._opened("postgres")[0].executed)
+        # 删除数据库前取出的连接在归还时关闭, 不会回到连接池
+        self.manager.putconn(borrowed)
+        self.assertEqual(borrowed.closed, 1)
+        conn = self.manager.getconn("workload1")
+        self.assertNotIn(conn, (borrowed, idle))
+        self.assertEqual(self._opened("postgres")[0].executed[-1], "CREATE DATABASE workload1")
+
+    def test_connection_returns_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.manager.connection("workload1", create=True) as conn:
+                raise RuntimeError("load failed")
+        self.assertIs(self.manager.getconn("workload1"), conn)
+
+    def test_shared_manager_grows_to_largest_pool(self):
+        # 先以默认大小创建连接管理器的调用者不能使后来者配置的pool_size失效
+        small = get_connection_manager("vulcandb_test", "", "localhost", 5432, maxconn=2)
+        large = get_connection_manager("vulcandb_test", "", "localhost", "5432", maxconn=64)
+        self.assertIs(small, large)
+        self.assertEqual(large.maxconn, 64)
+        self.assertEqual(get_connection_manager("vulcandb_test", "", "localhost", 5432, maxconn=8).maxconn, 64)
+        self.assertIsNot(get_connection_manager("vulcandb_test", "other", "localhost", 5432), large)
+
+if __name__ == '__main__':
+    unittest.main()
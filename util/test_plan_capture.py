@@ -0,0 +1,53 @@
+import unittest
+from util.plan_capture import PlanCapture, get_plan_summary, explain, set_plan_capture
+from util.benchmark import BenchmarkRecorder
+
+# EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)的返回值
+PLAN = [{"Plan": {"Node Type": "Aggregate", "Shared Hit Blocks": 12, "Shared Read Blocks": 3},
+         "Planning Time": 0.1, "Execution Time": 2.5}]
+
+class FakeCursor:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def fetchone(self):
+        return (PLAN,)
+
+class PlanCaptureTest(unittest.TestCase):
+    def test_plan_summary(self):
+        self.assertEqual(get_plan_summary(PLAN), {"planning_ms": 0.1, "execution_ms": 2.5, "shared_hit": 12,
+                                                  "shared_read": 3, "local_hit": 0, "local_read": 0})
+
+    def test_capture_only_queries(self):
+        capture = PlanCapture()
+        cursor = FakeCursor()
+        self.assertIsNone(capture.capture(cursor, "CREATE OR REPLACE FUNCTION f() RETURNS INTEGER AS $$ SELECT 1 $$ LANGUAGE sql"))
+        self.assertIsNone(capture.capture(cursor, "INSERT INTO t VALUES (1)"))
+        self.assertEqual(cursor.statements, [])
+        self.assertIsNotNone(capture.capture(cursor, "-- Job2\nSELECT SUM(x) FROM t", "slab_area"))
+        self.assertEqual(cursor.statements, ["EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) -- Job2\nSELECT SUM(x) FROM t"])
+
+    def test_recorder_captures_after_timed_runs(self):
+        capture = PlanCapture()
+        set_plan_capture(capture)
+        self.addCleanup(set_plan_capture, None)
+        recorder = BenchmarkRecorder(plan_capture=capture)
+        cursor = FakeCursor()
+        recorder.measure("POSTGRESQL", "task3.prepare_data", explain, cursor, "SELECT 1", "q", warmup=1, iterations=2)
+        self.assertEqual(cursor.statements, [])
+        recorder.measure("POSTGRESQL", "task3.run", explain, cursor, "SELECT 1", "q", warmup=1, iterations=2, capture_plans=True)
+        # 预热和计时的执行都不捕获, 只在计时结束后单独执行的一次中捕获
+        self.assertEqual(cursor.statements, ["EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT 1"])
+        self.assertFalse(capture.active)
+        recorder.dump_profiles()
+        results = {result["phase"]: result for result in recorder.results()}
+        self.assertEqual(len(results["task3.run"]["samples"]), 2)
+        self.assertEqual(len(results["task3.run"]["plans"]["q"]["samples"]), 1)
+        self.assertEqual(results["task3.run"]["plans"]["q"]["plan"], PLAN)
+        self.assertNotIn("plans", results["task3.prepare_data"])
+
+if __name__ == '__main__':
+    unittest.main()
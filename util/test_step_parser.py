@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+import unittest
+import ifcopenshell
+import util.pg_copy as pg_copy
+from util.step_parser import decode_string, parse_records, parse_chunk, read_schema, split_data_section
+from task3_cost_estimation.test_workload_generator import create_seed_model
+
+class StepParserTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_path = os.path.join(self.temp_dir, "seed.ifc")
+        create_seed_model(self.model_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_decode_string(self):
+        self.assertEqual(decode_string("it''s"), "it's")
+        self.assertEqual(decode_string("\\X2\\5899\\X0\\A"), "墙A")
+        self.assertEqual(decode_string("\\X\\E9"), "é")
+        self.assertEqual(decode_string("a\\\\b"), "a\\b")
+
+    def test_parse_records(self):
+        text = "#1=IFCWALL('a',$,*,(#2,#3),.T.,IFCLABEL('x'),-1.5E2);\n#4=(IFCA()IFCB());"
+        records = list(parse_records(text))
+        self.assertEqual(records[0][:2], (1, "IFCWALL"))
+        self.assertEqual(records[0][2][0], "a")
+        self.assertIsNone(records[0][2][1])
+        self.assertEqual(records[0][2][3], [2, 3])
+        self.assertEqual(records[0][2][4], "T")
+        self.assertEqual(records[0][2][5], ("IFCLABEL", ["x"]))
+        self.assertEqual(records[0][2][6], -150.0)
+        self.assertEqual(records[1][:2], (4, None))
+
+    def test_parse_records_rejects_partial_records(self):
+        with self.assertRaises(ValueError):
+            list(parse_records("#5,#6),#1);"))
+        with self.assertRaises(ValueError):
+            list(parse_records("#1=IFCWALL('a',(#2,\n"))
+
+    def test_split_wrapped_records(self):
+        # 跨行的实体记录中有以"#"开头的续行, 字符串中也有类似实体记录开头的内容
+        path = os.path.join(self.temp_dir, "wrapped.ifc")
+        with open(path, "w") as f:
+            f.write("ISO-10303-21;\nHEADER;\nFILE_SCHEMA(('IFC4'));\nENDSEC;\nDATA;\n"
+                    "#1=IFCCARTESIANPOINT((0.,0.,0.));\n"
+                    "#2=IFCRELAGGREGATES('g',$,'a;\n#9=b',$,#1,(\n#5,#6),\n#1);\n"
+                    "#3=IFCRELNESTS('h',$,$,$,#1,(#5,\n#6,#7));#4=IFCCARTESIANPOINT((1.,0.,0.));\n"
+                    "#5=IFCCARTESIANPOINT((2.,0.,0.));\n"
+                    "ENDSEC;\nEND-ISO-10303-21;\n")
+        chunks = split_data_section(path, 1)
+        with open(path, "rb") as f:
+            data = f.read()
+        records = []
+        for start, end in chunks:
+            self.assertTrue(data[start:end].lstrip().startswith(b"#"))
+            records.extend(parse_records(data[start:end].decode("latin-1")))
+        self.assertEqual([record_id for record_id, _, _ in records], [1, 2, 3, 4, 5])
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(records[1][2][2], "a;\n#9=b")
+        self.assertEqual(records[1][2][5], [5, 6])
+
+    def test_chunks_match_ifcopenshell(self):
+        ifc_file = ifcopenshell.open(self.model_path)
+        schema_version = read_schema(self.model_path)
+        self.assertEqual(schema_version, ifc_file.schema)
+        # 块很小时每个块只包含少量实体, 所有块合起来应当覆盖全部实体
+        rows = {}
+        for start, end in split_data_section(self.model_path, 256):
+            tables, skipped = parse_chunk(self.model_path, start, end, schema_version)
+            self.assertEqual(skipped, {})
+            for table_name, (_, copy_text) in tables.items():
+                rows.setdefault(table_name, []).extend(copy_text.splitlines(keepends=True))
+
+        expected = {}
+        for entity in ifc_file:
+            expected.setdefault(entity.is_a(), []).append(pg_copy.format_copy_row(pg_copy.get_entity_row(entity)))
+        self.assertEqual({k: sorted(v) for k, v in rows.items()}, {k: sorted(v) for k, v in expected.items()})
+
+if __name__ == '__main__':
+    unittest.main()